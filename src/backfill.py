@@ -0,0 +1,141 @@
+import os
+import sys
+import time
+import hashlib
+import logging
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+from config.db_config import SEASON
+from config.fbref_config import FBREF_URLS, BACKFILL_MAX_WORKERS, BACKFILL_STATE, PIPELINE_ROOT, STORAGE_FORMAT
+from fbref.cleaning_specs import LEAGUES
+from fbref.manifest import StageManifest
+from fbref.seasons import league_urls, parse_seasons, partition_dir, player_stats_urls
+from fbref.storage import FORMATS, TableStorage
+
+# Crawl past seasons into <root>/data/fbref_data/<League>/<season>/ and fbref_players_data/<League>/<season>/.
+# Usage (from src/): python -m backfill --seasons 2017-2018:2023-2024 [--leagues Serie_A] [--workers 4]
+# then: python pipeline.py --checkpoint --seasons 2017-2018:2023-2024 --stages clean regroup transform load
+
+class Backfill:
+    """Scrapes every (league, season) of a range on a thread pool sharing one rate-limited FetchEngine.
+
+    The engine's per-host token bucket is shared by every crawl, so more workers overlap parsing and
+    saving but never exceed the politeness delay. A StageManifest at state_path records each finished
+    crawl and the tables it saved; a rerun skips them and retries the ones that failed.
+    """
+
+    def __init__(self, root=PIPELINE_ROOT, engine=None, storage=None, max_workers=BACKFILL_MAX_WORKERS,
+                 state_path=BACKFILL_STATE, restart=False):
+        self.raw_folder = os.path.join(root, 'data', 'fbref_data')
+        self.players_folder = os.path.join(root, 'data', 'fbref_players_data')
+        self.engine = engine  # Shared FetchEngine, created with the HTTP cache on the first run when None
+        self.storage = storage or TableStorage()
+        self.max_workers = max_workers
+        self.state = StageManifest(state_path, force=restart)  # restart crawls every season again
+
+    def urls(self, league, season):
+        """Every page a (league, season) crawl fetches: the league page, then the player stat pages."""
+        return [league_urls(season, [league])[league]] + player_stats_urls(season, [league])[league]
+
+    def fingerprint(self, league, season):
+        return hashlib.sha256('\n'.join(self.urls(league, season)).encode('utf-8')).hexdigest()
+
+    def saved_tables(self, league, season):
+        """Paths of the raw tables a crawl left in its season partitions."""
+        paths = []
+        for folder in (self.raw_folder, self.players_folder):
+            league_dir = partition_dir(folder, league, season)
+            if os.path.isdir(league_dir):
+                paths += [os.path.join(league_dir, name) for name in self.storage.list_tables(league_dir)]
+        return paths
+
+    def crawl(self, league, season):
+        """Scrape one league's squad and player tables for a season into its partitions."""
+        from fbref.scraper_fbref import FBRefScraper  # The HTTP stack is only needed when the backfill crawls
+        from fbref.transformer_fbref import FBRefTransformer
+        from fbref.fbref_players_scraper import FBRefPlayerScraper
+
+        data = FBRefScraper(engine=self.engine).scrape_all(league_urls(season, [league]))
+        FBRefTransformer(data, self.storage, base_path=self.raw_folder, season=season).save_dataframes()
+        FBRefPlayerScraper(save_path=self.players_folder, engine=self.engine, storage=self.storage,
+                           season=season).scrape_leagues(player_stats_urls(season, [league]))
+
+    def run_task(self, league, season):
+        """Crawl one (league, season) unless the state says it is done; report the outcome instead of raising."""
+        start = time.perf_counter()
+        result = {'league': league, 'season': season, 'status': 'crawled', 'tables': 0, 'error': None}
+        fingerprint = self.fingerprint(league, season)
+        entry = self.state.fresh('backfill', league, season, fingerprint, self.storage)
+        if entry:
+            result.update(status='done', tables=entry['rows'], seconds=0.0)
+            return result
+
+        try:
+            self.crawl(league, season)
+            tables = self.saved_tables(league, season)
+            if not tables:
+                raise ValueError(f"No tables saved for {league} {season}")
+            result['tables'] = len(tables)
+            self.state.record('backfill', league, season, fingerprint, tables, len(tables))
+        except Exception as e:
+            result['status'] = 'failed'
+            result['error'] = f"{type(e).__name__}: {e}"
+            self.state.forget('backfill', league, season)
+        self.state.save()  # Saved after every crawl, so an interrupted backfill resumes where it stopped
+        result['seconds'] = time.perf_counter() - start
+        logging.info(f"{league} {season}: {result['status']}, {result['tables']} tables in {result['seconds']:.1f}s")
+        return result
+
+    def run(self, seasons, leagues=LEAGUES):
+        """Crawl every (league, season), newest season first, and return the per-task results."""
+        if self.engine is None:
+            from fbref.fetch_engine import FetchEngine
+            from fbref.http_cache import ResponseCache
+            self.engine = FetchEngine(cache=ResponseCache())
+
+        tasks = [(league, season) for season in sorted(seasons, reverse=True) for league in leagues]
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            results = list(executor.map(lambda task: self.run_task(*task), tasks))
+        elapsed = time.perf_counter() - start
+
+        counts = {status: sum(1 for r in results if r['status'] == status) for status in ('crawled', 'done', 'failed')}
+        logging.info(f"Backfilled {counts['crawled']}/{len(results)} league seasons ({counts['done']} already done, "
+                     f"{counts['failed']} failed) in {elapsed:.1f}s with {self.max_workers} workers, "
+                     f"{self.engine.bytes_downloaded} bytes downloaded")
+        for r in results:
+            if r['status'] == 'failed':
+                logging.warning(f"{r['league']} {r['season']}: {r['error']}")
+        return results
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Crawl past FBref seasons into season-partitioned raw tables")
+    parser.add_argument('--seasons', nargs='+', required=True,
+                        help=f"Seasons or FIRST:LAST ranges, e.g. 2017-2018:2023-2024 {SEASON}")
+    parser.add_argument('--leagues', nargs='+', choices=list(FBREF_URLS), default=LEAGUES)
+    parser.add_argument('--workers', type=int, default=BACKFILL_MAX_WORKERS, help="League seasons crawled at once")
+    parser.add_argument('--root', default=PIPELINE_ROOT, help="Folder holding data/")
+    parser.add_argument('--format', choices=list(FORMATS), default=STORAGE_FORMAT, help="Raw table file format")
+    parser.add_argument('--state', default=BACKFILL_STATE, help="Resume state of finished league seasons")
+    parser.add_argument('--restart', action='store_true', help="Crawl every league season again, ignoring the state")
+    parser.add_argument('--offline', action='store_true', help="Only replay pages already in the HTTP cache")
+    args = parser.parse_args(argv)
+    try:
+        seasons = parse_seasons(args.seasons)
+    except ValueError as e:
+        parser.error(str(e))
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    from fbref.fetch_engine import FetchEngine
+    from fbref.http_cache import ResponseCache
+
+    engine = FetchEngine(cache=ResponseCache(offline=args.offline))
+    backfill = Backfill(args.root, engine, TableStorage(args.format), args.workers, args.state, args.restart)
+    results = backfill.run(seasons, args.leagues)
+    print(f"Run the pipeline over the backfilled partitions with: python pipeline.py --checkpoint --format {args.format} "
+          f"--seasons {' '.join(seasons)} --stages clean regroup transform load")
+    if any(r['status'] == 'failed' for r in results):
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,67 @@
+import os
+import sys
+import json
+import gzip
+import argparse
+from config.fbref_config import FBREF_URLS, FBREF_PLAYERS_STATS_URLS
+
+# Record the FBref pages the offline benchmarks parse: one league page (the 11 squad tables)
+# plus the 11 player-stat pages of the same league, gzipped next to an index.json.
+# Usage (from src/): python -m benchmarks.fixtures record [--league Premier_League] [--offline]
+
+FIXTURES_DIR = os.path.join(os.path.dirname(__file__), 'fixtures')
+FIXTURE_LEAGUE = 'Premier_League'
+
+def fixture_pages(league=FIXTURE_LEAGUE):
+    """(fixture name, url, kind) of every page recorded for a league."""
+    pages = [(f"{league}_league", FBREF_URLS[league], 'league')]
+    for url in FBREF_PLAYERS_STATS_URLS[league]:
+        pages.append((f"{league}_players_{url.split('/')[-2]}", url, 'players'))
+    return pages
+
+def fixture_path(name, fixtures_dir=FIXTURES_DIR):
+    return os.path.join(fixtures_dir, f"{name}.html.gz")
+
+def load_index(fixtures_dir=FIXTURES_DIR):
+    """{fixture name: {'url', 'kind', 'league'}} of the recorded fixtures; empty when none were recorded."""
+    index_path = os.path.join(fixtures_dir, 'index.json')
+    if not os.path.exists(index_path):
+        return {}
+    with open(index_path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+def read_fixture(name, fixtures_dir=FIXTURES_DIR):
+    with gzip.open(fixture_path(name, fixtures_dir), 'rt', encoding='utf-8') as f:
+        return f.read()
+
+def record(league=FIXTURE_LEAGUE, fixtures_dir=FIXTURES_DIR, offline=False):
+    """Fetch (or replay from the HTTP cache) every fixture page of a league and save it."""
+    from fbref.fetch_engine import FetchEngine
+    from fbref.http_cache import ResponseCache
+
+    engine = FetchEngine(cache=ResponseCache(offline=offline))
+    pages = fixture_pages(league)
+    html_by_name = engine.run([(name, url, lambda html: html) for name, url, _ in pages])
+
+    os.makedirs(fixtures_dir, exist_ok=True)
+    index = load_index(fixtures_dir)
+    for name, url, kind in pages:
+        with gzip.open(fixture_path(name, fixtures_dir), 'wt', encoding='utf-8') as f:
+            f.write(html_by_name[name])
+        index[name] = {'url': url, 'kind': kind, 'league': league}
+        print(f"Recorded {url} to {fixture_path(name, fixtures_dir)}")
+    with open(os.path.join(fixtures_dir, 'index.json'), 'w', encoding='utf-8') as f:
+        json.dump(index, f, indent=2, sort_keys=True)
+    return index
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Record FBref HTML fixtures for the offline benchmarks")
+    parser.add_argument('command', choices=['record'])
+    parser.add_argument('--league', choices=list(FBREF_URLS), default=FIXTURE_LEAGUE)
+    parser.add_argument('--fixtures-dir', default=FIXTURES_DIR)
+    parser.add_argument('--offline', action='store_true', help="Only replay pages already in the HTTP cache")
+    args = parser.parse_args(argv)
+    record(args.league, args.fixtures_dir, args.offline)
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,82 @@
+import os
+import re
+import sys
+import gzip
+import time
+import pandas as pd
+from io import StringIO
+from bs4 import BeautifulSoup
+from fbref.table_extractor import parse_page, extract_table
+
+# Compare the previous BeautifulSoup + read_html path with the lxml extractor, both on a full
+# page DOM and through the text locator that only parses the table fragment.
+# Usage (from src/): python -m benchmarks.parse_benchmark page.html [page2.html.gz ...]
+
+def read_html_file(path):
+    """Read a saved page, transparently decompressing .gz files."""
+    opener = gzip.open if path.endswith('.gz') else open
+    with opener(path, 'rt', encoding='utf-8') as f:
+        return f.read()
+
+def legacy_parse(html, table_id):
+    """The previous scraper path: html.parser soup, optional comment re-parse, str(table), read_html."""
+    soup = BeautifulSoup(html, 'html.parser')
+    table = soup.find('table', {'id': table_id})
+    if not table:
+        comment = soup.find(string=lambda text: isinstance(text, str) and table_id in text)
+        if comment:
+            table = BeautifulSoup(comment, 'html.parser').find('table', {'id': table_id})
+    if not table:
+        return None
+    return pd.read_html(StringIO(str(table)))[0]
+
+def lxml_parse(html, table_id):
+    """Full lxml page tree plus direct cell extraction."""
+    return extract_table(parse_page(html), table_id)
+
+def stream_parse(html, table_id):
+    """The current scraper path: locate the table in the raw text and parse only that fragment."""
+    return extract_table(html, table_id)
+
+def best_of(func, repeat, *args):
+    """Return the fastest wall time of `repeat` calls and the last result."""
+    best = float('inf')
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(*args)
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+def benchmark_page(path, repeat=3):
+    """Time both parse paths for every stats_* table on a saved page."""
+    html = read_html_file(path)
+    table_ids = sorted(set(re.findall(r'<table[^>]+id="(stats_[^"]+)"', html)))
+    rows = []
+    for table_id in table_ids:
+        legacy_time, legacy_df = best_of(legacy_parse, repeat, html, table_id)
+        lxml_time, lxml_df = best_of(lxml_parse, repeat, html, table_id)
+        stream_time, stream_df = best_of(stream_parse, repeat, html, table_id)
+        expected = legacy_df.to_csv(index=False) if legacy_df is not None else None
+        same = all(df is not None and df.to_csv(index=False) == expected for df in (lxml_df, stream_df))
+        rows.append({
+            'page': os.path.basename(path),
+            'table_id': table_id,
+            'legacy_ms': round(legacy_time * 1000, 1),
+            'lxml_dom_ms': round(lxml_time * 1000, 1),
+            'stream_ms': round(stream_time * 1000, 1),
+            'speedup': round(legacy_time / stream_time, 1) if stream_time else None,
+            'same_output': same
+        })
+    return rows
+
+def main(paths):
+    rows = []
+    for path in paths:
+        rows.extend(benchmark_page(path))
+    report = pd.DataFrame(rows)
+    print(report.to_string(index=False))
+    return report
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,131 @@
+import os
+import time
+import shutil
+import argparse
+import tempfile
+import pandas as pd
+from config.fbref_config import PIPELINE_ROOT
+from fbref.storage import FORMATS, TableStorage
+
+# Compare CSV, Parquet and Feather for the cleaned / final tables: bytes on disk, write time,
+# full reads and projected reads of the columns the transforms actually look up. --pipeline also
+# times every stage of a clean -> regroup -> transform -> load run with each format.
+# Usage (from src/): python -m benchmarks.storage_benchmark ../cleaned_data [../final_data ...]
+#                    python -m benchmarks.storage_benchmark --pipeline [--scale 4]
+
+# Columns read by the projected-read pass, when a table has them
+PROJECTION = ['Player', 'Squad', 'player_id', 'team_id']
+
+def csv_tables(folder):
+    """Every .csv table below a folder."""
+    paths = []
+    for root, _, files in os.walk(folder):
+        paths.extend(os.path.join(root, name) for name in sorted(files) if name.endswith('.csv'))
+    return sorted(paths)
+
+def best_of(func, repeat, *args):
+    """Return the fastest wall time of `repeat` calls and the last result."""
+    best = float('inf')
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(*args)
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+def write_all(storage, frames, target):
+    paths = []
+    for name, df in frames.items():
+        paths.append(storage.write(df, os.path.join(target, name)))
+    return paths
+
+def read_all(storage, frames, target, projected=False):
+    for name, df in frames.items():
+        columns = [col for col in PROJECTION if col in df.columns] if projected else None
+        if projected and not columns:
+            continue
+        storage.read(os.path.join(target, name), columns=columns)
+
+def benchmark_folder(folder, repeat=3):
+    """Write every table of a folder in each format and time the round trip."""
+    frames = {os.path.relpath(path, folder): pd.read_csv(path) for path in csv_tables(folder)}
+    rows = []
+    for fmt in FORMATS:
+        storage = TableStorage(fmt)
+        target = tempfile.mkdtemp(prefix=f"storage_{fmt}_")
+        try:
+            for name in frames:
+                os.makedirs(os.path.join(target, os.path.dirname(name)), exist_ok=True)
+            write_time, paths = best_of(write_all, repeat, storage, frames, target)
+            read_time, _ = best_of(read_all, repeat, storage, frames, target)
+            projected_time, _ = best_of(read_all, repeat, storage, frames, target, True)
+            rows.append({
+                'folder': os.path.basename(os.path.normpath(folder)),
+                'format': fmt,
+                'tables': len(frames),
+                'size_kb': round(sum(os.path.getsize(path) for path in paths) / 1024, 1),
+                'write_ms': round(write_time * 1000, 1),
+                'read_ms': round(read_time * 1000, 1),
+                'projected_read_ms': round(projected_time * 1000, 1)
+            })
+        finally:
+            shutil.rmtree(target, ignore_errors=True)
+    return rows
+
+def folder_size(folder):
+    return sum(os.path.getsize(os.path.join(root, name)) for root, _, files in os.walk(folder) for name in files)
+
+def benchmark_pipeline(template_root=PIPELINE_ROOT, scale=1, formats=FORMATS):
+    """Run clean -> regroup -> transform -> load end to end in each format; one row per (format, stage).
+
+    Every format starts from the same raw tables (synthetic data at `scale` times the template
+    volume), and each stage writes its tables to disk through Pipeline(checkpoint=TableStorage(fmt)).
+    """
+    from benchmarks.synthetic import REPORT_STAGES, generate, run_stages  # Imports the whole pipeline
+
+    rows = []
+    for fmt in formats:
+        root = tempfile.mkdtemp(prefix=f"storage_pipeline_{fmt}_")
+        try:
+            generate(root, scale, template_root)
+            events = run_stages(root, REPORT_STAGES, fmt)
+            sizes = {'clean': folder_size(os.path.join(root, 'cleaned_data')),
+                     'transform': folder_size(os.path.join(root, 'final_data'))}
+        finally:
+            shutil.rmtree(root, ignore_errors=True)
+        stages = [{
+            'format': fmt,
+            'stage': stage,
+            'wall_ms': round(events[stage]['wall_seconds'] * 1000, 1),
+            'cpu_ms': round(events[stage]['cpu_seconds'] * 1000, 1),
+            'output_kb': round(sizes[stage] / 1024, 1) if stage in sizes else None
+        } for stage in REPORT_STAGES]
+        total = {'format': fmt, 'stage': 'total', 'output_kb': None}
+        total.update({key: round(sum(row[key] for row in stages), 1) for key in ('wall_ms', 'cpu_ms')})
+        rows += stages + [total]
+    return pd.DataFrame(rows)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compare CSV, Parquet and Feather table storage")
+    parser.add_argument('folders', nargs='*', help="Folders whose .csv tables are round-tripped in each format")
+    parser.add_argument('--pipeline', action='store_true', help="Also time every stage of an end-to-end run per format")
+    parser.add_argument('--scale', type=int, default=1, help="With --pipeline, copies of the checked-in raw data")
+    parser.add_argument('--template-root', default=PIPELINE_ROOT, help="Folder whose data/ holds the raw tables")
+    args = parser.parse_args(argv)
+    if not args.folders and not args.pipeline:
+        parser.error("give folders to round-trip, --pipeline, or both")
+
+    reports = []
+    if args.folders:
+        rows = []
+        for folder in args.folders:
+            rows.extend(benchmark_folder(folder))
+        reports.append(pd.DataFrame(rows))
+        print(reports[-1].to_string(index=False))
+    if args.pipeline:
+        reports.append(benchmark_pipeline(args.template_root, args.scale))
+        print(reports[-1].to_string(index=False))
+    return reports
+
+if __name__ == "__main__":
+    main()
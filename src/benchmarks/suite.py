@@ -0,0 +1,323 @@
+import io
+import os
+import re
+import sys
+import json
+import time
+import shutil
+import platform
+import argparse
+import tempfile
+import statistics
+import subprocess
+import contextlib
+import pandas as pd
+from config.fbref_config import BENCHMARK_HISTORY, BENCHMARK_THRESHOLD, PIPELINE_ROOT
+from benchmarks.fixtures import FIXTURES_DIR, load_index, read_fixture
+from fbref.cleaning_specs import LEAGUES, SQUAD_TABLE_SPECS, PLAYER_TABLE_SPECS
+from fbref.cleaning_engine import CleaningEngine
+from fbref.final_data_transformation import TRANSFORMS, FinalDataTransformation, table_key
+from fbref.raw_tables import load_raw_table
+from fbref.storage import TableStorage
+from pipeline import Pipeline
+
+# Offline benchmarks of every pipeline step: parsing the recorded FBref pages, each cleaning spec,
+# each final transform and the upserts into a local database. Every run appends one JSON line to
+# the history; compare reports the benchmarks that got slower than a threshold between two runs.
+# Usage (from src/): python -m benchmarks.suite run [--groups clean transform] [--repeat 5]
+#                    python -m benchmarks.suite compare [--base RUN_ID] [--head RUN_ID]
+
+GROUPS = ['parse', 'clean', 'transform', 'load']
+
+def measure(func, repeat, setup=None):
+    """Best and median wall time in ms of `repeat` calls, plus the last result.
+
+    setup() builds fresh arguments for every call outside the timed section (e.g. a copy of
+    the input frame, so in-place transforms always start from the same data).
+    """
+    times = []
+    result = None
+    for _ in range(repeat):
+        args = setup() if setup else ()
+        start = time.perf_counter()
+        # The pipeline code reports progress with print; keep it out of the report
+        with contextlib.redirect_stdout(io.StringIO()):
+            result = func(*args)
+        times.append((time.perf_counter() - start) * 1000)
+    return {'best_ms': round(min(times), 3), 'median_ms': round(statistics.median(times), 3)}, result
+
+def rows_of(result):
+    if isinstance(result, pd.DataFrame):
+        return len(result)
+    if isinstance(result, dict) and 'rows' in result:
+        return result['rows']
+    return None
+
+def git_commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True,
+                              cwd=os.path.dirname(__file__), check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+class BenchmarkSuite:
+    """Runs the parse, clean, transform and load benchmarks against local inputs only.
+
+    Parsing uses the HTML fixtures recorded by benchmarks.fixtures; the other groups start from
+    the raw tables under root/data and hand their outputs to the next group in memory, the way
+    the pipeline does.
+    """
+
+    def __init__(self, root=PIPELINE_ROOT, fixtures_dir=FIXTURES_DIR, repeat=5, leagues=LEAGUES):
+        self.root = root
+        self.fixtures_dir = fixtures_dir
+        self.repeat = repeat
+        self.leagues = leagues
+        self.results = {}
+        self.notes = []
+        self.workdir = tempfile.mkdtemp(prefix='fbref_bench_')
+        self.pipeline = Pipeline(self.workdir)  # Memory storage the clean / transform outputs are kept in
+
+    def record(self, name, timing, result):
+        self.results[name] = {**timing, 'rows': rows_of(result)}
+        print(f"{name:<60} best {timing['best_ms']:>9.2f} ms   median {timing['median_ms']:>9.2f} ms")
+
+    def skip(self, group, reason):
+        self.notes.append(f"{group}: {reason}")
+        print(f"Skipping {group} benchmarks: {reason}")
+
+    def bench_parse(self):
+        """FBRefScraper.parse_table on every squad table and FBRefPlayerScraper.parse_table on every player page."""
+        index = load_index(self.fixtures_dir)
+        if not index:
+            return self.skip('parse', f"no fixtures in {self.fixtures_dir} (python -m benchmarks.fixtures record)")
+        try:
+            from fbref.scraper_fbref import FBRefScraper
+            from fbref.fbref_players_scraper import FBRefPlayerScraper
+        except ImportError as e:
+            return self.skip('parse', f"scraper dependencies missing ({e})")
+
+        squad_scraper = FBRefScraper()
+        player_scraper = FBRefPlayerScraper(save_path=self.workdir)
+        for name, page in sorted(index.items()):
+            html = read_fixture(name, self.fixtures_dir)
+            if page['kind'] == 'league':
+                for table_id in sorted(set(re.findall(r'<table[^>]+id="(stats_squads_[^"]+_for)"', html))):
+                    self.record(f"parse/squad/{table_id}", *measure(squad_scraper.parse_table, self.repeat,
+                                                                   lambda: (html, table_id)))
+            else:
+                key_part = page['url'].split('/')[-2]
+                wrapper_id = FBRefPlayerScraper.TABLE_WRAPPER_ID_MAP[key_part]
+                table_id = FBRefPlayerScraper.TABLE_ID_MAP[key_part]
+                self.record(f"parse/players/{table_id}", *measure(player_scraper.parse_table, self.repeat,
+                                                                 lambda: (html, wrapper_id, table_id)))
+
+    def bench_clean(self):
+        """CleaningEngine.clean_frame of every squad and player spec, over every league's raw table."""
+        raw_storage = TableStorage()
+        for specs, folder in ((SQUAD_TABLE_SPECS, 'fbref_data'), (PLAYER_TABLE_SPECS, 'fbref_players_data')):
+            engine = CleaningEngine(os.path.join(self.root, 'data', folder), self.pipeline.cleaned_folder,
+                                    specs, self.leagues, self.pipeline.storage)
+            for table in specs:
+                raw = {}
+                for league in self.leagues:
+                    path = engine.source_path(table, league)
+                    if raw_storage.exists(path):
+                        raw[league] = load_raw_table(path, raw_storage)
+                if not raw:
+                    self.skip('clean', f"no raw {table} tables under {engine.data_folder}")
+                    continue
+
+                def clean_all(table=table, raw=raw, engine=engine):
+                    return {league: engine.clean_frame(table, df, headers, league)
+                            for league, (df, headers) in raw.items()}
+
+                timing, cleaned = measure(clean_all, self.repeat)
+                self.record(f"clean/{table}", timing, {'rows': sum(len(df) for df in cleaned.values())})
+                # The cleaned frames are the inputs of the transform benchmarks
+                for league, df in cleaned.items():
+                    self.pipeline.storage.write(df, engine.output_path(table, league))
+
+    def bench_transform(self):
+        """Every registered FinalDataTransformation transform, over every league's cleaned table."""
+        storage = self.pipeline.storage
+        if not storage.list_tables(os.path.join(self.pipeline.cleaned_folder, self.leagues[0])):
+            return self.skip('transform', "no cleaned tables, run the clean group first")
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.pipeline.regroup()
+            self.pipeline.transform()  # Also fills final_data for the load benchmarks
+
+        input_dirs = {league: os.path.join(self.pipeline.cleaned_folder, league) for league in self.leagues}
+        transformer = FinalDataTransformation(input_dirs, self.pipeline.final_folder,
+                                              os.path.join(self.pipeline.final_folder, 'First_Tables'), storage)
+        league_files = [os.path.join(input_dir, "Standard_cleaned.csv") for input_dir in input_dirs.values()]
+        inputs = {}
+        for file in ('leagues.csv', 'teams.csv', 'players.csv'):
+            inputs.setdefault(table_key(file), []).append(
+                (storage.read(os.path.join(self.pipeline.first_tables_folder, file)), league_files))
+        for league, input_dir in input_dirs.items():
+            league_file_path = os.path.join(input_dir, "Standard_cleaned.csv")
+            for file in storage.list_tables(input_dir):
+                inputs.setdefault(table_key(file, league), []).append(
+                    (storage.read(os.path.join(input_dir, file)), league_file_path))
+
+        for key in TRANSFORMS:
+            if key not in inputs:
+                self.skip('transform', f"no cleaned input for {key}")
+                continue
+
+            def transform_all(frames, key=key):
+                return {'rows': sum(len(transformer._transform_frame(df, key, league_file))
+                                    for df, league_file in frames)}
+
+            self.record(f"transform/{key}", *measure(
+                transform_all, self.repeat, lambda key=key: ([(df.copy(), path) for df, path in inputs[key]],)))
+
+    def bench_load(self, backends=('sqlite', 'duckdb')):
+        """DataInserter.upsert_csv_to_table of every final table into fresh local databases."""
+        storage = self.pipeline.storage
+        if not storage.exists(os.path.join(self.pipeline.final_folder, 'First_Tables', 'players.csv')):
+            return self.skip('load', "no final tables, run the transform group first")
+        from database.db_backends import create_backend
+        from database.db_creation import create_schema
+        from database.db_insertion import DataInserter
+
+        for name in backends:
+            try:
+                backend = create_backend(name, path=os.path.join(self.workdir, f"bench.{name}"))
+            except ImportError as e:
+                self.skip(f"load/{name}", str(e))
+                continue
+            try:
+                create_schema(backend)
+                inserter = DataInserter(backend, storage)
+                jobs = inserter.load_jobs(final_data_folder=self.pipeline.final_folder, leagues=self.leagues)
+                tables = {}
+                for path, table, key, league in jobs:
+                    tables.setdefault(table, []).append((path, key, league))
+
+                # The first call inserts, the repeats upsert the same keys again
+                for table, table_jobs in tables.items():
+                    def load_table(table=table, table_jobs=table_jobs):
+                        return {'rows': sum(inserter.upsert_csv_to_table(path, table, key, league=league)['rows']
+                                            for path, key, league in table_jobs)}
+
+                    self.record(f"load/{name}/{table}", *measure(load_table, self.repeat))
+            finally:
+                backend.close()
+
+    def run(self, groups=GROUPS):
+        unknown = [group for group in groups if group not in GROUPS]
+        if unknown:
+            raise ValueError(f"Unknown benchmark groups {', '.join(unknown)}, expected some of {', '.join(GROUPS)}")
+        try:
+            # Later groups take their inputs from the earlier ones
+            needed = {'transform': ['clean'], 'load': ['clean', 'transform']}
+            run_groups = [group for group in GROUPS
+                          if group in groups or any(group in needed.get(wanted, []) for wanted in groups)]
+            for group in run_groups:
+                getattr(self, f"bench_{group}")()
+            self.results = {name: result for name, result in self.results.items() if name.split('/')[0] in groups}
+        finally:
+            shutil.rmtree(self.workdir, ignore_errors=True)
+        return self.results
+
+def save_run(results, notes=(), history_path=BENCHMARK_HISTORY):
+    """Append one run to the history and return its record."""
+    record = {
+        'run_id': time.strftime('%Y%m%d-%H%M%S'),
+        'timestamp': time.time(),
+        'commit': git_commit(),
+        'python': platform.python_version(),
+        'pandas': pd.__version__,
+        'machine': platform.node(),
+        'notes': list(notes),
+        'results': results
+    }
+    os.makedirs(os.path.dirname(os.path.abspath(history_path)), exist_ok=True)
+    with open(history_path, 'a', encoding='utf-8') as f:
+        f.write(json.dumps(record) + '\n')
+    return record
+
+def load_history(history_path=BENCHMARK_HISTORY):
+    if not os.path.exists(history_path):
+        return []
+    with open(history_path, 'r', encoding='utf-8') as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+def find_run(history, run_id):
+    for record in history:
+        if record['run_id'] == run_id:
+            return record
+    raise ValueError(f"Unknown benchmark run {run_id!r}, expected one of {', '.join(r['run_id'] for r in history)}")
+
+def compare(base, head, threshold=BENCHMARK_THRESHOLD, min_ms=1.0):
+    """Per-benchmark change from base to head; slower by more than threshold is a regression.
+
+    Benchmarks faster than min_ms in both runs are too noisy to flag either way.
+    """
+    rows = []
+    for name in sorted(set(base['results']) | set(head['results'])):
+        before = base['results'].get(name)
+        after = head['results'].get(name)
+        row = {'benchmark': name, 'base_ms': before and before['best_ms'], 'head_ms': after and after['best_ms']}
+        if before is None:
+            row['status'] = 'new'
+        elif after is None:
+            row['status'] = 'missing'
+        else:
+            change = after['best_ms'] / before['best_ms'] - 1 if before['best_ms'] else 0.0
+            row['change'] = f"{change:+.1%}"
+            if max(before['best_ms'], after['best_ms']) < min_ms:
+                row['status'] = 'ok'
+            elif change > threshold:
+                row['status'] = 'regression'
+            elif change < -threshold:
+                row['status'] = 'faster'
+            else:
+                row['status'] = 'ok'
+        rows.append(row)
+    return pd.DataFrame(rows, columns=['benchmark', 'base_ms', 'head_ms', 'change', 'status'])
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Offline benchmarks of the FBref pipeline")
+    parser.add_argument('--history', default=BENCHMARK_HISTORY, help="JSON lines file the runs are appended to")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    run_parser = commands.add_parser('run', help="Run the benchmarks and append the results to the history")
+    run_parser.add_argument('--groups', nargs='+', choices=GROUPS, default=GROUPS)
+    run_parser.add_argument('--repeat', type=int, default=5)
+    run_parser.add_argument('--root', default=PIPELINE_ROOT, help="Folder holding the raw tables in data/")
+    run_parser.add_argument('--fixtures-dir', default=FIXTURES_DIR)
+
+    compare_parser = commands.add_parser('compare', help="Compare two runs, exit 1 on regressions")
+    compare_parser.add_argument('--base', help="Run id of the baseline, the second to last run by default")
+    compare_parser.add_argument('--head', help="Run id to check, the last run by default")
+    compare_parser.add_argument('--threshold', type=float, default=BENCHMARK_THRESHOLD,
+                                help="Relative slowdown reported as a regression (0.10 = 10%%)")
+    compare_parser.add_argument('--min-ms', type=float, default=1.0, help="Ignore benchmarks faster than this")
+    args = parser.parse_args(argv)
+
+    if args.command == 'run':
+        suite = BenchmarkSuite(args.root, args.fixtures_dir, args.repeat)
+        record = save_run(suite.run(args.groups), suite.notes, args.history)
+        print(f"Saved run {record['run_id']} ({len(record['results'])} benchmarks) to {args.history}")
+        return 0
+
+    history = load_history(args.history)
+    if len(history) < 2 and not (args.base and args.head):
+        parser.error(f"compare needs two runs in {args.history}")
+    head = find_run(history, args.head) if args.head else history[-1]
+    base = find_run(history, args.base) if args.base else [r for r in history if r is not head][-1]
+    report = compare(base, head, args.threshold, args.min_ms)
+    print(f"Base {base['run_id']} ({base['commit']}) -> head {head['run_id']} ({head['commit']}), "
+          f"threshold {args.threshold:.0%}")
+    print(report.to_string(index=False))
+    regressions = report[report['status'] == 'regression']
+    if not regressions.empty:
+        print(f"{len(regressions)} benchmarks regressed by more than {args.threshold:.0%}")
+        return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,281 @@
+import os
+import sys
+import gzip
+import html
+import json
+import math
+import time
+import shutil
+import argparse
+import tempfile
+import tracemalloc
+import numpy as np
+import pandas as pd
+from config.fbref_config import BENCHMARK_HISTORY, PIPELINE_ROOT, SCALING_EXPONENT_LIMIT
+from benchmarks.fixtures import fixture_pages, fixture_path
+from fbref.atomic_files import write_csv_atomic
+from fbref.cleaning_specs import LEAGUES, SQUAD_TABLE_SPECS, PLAYER_TABLE_SPECS
+from fbref.raw_tables import load_raw_table
+from fbref.storage import FORMATS, TableStorage
+from fbref.tracing import RunTrace
+from pipeline import Pipeline
+
+# Synthetic FBref data at N times the checked-in volume, for finding the pipeline steps that scale
+# worse than linearly. Every raw table under data/ is repeated `scale` times with the players and
+# squads of copy k renamed "<name> k", so ids still resolve across tables, and written in the
+# scraped layout: read_html's two header rows plus the header row FBref repeats every 25 players.
+# Usage (from src/): python -m benchmarks.synthetic generate OUT_ROOT --scale 100 [--html]
+#                    python -m benchmarks.synthetic report [--scales 1 4 16] [--stages clean transform]
+
+# FBref repeats the column labels inside player tables after every HEADER_EVERY rows
+HEADER_EVERY = 25
+
+# Raw tables: (cleaning specs naming the files, folder under data/, has repeated header rows)
+RAW_FOLDERS = [(SQUAD_TABLE_SPECS, 'fbref_data', False), (PLAYER_TABLE_SPECS, 'fbref_players_data', True)]
+
+# Stages a scaling report runs; scraping needs the network
+REPORT_STAGES = ['clean', 'regroup', 'transform', 'load']
+
+def scale_frame(df, display_headers, scale):
+    """Repeat a raw table `scale` times; copy k renames its players and squads to "<name> k"."""
+    labels = [label for _, label in display_headers]
+    name_columns = [col for col, label in zip(df.columns, labels) if label in ('Player', 'Squad')]
+    copies = []
+    for k in range(scale):
+        copy = df.copy()
+        if k:
+            for col in name_columns:
+                names = copy[col]
+                copy[col] = (names.astype(str) + f" {k}").where(names.notna())
+        copies.append(copy)
+    scaled = pd.concat(copies, ignore_index=True)
+    for col, label in zip(df.columns, labels):
+        if label == 'Rk':
+            scaled[col] = np.arange(1, len(scaled) + 1)
+    return scaled
+
+def write_legacy_table(df, display_headers, csv_path, repeat_headers=False):
+    """Write a raw table the way the scrapers saved read_html output: two header rows, plus
+    the label row after every HEADER_EVERY rows when repeat_headers is set."""
+    groups = [group or f"Unnamed: {i}_level_0" for i, (group, _) in enumerate(display_headers)]
+    labels = [label for _, label in display_headers]
+    body = df.copy()
+    body.columns = range(len(labels))
+    positions = np.arange(len(body))
+    blocks = [pd.DataFrame([groups, labels], index=[-2, -1])]
+    if repeat_headers and len(body) > HEADER_EVERY:
+        # Data row i moves down by the header rows above it; the repeats fill the gaps
+        body.index = positions + positions // HEADER_EVERY
+        repeats = (len(body) - 1) // HEADER_EVERY
+        blocks.append(pd.DataFrame([labels] * repeats,
+                                   index=[(j + 1) * (HEADER_EVERY + 1) - 1 for j in range(repeats)]))
+    blocks.append(body)
+    write_csv_atomic(pd.concat(blocks).sort_index(kind='stable'), csv_path, header=False, index=False)
+
+def _cell(value):
+    return '' if pd.isna(value) else html.escape(str(value))
+
+def _data_stat(group, label):
+    """data-stat key of a synthetic column, e.g. ('Per 90 Minutes', 'Gls') -> per_90_minutes_gls."""
+    text = f"{group} {label}" if group else label
+    return ''.join(char if char.isalnum() else '_' for char in text.lower()).strip('_') or 'col'
+
+def table_html(df, display_headers, table_id, repeat_headers=False):
+    """FBref-style <table>: an over_header row, a header row keyed by data-stat, and the body."""
+    groups = [group for group, _ in display_headers]
+    keys = ['ranker' if label == 'Rk' else _data_stat(group, label) for group, label in display_headers]
+    over_header = []
+    start = 0
+    for i in range(1, len(groups) + 1):
+        if i == len(groups) or groups[i] != groups[start]:
+            over_header.append(f'<th colspan="{i - start}">{html.escape(groups[start])}</th>')
+            start = i
+    header = ''.join(f'<th data-stat="{key}">{html.escape(label)}</th>'
+                     for key, (_, label) in zip(keys, display_headers))
+    lines = [f'<table id="{table_id}" class="stats_table">',
+             f'<thead><tr class="over_header">{"".join(over_header)}</tr><tr>{header}</tr></thead>', '<tbody>']
+    for i, row in enumerate(df.itertuples(index=False)):
+        if repeat_headers and i and i % HEADER_EVERY == 0:
+            lines.append(f'<tr class="thead">{header}</tr>')
+        cells = [f'<td data-stat="{key}">{_cell(value)}</td>' for key, value in zip(keys, row)]
+        if keys and keys[0] == 'ranker':
+            cells[0] = f'<th data-stat="ranker">{_cell(row[0])}</th>'
+        lines.append(f'<tr>{"".join(cells)}</tr>')
+    lines.append('</tbody></table>')
+    return '\n'.join(lines)
+
+def write_html_pages(league, tables, html_dir):
+    """Write a league's squad tables as its league page and each player table as its stats page,
+    recorded like benchmarks.fixtures so the parse benchmarks can run on them."""
+    # The table IDs come from the scrapers, which need the HTTP stack
+    from fbref.scraper_fbref import FBRefScraper
+    from fbref.fbref_players_scraper import FBRefPlayerScraper
+
+    index_path = os.path.join(html_dir, 'index.json')
+    index = {}
+    if os.path.exists(index_path):
+        with open(index_path, 'r', encoding='utf-8') as f:
+            index = json.load(f)
+    os.makedirs(html_dir, exist_ok=True)
+    for name, url, kind in fixture_pages(league):
+        if kind == 'league':
+            # Squad tables sit in the page itself
+            wrappers = [(f"all_{table_id}", table_id, f"{league}_{table}.csv", False)
+                        for table, table_id in FBRefScraper.SQUAD_TABLE_ID_MAP.items()]
+        else:
+            # Player tables are shipped inside an HTML comment, as on FBref
+            key_part = url.split('/')[-2]
+            table_id = FBRefPlayerScraper.TABLE_ID_MAP[key_part]
+            wrappers = [(FBRefPlayerScraper.TABLE_WRAPPER_ID_MAP[key_part], table_id,
+                         FBRefPlayerScraper.table_file_name(table_id), True)]
+        parts = ['<html><body>']
+        for wrapper_id, table_id, file_name, commented in wrappers:
+            if file_name not in tables:
+                continue
+            df, display_headers = tables[file_name]
+            table = table_html(df, display_headers, table_id, repeat_headers=commented)
+            parts.append(f'<div id="{wrapper_id}" class="table_wrapper">'
+                         + (f'<!--\n{table}\n-->' if commented else table) + '</div>')
+        parts.append('</body></html>')
+        with gzip.open(fixture_path(name, html_dir), 'wt', encoding='utf-8') as f:
+            f.write('\n'.join(parts))
+        index[name] = {'url': url, 'kind': kind, 'league': league}
+    with open(index_path, 'w', encoding='utf-8') as f:
+        json.dump(index, f, indent=2, sort_keys=True)
+
+def generate(out_root, scale, template_root=PIPELINE_ROOT, leagues=LEAGUES, html_pages=False):
+    """Write every league's raw tables at `scale` times the template volume under out_root/data.
+
+    With html_pages, the same tables are also written as FBref pages under out_root/html.
+    Returns {'tables': count, 'rows': raw rows written}.
+    """
+    template_storage = TableStorage()
+    tables = 0
+    rows = 0
+    for league in leagues:
+        league_tables = {}
+        for specs, folder, repeat_headers in RAW_FOLDERS:
+            for spec in specs.values():
+                file_name = spec['source'].format(league=league)
+                template_path = os.path.join(template_root, 'data', folder, league, file_name)
+                if not template_storage.exists(template_path):
+                    print(f"No template {template_path}, skipping")
+                    continue
+                df, display_headers = load_raw_table(template_path, template_storage)
+                df = scale_frame(df, display_headers, scale)
+                write_legacy_table(df, display_headers, os.path.join(out_root, 'data', folder, league, file_name),
+                                   repeat_headers)
+                league_tables[file_name] = (df, display_headers)
+                tables += 1
+                rows += len(df)
+        if html_pages:
+            write_html_pages(league, league_tables, os.path.join(out_root, 'html'))
+    print(f"Generated {tables} raw tables with {rows} rows at scale {scale} under {out_root}")
+    return {'tables': tables, 'rows': rows}
+
+def run_stages(root, stages, fmt='csv', memory=False):
+    """Run the pipeline up to the last of `stages` on the raw tables under root; {stage: stage event}."""
+    from database.db_backends import create_backend  # Database clients are only needed for the load stage
+    from database.db_creation import create_schema
+
+    backend = None
+    if 'load' in stages:
+        backend = create_backend('sqlite', path=os.path.join(root, 'scale.sqlite'))
+        create_schema(backend)
+    trace = RunTrace(trace_dir=None, memory=memory)
+    try:
+        # Stages write their tables to disk like a production run; the earlier ones feed the later
+        last = max(REPORT_STAGES.index(stage) for stage in stages)
+        Pipeline(root, TableStorage(fmt), backend=backend, trace=trace).run(REPORT_STAGES[:last + 1])
+    finally:
+        if backend is not None:
+            backend.close()
+        if memory:
+            tracemalloc.stop()  # RunTrace leaves it running, which would slow down the next timed run
+    return {event['name']: event for event in trace.events if event['cat'] == 'stage'}
+
+def scaling_report(scales, stages=REPORT_STAGES, fmt='csv', memory=True, template_root=PIPELINE_ROOT):
+    """Run the pipeline on synthetic data at every scale and report time and memory per stage.
+
+    Times come from a plain run; with memory, a second run under tracemalloc (several times
+    slower) gives each stage's peak Python allocations. exponent is the log-log slope of a
+    stage's wall time against raw rows since the previous scale: ~1 is linear, above
+    SCALING_EXPONENT_LIMIT the stage is flagged super-linear.
+    """
+    unknown = [stage for stage in stages if stage not in REPORT_STAGES]
+    if unknown:
+        raise ValueError(f"Unknown stages {', '.join(unknown)}, expected some of {', '.join(REPORT_STAGES)}")
+
+    rows = []
+    previous = {}
+    for scale in sorted(scales):
+        root = tempfile.mkdtemp(prefix=f"fbref_scale_{scale}_")
+        try:
+            generated = generate(root, scale, template_root)
+            events = run_stages(root, stages, fmt)
+            peaks = run_stages(root, stages, fmt, memory=True) if memory else {}
+        finally:
+            shutil.rmtree(root, ignore_errors=True)
+
+        for stage in stages:
+            event = events[stage]
+            row = {
+                'scale': scale,
+                'raw_rows': generated['rows'],
+                'stage': stage,
+                'rows_in': event.get('rows_in'),
+                'rows_out': event.get('rows_out'),
+                'wall_s': round(event['wall_seconds'], 3),
+                'cpu_s': round(event['cpu_seconds'], 3),
+                'us_per_row': round(event['wall_seconds'] * 1e6 / generated['rows'], 2),
+                'py_peak_mb': round(peaks[stage]['py_peak_kb'] / 1024, 1) if stage in peaks else None,
+                'process_rss_mb': round(event['max_rss_kb'] / 1024, 1) if event.get('max_rss_kb') else None,
+                'exponent': None,
+                'flag': ''
+            }
+            before = previous.get(stage)
+            if before and generated['rows'] > before['raw_rows'] and before['wall_s'] > 0:
+                row['exponent'] = round(math.log(row['wall_s'] / before['wall_s'])
+                                        / math.log(generated['rows'] / before['raw_rows']), 2)
+                if row['exponent'] > SCALING_EXPONENT_LIMIT:
+                    row['flag'] = 'super-linear'
+            previous[stage] = row
+            rows.append(row)
+    return pd.DataFrame(rows)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate FBref-shaped raw data at scale and report how the stages scale")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    generate_parser = commands.add_parser('generate', help="Write scaled raw tables under OUT_ROOT/data")
+    generate_parser.add_argument('out_root')
+    generate_parser.add_argument('--scale', type=int, default=10, help="Copies of the checked-in data")
+    generate_parser.add_argument('--html', action='store_true', help="Also write the tables as FBref pages under OUT_ROOT/html")
+    generate_parser.add_argument('--template-root', default=PIPELINE_ROOT, help="Folder whose data/ holds the template tables")
+
+    report_parser = commands.add_parser('report', help="Time every stage at several scales")
+    report_parser.add_argument('--scales', nargs='+', type=int, default=[1, 4, 16])
+    report_parser.add_argument('--stages', nargs='+', choices=REPORT_STAGES, default=REPORT_STAGES)
+    report_parser.add_argument('--format', choices=list(FORMATS), default='csv', help="Format the stages write in")
+    report_parser.add_argument('--no-memory', action='store_true', help="Skip the tracemalloc run that measures peak allocations")
+    report_parser.add_argument('--template-root', default=PIPELINE_ROOT)
+    report_parser.add_argument('--output', help="CSV path of the report, next to the benchmark history by default")
+    args = parser.parse_args(argv)
+
+    if args.command == 'generate':
+        generate(args.out_root, args.scale, args.template_root, html_pages=args.html)
+        return 0
+
+    report = scaling_report(args.scales, args.stages, args.format, not args.no_memory, args.template_root)
+    print(report.to_string(index=False))
+    output = args.output or os.path.join(os.path.dirname(BENCHMARK_HISTORY), f"scaling-{time.strftime('%Y%m%d-%H%M%S')}.csv")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    report.to_csv(output, index=False)
+    print(f"Scaling report saved to {output}")
+    flagged = report[report['flag'] != '']
+    for _, row in flagged.iterrows():
+        print(f"{row['stage']} grows super-linearly: exponent {row['exponent']} at {row['raw_rows']} raw rows")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
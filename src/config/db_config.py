@@ -0,0 +1,18 @@
+import os
+
+# Load settings for DataInserter
+UPSERT_BATCH_SIZE = 1000  # Rows sent per upsert request
+SEASON = os.environ.get('FBREF_SEASON', '2024-2025')  # Season the loaded stat rows belong to (part of stat_id)
+
+# Backend DataInserter loads through: 'supabase', 'postgres', 'sqlite' or 'duckdb'
+DB_BACKEND = os.environ.get('FBREF_DB_BACKEND', 'supabase')
+DATABASE_URL = os.environ.get('FBREF_DATABASE_URL', '')  # libpq DSN for the postgres backend
+SQLITE_PATH = os.path.join(os.path.dirname(__file__), '..', '..', 'data', 'fbref.sqlite')
+DUCKDB_PATH = os.path.join(os.path.dirname(__file__), '..', '..', 'data', 'fbref.duckdb')
+# Partitioning the postgres schema was created with (None, 'league' or 'league_season'); upserts match its keys
+DB_PARTITION = os.environ.get('FBREF_DB_PARTITION') or None
+
+# Concurrent loading in DataInserter.bulk_insert
+FINAL_DATA_FOLDER = os.path.join(os.path.dirname(__file__), '..', '..', 'final_data')
+LOAD_MAX_WORKERS = 8  # Files upserted at the same time
+LOAD_MAX_PER_TABLE = 2  # Files upserted into the same target table at the same time
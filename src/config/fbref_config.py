@@ -1,4 +1,5 @@
 # fbref_config.py
+import os
 
 # URLs for different football league stats pages on FBref
 FBREF_URLS = {
@@ -9,6 +10,49 @@ FBREF_URLS = {
     "Bundesliga": "https://fbref.com/en/comps/20/Bundesliga-Stats"
 }
 
+# Fetch engine settings shared by the league and player scrapers
+FETCH_DELAY = 4  # Seconds between requests to the same host
+FETCH_BURST = 1  # Requests allowed back-to-back before the delay applies
+FETCH_MAX_WORKERS = 4  # Pages downloaded and parsed concurrently
+FETCH_TIMEOUT = 30  # Seconds before a single request is abandoned
+FETCH_MAX_RETRIES = 3  # Retry budget per URL for 429/5xx and connection errors
+FETCH_BACKOFF = 2  # Base backoff in seconds, doubled after each failed attempt
+
+# Raw HTML cache under data/, revalidated with ETag / Last-Modified once the TTL expires
+HTTP_CACHE_DIR = os.path.join(os.path.dirname(__file__), '..', '..', 'data', 'http_cache')
+HTTP_CACHE_TTL = 6 * 60 * 60  # Seconds
+HTTP_CACHE_OFFLINE = os.environ.get('FBREF_OFFLINE') == '1'  # Replay cached pages only
+
+# Cleaning runner settings
+CLEAN_MAX_WORKERS = os.cpu_count() or 1  # Processes cleaning in parallel, each one league's tables of a cleaner
+
+# Table storage shared by every stage: 'csv', 'parquet' or 'feather' (Arrow IPC)
+STORAGE_FORMAT = os.environ.get('FBREF_STORAGE_FORMAT', 'csv')
+STORAGE_EXPORT_CSV = os.environ.get('FBREF_EXPORT_CSV') == '1'  # Also write a CSV next to columnar files
+
+# Final transformation settings
+TRANSFORM_MAX_WORKERS = os.cpu_count() or 1  # Processes transforming (league, file) jobs in parallel
+TRANSFORM_CHUNK_ROWS = 50000  # Rows of a stat file read, transformed and written at a time
+
+# In-memory pipeline (python -m pipeline)
+PIPELINE_ROOT = os.path.join(os.path.dirname(__file__), '..', '..')  # Holds data/, cleaned_data/, first_tables/, final_data/
+PIPELINE_CHECKPOINT = os.environ.get('FBREF_CHECKPOINT') == '1'  # Also persist every stage's tables to disk
+
+# Incremental runs: input hashes, outputs and row counts of every (stage, league, table)
+MANIFEST_PATH = os.path.join(os.path.dirname(__file__), '..', '..', 'data', 'pipeline_manifest.json')
+
+# Run traces (JSON lines + Chrome trace events) and --profile output
+TRACE_DIR = os.path.join(os.path.dirname(__file__), '..', '..', 'data', 'traces')
+
+# Historical backfill (python -m backfill): past seasons are crawled under data/<folder>/<League>/<season>/
+BACKFILL_MAX_WORKERS = 4  # (league, season) crawls in flight; the fetch engine still enforces the per-host delay
+BACKFILL_STATE = os.path.join(os.path.dirname(__file__), '..', '..', 'data', 'backfill_state.json')
+
+# Offline benchmark suite (python -m benchmarks.suite): one JSON line of results per run
+BENCHMARK_HISTORY = os.path.join(os.path.dirname(__file__), '..', '..', 'data', 'benchmarks', 'history.jsonl')
+BENCHMARK_THRESHOLD = 0.10  # Relative slowdown compare reports as a regression
+SCALING_EXPONENT_LIMIT = 1.15  # Stage time growing faster than rows**limit is reported as super-linear
+
 # Player stats URLs for each league
 FBREF_PLAYERS_STATS_URLS = {
     "Premier_League": [
@@ -0,0 +1,207 @@
+import io
+import sqlite3
+from abc import ABC, abstractmethod
+from contextlib import contextmanager, nullcontext
+import pandas as pd
+from config.db_config import DB_BACKEND, DATABASE_URL, SQLITE_PATH, DUCKDB_PATH
+
+def conflict_keys(on_conflict):
+    """The column list of an on_conflict key given as one column name or several."""
+    return [on_conflict] if isinstance(on_conflict, str) else list(on_conflict)
+
+def frame_to_rows(df):
+    """Turn a frame into plain Python values, with NULL (None) wherever pandas has NaN/NA."""
+    return df.astype(object).where(df.notna(), None)
+
+class DatabaseBackend(ABC):
+    """Interface DataInserter loads tables through; subclasses must implement upsert."""
+
+    max_concurrency = None  # Loads the target accepts at the same time, None for no limit
+    dialect = 'postgres'  # SQL dialect database.db_creation generates the schema in
+    supports_ddl = False  # Whether execute_ddl can create the schema; create_schema refuses otherwise
+
+    def for_worker(self):
+        """Backend a loader thread should use; shared unless each thread needs its own connection."""
+        return self
+
+    @abstractmethod
+    def upsert(self, table_name, df, on_conflict):
+        """Insert the rows of df, updating rows whose on_conflict key (a column or list of columns) already exists."""
+
+    def transaction(self):
+        """Context manager grouping every upsert of one table."""
+        return nullcontext()
+
+    def close(self):
+        pass
+
+class SupabaseBackend(DatabaseBackend):
+    def __init__(self, client=None):
+        if client is None:
+            from database.db_connection import DatabaseConnection
+            client = DatabaseConnection().get_client()
+        self.client = client
+
+    def upsert(self, table_name, df, on_conflict):
+        records = frame_to_rows(df).to_dict(orient='records')
+        self.client.table(table_name).upsert(records, on_conflict=','.join(conflict_keys(on_conflict))).execute()
+
+class PostgresBackend(DatabaseBackend):
+    """Direct PostgreSQL loads: COPY FROM STDIN into a temp table, then one INSERT ... ON CONFLICT."""
+
+    supports_ddl = True
+
+    def __init__(self, dsn=DATABASE_URL):
+        try:
+            import psycopg2
+            from psycopg2 import sql
+        except ImportError as e:
+            raise ImportError("The postgres backend needs psycopg2 (pip install psycopg2-binary)") from e
+        self.sql = sql
+        self.dsn = dsn
+        self.connection = psycopg2.connect(dsn)
+
+    def for_worker(self):
+        # Transactions are per connection, so every loader thread opens its own
+        return PostgresBackend(self.dsn)
+
+    @contextmanager
+    def transaction(self):
+        with self.connection:  # Commits on success, rolls back on error
+            yield
+
+    def upsert(self, table_name, df, on_conflict):
+        sql = self.sql
+        keys = conflict_keys(on_conflict)
+        columns = sql.SQL(', ').join(sql.Identifier(col) for col in df.columns)
+        updated = [col for col in df.columns if col not in keys]
+        updates = sql.SQL(', ').join(sql.SQL('{0} = EXCLUDED.{0}').format(sql.Identifier(col)) for col in updated)
+
+        # Nullable integers keep integer text ("3", not "3.0") and NaN becomes an empty (NULL) field
+        buffer = io.StringIO()
+        df.convert_dtypes(convert_string=False).to_csv(buffer, index=False, header=False)
+        buffer.seek(0)
+
+        with self.connection.cursor() as cursor:
+            cursor.execute(sql.SQL(
+                'CREATE TEMP TABLE IF NOT EXISTS {staging} (LIKE {table} INCLUDING DEFAULTS) ON COMMIT DROP'
+            ).format(staging=sql.Identifier(f"{table_name}_staging"), table=sql.Identifier(table_name)))
+            cursor.copy_expert(sql.SQL('COPY {staging} ({columns}) FROM STDIN WITH (FORMAT csv)').format(
+                staging=sql.Identifier(f"{table_name}_staging"), columns=columns
+            ).as_string(cursor), buffer)
+            if updated:
+                action = sql.SQL('DO UPDATE SET {updates}').format(updates=updates)
+            else:
+                action = sql.SQL('DO NOTHING')
+            cursor.execute(sql.SQL(
+                'INSERT INTO {table} ({columns}) SELECT {columns} FROM {staging} ON CONFLICT ({key}) {action}'
+            ).format(table=sql.Identifier(table_name), columns=columns, staging=sql.Identifier(f"{table_name}_staging"),
+                     key=sql.SQL(', ').join(sql.Identifier(col) for col in keys), action=action))
+            cursor.execute(sql.SQL('TRUNCATE {staging}').format(staging=sql.Identifier(f"{table_name}_staging")))
+
+    def execute_ddl(self, statements):
+        with self.connection, self.connection.cursor() as cursor:
+            for statement in statements:
+                cursor.execute(statement)
+
+    def close(self):
+        self.connection.close()
+
+class SQLBackend(DatabaseBackend):
+    """executemany upserts for embedded databases, one transaction per table; subclasses implement table_columns."""
+
+    max_concurrency = 1  # Single writer: tables are loaded one after another on the shared connection
+    supports_ddl = True
+
+    def __init__(self, connection):
+        self.connection = connection
+
+    def quote(self, name):
+        return '"' + name.replace('"', '""') + '"'
+
+    @contextmanager
+    def transaction(self):
+        self.connection.execute('BEGIN')
+        try:
+            yield
+        except Exception:
+            self.connection.execute('ROLLBACK')
+            raise
+        self.connection.execute('COMMIT')
+
+    @abstractmethod
+    def table_columns(self, table_name):
+        """Column names of an existing table, empty when it does not exist."""
+
+    def ensure_table(self, table_name, df, on_conflict):
+        """Create the table (or add missing columns) from the frame's dtypes when no schema exists yet."""
+        existing = self.table_columns(table_name)
+        types = {col: 'BIGINT' if pd.api.types.is_integer_dtype(dtype) else
+                 'DOUBLE' if pd.api.types.is_float_dtype(dtype) else 'TEXT'
+                 for col, dtype in df.dtypes.items()}
+        if not existing:
+            definitions = ', '.join(f"{self.quote(col)} {types[col]}" for col in df.columns)
+            keys = ', '.join(self.quote(col) for col in conflict_keys(on_conflict))
+            self.connection.execute(f"CREATE TABLE {self.quote(table_name)} ({definitions}, PRIMARY KEY ({keys}))")
+            return
+        for col in df.columns:
+            if col not in existing:
+                self.connection.execute(f"ALTER TABLE {self.quote(table_name)} ADD COLUMN {self.quote(col)} {types[col]}")
+
+    def upsert(self, table_name, df, on_conflict):
+        self.ensure_table(table_name, df, on_conflict)
+        columns = ', '.join(self.quote(col) for col in df.columns)
+        placeholders = ', '.join('?' for _ in df.columns)
+        keys = conflict_keys(on_conflict)
+        updates = ', '.join(f"{self.quote(col)} = excluded.{self.quote(col)}" for col in df.columns if col not in keys)
+        action = f"DO UPDATE SET {updates}" if updates else "DO NOTHING"
+        statement = (f"INSERT INTO {self.quote(table_name)} ({columns}) VALUES ({placeholders}) "
+                     f"ON CONFLICT ({', '.join(self.quote(col) for col in keys)}) {action}")
+        self.connection.executemany(statement, frame_to_rows(df).itertuples(index=False, name=None))
+
+    def execute_ddl(self, statements):
+        with self.transaction():
+            for statement in statements:
+                self.connection.execute(statement)
+
+    def close(self):
+        self.connection.close()
+
+class SQLiteBackend(SQLBackend):
+    dialect = 'sqlite'
+
+    def __init__(self, path=SQLITE_PATH):
+        # Autocommit mode so transaction() controls BEGIN / COMMIT itself
+        super().__init__(sqlite3.connect(path, isolation_level=None, check_same_thread=False))
+
+    def table_columns(self, table_name):
+        return [row[1] for row in self.connection.execute(f"PRAGMA table_info({self.quote(table_name)})")]
+
+class DuckDBBackend(SQLBackend):
+    dialect = 'duckdb'
+
+    def __init__(self, path=DUCKDB_PATH):
+        try:
+            import duckdb
+        except ImportError as e:
+            raise ImportError("The duckdb backend needs duckdb (pip install duckdb)") from e
+        super().__init__(duckdb.connect(path))
+
+    def table_columns(self, table_name):
+        rows = self.connection.execute(
+            "SELECT column_name FROM information_schema.columns WHERE table_name = ?", [table_name]
+        ).fetchall()
+        return [row[0] for row in rows]
+
+BACKENDS = {
+    'supabase': SupabaseBackend,
+    'postgres': PostgresBackend,
+    'sqlite': SQLiteBackend,
+    'duckdb': DuckDBBackend
+}
+
+def create_backend(name=DB_BACKEND, **kwargs):
+    """Instantiate a backend by name ('supabase', 'postgres', 'sqlite' or 'duckdb')."""
+    if name not in BACKENDS:
+        raise ValueError(f"Unknown database backend {name!r}, expected one of {', '.join(BACKENDS)}")
+    return BACKENDS[name](**kwargs)
@@ -0,0 +1,156 @@
+import sys
+import argparse
+from fbref.final_columns import TABLE_COLUMNS
+from config.db_config import SEASON
+
+# Primary key and foreign keys (column -> referenced table) of the core tables
+CORE_TABLES = {
+    'leagues': ('league_id', {}),
+    'teams': ('team_id', {'league_id': 'leagues'}),
+    'players': ('player_id', {'team_id': 'teams'})
+}
+
+# Columns DataInserter adds to every stat row at load time
+STAT_CONTEXT_COLUMNS = {'league_id': 'Int64', 'season': 'string'}
+
+# League ids as created by RegroupData.create_league_table
+LEAGUE_IDS = {'Bundesliga': 1, 'La_Liga': 2, 'Ligue_1': 3, 'Premier_League': 4, 'Serie_A': 5}
+
+# pandas dtype -> SQL type per dialect; id columns are always BIGINT
+SQL_TYPES = {
+    'postgres': {'int': 'INTEGER', 'float': 'DOUBLE PRECISION', 'string': 'TEXT', 'id': 'BIGINT'},
+    'duckdb': {'int': 'INTEGER', 'float': 'DOUBLE', 'string': 'TEXT', 'id': 'BIGINT'},
+    'sqlite': {'int': 'INTEGER', 'float': 'REAL', 'string': 'TEXT', 'id': 'INTEGER'}
+}
+
+PARTITIONS = (None, 'league', 'league_season')
+
+def quote(name):
+    return '"' + name.replace('"', '""') + '"'
+
+def sql_type(column, dtype, dialect):
+    types = SQL_TYPES[dialect]
+    if column.endswith('_id'):
+        return types['id']
+    if dtype.lower().startswith('int'):
+        return types['int']
+    if dtype.startswith('float'):
+        return types['float']
+    return types['string']
+
+def table_keys(table):
+    """Return (primary key, {column: referenced table}) of a final_data table."""
+    if table in CORE_TABLES:
+        return CORE_TABLES[table]
+    entity = 'player_id' if table.startswith('player_') else 'team_id'
+    return 'stat_id', {entity: entity[:-len('_id')] + 's', 'league_id': 'leagues'}
+
+def table_columns(table):
+    """Schema columns of a table: the transform's columns plus the load context of stat tables."""
+    columns = dict(TABLE_COLUMNS[table])
+    if table not in CORE_TABLES:
+        columns.update(STAT_CONTEXT_COLUMNS)
+    return columns
+
+def conflict_columns(table, partition=None):
+    """Primary key columns of a table: a partitioned stat table adds its partition columns to stat_id.
+
+    Upserts must name exactly these columns, as PostgreSQL has no unique constraint on stat_id alone there.
+    """
+    primary_key, _ = table_keys(table)
+    if partition is None or table in CORE_TABLES:
+        return [primary_key]
+    return [primary_key] + (['league_id'] if partition == 'league' else ['league_id', 'season'])
+
+def partition_statements(table, partition, seasons):
+    """CREATE TABLE ... PARTITION OF statements for one league (and season) per partition."""
+    statements = []
+    for league, league_id in LEAGUE_IDS.items():
+        child = f"{table}_{league.lower()}"
+        if partition == 'league':
+            statements.append(f"CREATE TABLE IF NOT EXISTS {quote(child)} PARTITION OF {quote(table)} "
+                              f"FOR VALUES IN ({league_id});")
+            continue
+        statements.append(f"CREATE TABLE IF NOT EXISTS {quote(child)} PARTITION OF {quote(table)} "
+                          f"FOR VALUES IN ({league_id}) PARTITION BY LIST (season);")
+        for season in seasons:
+            statements.append(f"CREATE TABLE IF NOT EXISTS {quote(child + '_' + season.replace('-', '_'))} "
+                              f"PARTITION OF {quote(child)} FOR VALUES IN ('{season}');")
+        statements.append(f"CREATE TABLE IF NOT EXISTS {quote(child + '_default')} PARTITION OF {quote(child)} DEFAULT;")
+    return statements
+
+def create_table_statements(table, dialect='postgres', partition=None, seasons=(SEASON,)):
+    """CREATE TABLE and CREATE INDEX statements for one table.
+
+    partition ('league' or 'league_season', PostgreSQL only) list-partitions stat tables by league_id
+    and optionally season. PostgreSQL requires the partition columns in the primary key, so partitioned
+    stat tables are keyed on (stat_id, league_id[, season]) instead of stat_id alone.
+    """
+    if partition not in PARTITIONS:
+        raise ValueError(f"Unknown partitioning {partition!r}, expected one of {PARTITIONS}")
+    if partition and dialect != 'postgres':
+        raise ValueError(f"Partitioning is only supported for postgres, not {dialect}")
+
+    _, foreign_keys = table_keys(table)
+    columns = table_columns(table)
+    partitioned = partition is not None and table not in CORE_TABLES
+    key_columns = conflict_columns(table, partition)
+
+    definitions = [f"{quote(col)} {sql_type(col, dtype, dialect)}" + (' NOT NULL' if col in key_columns else '')
+                   for col, dtype in columns.items()]
+    definitions.append(f"PRIMARY KEY ({', '.join(quote(col) for col in key_columns)})")
+    for column, parent in foreign_keys.items():
+        parent_key = CORE_TABLES[parent][0]
+        definitions.append(f"FOREIGN KEY ({quote(column)}) REFERENCES {quote(parent)} ({quote(parent_key)})")
+
+    create = f"CREATE TABLE IF NOT EXISTS {quote(table)} (\n    " + ',\n    '.join(definitions) + "\n)"
+    if partitioned:
+        create += " PARTITION BY LIST (league_id)"
+    statements = [create + ';']
+    if partitioned:
+        statements += partition_statements(table, partition, seasons)
+
+    # Dashboard lookups: one entity's rows for a season, and every row of a league
+    if table in CORE_TABLES:
+        index_columns = [[col] for col in foreign_keys]
+    else:
+        entity = next(col for col in foreign_keys if col != 'league_id')
+        index_columns = [[entity, 'season'], ['league_id', 'season']]
+    for cols in index_columns:
+        name = f"idx_{table}_{'_'.join(cols)}"
+        statements.append(f"CREATE INDEX IF NOT EXISTS {quote(name)} ON {quote(table)} "
+                          f"({', '.join(quote(col) for col in cols)});")
+    return statements
+
+def schema_statements(dialect='postgres', partition=None, seasons=(SEASON,), tables=None):
+    """Every statement of the schema, core tables first so foreign keys resolve."""
+    tables = tables or list(CORE_TABLES) + [table for table in TABLE_COLUMNS if table not in CORE_TABLES]
+    statements = []
+    for table in tables:
+        statements += create_table_statements(table, dialect, partition, seasons)
+    return statements
+
+def create_schema(backend, partition=None, seasons=(SEASON,)):
+    """Create every table and index through a DataInserter backend.
+
+    Raises RuntimeError for backends that cannot run DDL, such as the Supabase REST API.
+    """
+    if not backend.supports_ddl:
+        raise RuntimeError(f"{type(backend).__name__} cannot run DDL, paste the output of "
+                           f"`python -m database.db_creation --dialect {backend.dialect}` into its SQL editor instead")
+    statements = schema_statements(backend.dialect, partition, seasons)
+    backend.execute_ddl(statements)
+    return statements
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Print the CREATE TABLE statements of the final_data schema")
+    parser.add_argument('--dialect', choices=list(SQL_TYPES), default='postgres')
+    parser.add_argument('--partition', choices=[p for p in PARTITIONS if p], default=None,
+                        help="Load with the same FBREF_DB_PARTITION, so upserts match the partitioned keys")
+    parser.add_argument('--season', action='append', dest='seasons', help="Season partition to create (repeatable)")
+    args = parser.parse_args(argv)
+    for statement in schema_statements(args.dialect, args.partition, tuple(args.seasons or [SEASON])):
+        sys.stdout.write(statement + '\n\n')
+
+if __name__ == "__main__":
+    main()
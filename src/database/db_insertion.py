@@ -1,32 +1,67 @@
 import os
+import time
 import pandas as pd
-import uuid
-from supabase import create_client, Client
-from database.db_connection import DatabaseConnection
+from config.db_config import UPSERT_BATCH_SIZE, FINAL_DATA_FOLDER, LOAD_MAX_WORKERS, SEASON, DB_PARTITION
+from database.db_backends import create_backend
+from database.load_runner import LoadRunner, CORE_DEPENDENCIES
+from database.db_creation import LEAGUE_IDS, conflict_columns
+from fbref.cleaning_specs import LEAGUES
+from fbref.final_data_transformation import table_key
+from fbref.id_resolver import stat_ids
+from fbref.storage import TableStorage
+from fbref.seasons import partition_dir
 
-class DataInserter:
-    def __init__(self):
-        self.db = DatabaseConnection().get_client()
+# Inserted first, in this order, from final_data/First_Tables
+ESSENTIAL_FILES = ['leagues.csv', 'teams.csv', 'players.csv']
+
+# final_data file -> (table, primary key); squad files are listed without their league prefix
+FILE_TO_TABLE_MAP = {
+    'leagues.csv': ('leagues', 'league_id'),
+    'teams.csv': ('teams', 'team_id'),
+    'players.csv': ('players', 'player_id'),
+    'Squad_Advanced_Goalkeeping_cleaned.csv': ('team_advanced_goalkeeping', 'stat_id'),
+    'Squad_Defensive_Actions_cleaned.csv': ('team_defensive_actions', 'stat_id'),
+    'Squad_Goal_and_Shot_Creation_cleaned.csv': ('team_goal_and_shot_creation', 'stat_id'),
+    'Squad_Goalkeeping_cleaned.csv': ('team_goalkeeping', 'stat_id'),
+    'Squad_Miscellaneous_Stats_cleaned.csv': ('team_miscellaneous_stats', 'stat_id'),
+    'Squad_Pass_Types_cleaned.csv': ('team_pass_types', 'stat_id'),
+    'Squad_Passing_cleaned.csv': ('team_passing', 'stat_id'),
+    'Squad_Playing_Time_cleaned.csv': ('team_playing_time', 'stat_id'),
+    'Squad_Possession_cleaned.csv': ('team_possession', 'stat_id'),
+    'Squad_Shooting_cleaned.csv': ('team_shooting', 'stat_id'),
+    'Squad_Standard_Stats_cleaned.csv': ('team_standard_stats', 'stat_id'),
+    'Defense_cleaned.csv': ('player_defensive_actions', 'stat_id'),
+    'Gca_cleaned.csv': ('player_goal_and_shot_creation', 'stat_id'),
+    'Keeper_Adv_cleaned.csv': ('player_advanced_goalkeeping', 'stat_id'),
+    'Keeper_cleaned.csv': ('player_goalkeeping', 'stat_id'),
+    'Misc_cleaned.csv': ('player_miscellaneous_stats', 'stat_id'),
+    'Passing_cleaned.csv': ('player_passing', 'stat_id'),
+    'Passing_Types_cleaned.csv': ('player_pass_types', 'stat_id'),
+    'Playing_Time_cleaned.csv': ('player_playing_time', 'stat_id'),
+    'Possession_cleaned.csv': ('player_possession', 'stat_id'),
+    'Shooting_cleaned.csv': ('player_shooting', 'stat_id'),
+    'Standard_cleaned.csv': ('player_standard_stats', 'stat_id'),
+}
 
-    def generate_unique_stat_id(self):
-        """Generate a unique stat_id using UUID."""
-        return uuid.uuid4().int  # Generates a unique integer ID
+class DataInserter:
+    def __init__(self, backend=None, storage=None, season=None, partition=DB_PARTITION):
+        self.backend = backend or create_backend()  # Supabase unless FBREF_DB_BACKEND says otherwise
+        self.storage = storage or TableStorage()  # Format the final_data tables were written in
+        self.season = season or SEASON  # Season the stat rows of this inserter's files belong to
+        self.partition = partition  # Partitioning of the target schema, see database.db_creation
+        self.db = getattr(self.backend, 'client', None)  # Supabase client used by insert_csv_to_table
 
-    def insert_csv_to_table(self, csv_path, table_name, primary_key_field):
-        # Read the CSV file using pandas
-        df = pd.read_csv(csv_path)
+    def insert_csv_to_table(self, csv_path, table_name, primary_key_field, league=None):
+        # Read the CSV file using pandas, filling missing stat_ids with their deterministic keys
+        df = self.prepare_frame(self.storage.read(csv_path), table_name, primary_key_field,
+                                league, table_key(os.path.basename(csv_path), league))
 
         # Convert the dataframe to a list of dictionaries for inserting into Supabase
         data_to_insert = df.to_dict(orient='records')
 
-        # Assign unique 'stat_id' for tables that use 'stat_id' if missing
         for record in data_to_insert:
             primary_key_value = record.get(primary_key_field)
 
-            # If stat_id is missing or NaN, generate a unique one using UUID
-            if primary_key_field == 'stat_id' and (pd.isna(primary_key_value) or primary_key_value is None):
-                record['stat_id'] = self.generate_unique_stat_id()
-
             # Skip records where the primary key is None or NaN
             if primary_key_value is None or pd.isna(primary_key_value):
                 print(f"Skipping record with no {primary_key_field} in {table_name}")
@@ -46,63 +81,99 @@ class DataInserter:
                 else:
                     print(f"Failed to insert data into {table_name}: {response.error}")
 
-    def bulk_insert(self, essential_files, other_files):
-        # Define the mapping of CSV file paths to their corresponding table names and primary keys
-        file_to_table_map = {
-            'leagues.csv': ('leagues', 'league_id'),
-            'teams.csv': ('teams', 'team_id'),
-            'players.csv': ('players', 'player_id'),
-            'Bundesliga_Squad_Advanced_Goalkeeping_cleaned.csv': ('team_advanced_goalkeeping', 'stat_id'),
-            'Bundesliga_Squad_Defensive_Actions_cleaned.csv': ('team_defensive_actions', 'stat_id'),
-            'Bundesliga_Squad_Goal_and_Shot_Creation_cleaned.csv': ('team_goal_and_shot_creation', 'stat_id'),
-            'Bundesliga_Squad_Goalkeeping_cleaned.csv': ('team_goalkeeping', 'stat_id'),
-            'Bundesliga_Squad_Miscellaneous_Stats_cleaned.csv': ('team_miscellaneous_stats', 'stat_id'),
-            'Bundesliga_Squad_Pass_Types_cleaned.csv': ('team_pass_types', 'stat_id'),
-            'Bundesliga_Squad_Passing_cleaned.csv': ('team_passing', 'stat_id'),
-            'Bundesliga_Squad_Playing_Time_cleaned.csv': ('team_playing_time', 'stat_id'),
-            'Bundesliga_Squad_Possession_cleaned.csv': ('team_possession', 'stat_id'),
-            'Bundesliga_Squad_Shooting_cleaned.csv': ('team_shooting', 'stat_id'),
-            'Bundesliga_Squad_Standard_Stats_cleaned.csv': ('team_standard_stats', 'stat_id'),
-            'Defense_cleaned.csv': ('player_defensive_actions', 'stat_id'),
-            'Gca_cleaned.csv': ('player_goal_and_shot_creation', 'stat_id'),
-            'Keeper_Adv_cleaned.csv': ('player_goalkeeping', 'stat_id'),
-            'Keeper_cleaned.csv': ('player_goalkeeping', 'stat_id'),
-            'Misc_cleaned.csv': ('player_miscellaneous_stats', 'stat_id'),
-            'Passing_cleaned.csv': ('player_passing', 'stat_id'),
-            'Passing_Types_cleaned.csv': ('player_pass_types', 'stat_id'),
-            'Playing_Time_cleaned.csv': ('player_playing_time', 'stat_id'),
-            'Possession_cleaned.csv': ('player_possession', 'stat_id'),
-            'Shooting_cleaned.csv': ('player_shooting', 'stat_id'),
-            'Standard_cleaned.csv': ('player_standard_stats', 'stat_id'),
-        }
-
-        # Insert essential files first (leagues, teams, players)
-        essential_files_order = ['leagues.csv', 'teams.csv', 'players.csv']
-        for essential_file in essential_files_order:
-            essential_path = os.path.join(r"C:\Users\asus\Desktop\Football_project\final_data\First_Tables", essential_file)
-            if essential_file in file_to_table_map:
-                table_name, primary_key_field = file_to_table_map[essential_file]
-                print(f"Inserting {essential_file} into {table_name}")
-                self.insert_csv_to_table(essential_path, table_name, primary_key_field)
+    def prepare_frame(self, df, table_name, primary_key_field, league=None, source=None, season=None):
+        """Fill missing stat_ids and drop rows without a primary key; season defaults to the inserter's."""
+        season = season or self.season
+        if primary_key_field == 'stat_id':
+            existing = pd.to_numeric(df['stat_id'], errors='coerce').astype('Int64')
+            if existing.isna().any():
+                existing = existing.fillna(stat_ids(df, league, season, source or table_name))
+            df['stat_id'] = existing.astype('int64')
+
+            # League and season the schema indexes (and optionally partitions) stat tables on
+            df['league_id'] = pd.array([LEAGUE_IDS.get(league)] * len(df), dtype='Int64')
+            df['season'] = season
+
+        # Rows without a primary key cannot be upserted
+        has_key = df[primary_key_field].notna()
+        if not has_key.all():
+            print(f"Skipping {(~has_key).sum()} records with no {primary_key_field} in {table_name}")
+            df = df[has_key]
+        return df
+
+    def upsert_csv_to_table(self, csv_path, table_name, primary_key_field, batch_size=UPSERT_BATCH_SIZE,
+                            on_conflict=None, backend=None, league=None):
+        """Upsert a CSV in chunks of batch_size rows, one backend call per chunk.
+
+        on_conflict names the key column(s) existing rows are matched on (the primary key by default,
+        plus league_id / season on a partitioned schema), so re-running a load updates rows instead of
+        checking for them one by one. backend overrides the inserter's own backend (loader threads
+        pass theirs). league feeds the stat_id keys of the file's rows.
+        """
+        df = self.prepare_frame(self.storage.read(csv_path), table_name, primary_key_field,
+                                league, table_key(os.path.basename(csv_path), league))
+        on_conflict = on_conflict or [primary_key_field] + conflict_columns(table_name, self.partition)[1:]
+        backend = backend or self.backend
+
+        start = time.perf_counter()
+        with backend.transaction():
+            for chunk_start in range(0, len(df), batch_size):
+                chunk = df.iloc[chunk_start:chunk_start + batch_size]
+                chunk_timer = time.perf_counter()
+                backend.upsert(table_name, chunk, on_conflict)
+                latency = time.perf_counter() - chunk_timer
+                rate = len(chunk) / latency if latency > 0 else 0.0
+                print(f"Upserted rows {chunk_start + 1}-{chunk_start + len(chunk)} into {table_name} "
+                      f"in {latency * 1000:.0f} ms ({rate:.0f} rows/s)")
+
+        elapsed = time.perf_counter() - start
+        rate = len(df) / elapsed if elapsed > 0 else 0.0
+        print(f"Upserted {len(df)} rows into {table_name} in {elapsed:.2f}s ({rate:.0f} rows/s)")
+        return {'table': table_name, 'rows': len(df), 'elapsed': elapsed, 'rows_per_second': rate}
+
+    def table_for_file(self, file_name, league=None):
+        """Return (table, primary key) for a final_data file, or None when it is not loaded.
+
+        Squad files carry their league as a prefix (Bundesliga_Squad_Passing_cleaned.csv).
+        """
+        if league and file_name.startswith(f"{league}_"):
+            file_name = file_name[len(league) + 1:]
+        return FILE_TO_TABLE_MAP.get(file_name)
+
+    def load_jobs(self, essential_files=None, other_files=None, final_data_folder=FINAL_DATA_FOLDER, leagues=LEAGUES,
+                  season=None):
+        """List the (path, table, key, league) jobs of a load: the first tables plus every league's stat files.
+
+        essential_files=[] leaves the first tables out; season reads the stat files of that season's
+        partition (final_data/<league>/<season>/) instead of final_data/<league>/.
+        """
+        jobs = []
+        for essential_file in ESSENTIAL_FILES if essential_files is None else essential_files:
+            mapping = self.table_for_file(essential_file)
+            if mapping:
+                jobs.append((os.path.join(final_data_folder, 'First_Tables', essential_file), *mapping, None))
             else:
                 print(f"No table mapping found for {essential_file}")
 
-        # Insert other league data into their respective tables after essential files
-        league_directories = [
-            r"C:\Users\asus\Desktop\Football_project\final_data\Bundesliga",
-            r"C:\Users\asus\Desktop\Football_project\final_data\Premier_League",
-            r"C:\Users\asus\Desktop\Football_project\final_data\Serie_A",
-            r"C:\Users\asus\Desktop\Football_project\final_data\La_Liga",
-            r"C:\Users\asus\Desktop\Football_project\final_data\Ligue_1",
-        ]
-
-        for league_dir in league_directories:
-            for other_file in os.listdir(league_dir):
-                other_path = os.path.join(league_dir, other_file)
-                file_name = os.path.basename(other_file)
-                if file_name in file_to_table_map:
-                    table_name, primary_key_field = file_to_table_map[file_name]
-                    print(f"Inserting {file_name} from {league_dir} into {table_name}")
-                    self.insert_csv_to_table(other_path, table_name, primary_key_field)
-                else:
+        for league in leagues:
+            league_dir = partition_dir(final_data_folder, league, season)
+            for file_name in self.storage.list_tables(league_dir):
+                if other_files is not None and file_name not in other_files:
+                    continue
+                mapping = self.table_for_file(file_name, league)
+                if mapping and mapping[0] not in CORE_DEPENDENCIES:
+                    jobs.append((os.path.join(league_dir, file_name), *mapping, league))
+                elif not mapping:
                     print(f"No table mapping found for {file_name}")
+        return jobs
+
+    def bulk_insert(self, essential_files, other_files, batch_size=UPSERT_BATCH_SIZE, max_workers=LOAD_MAX_WORKERS,
+                    final_data_folder=FINAL_DATA_FOLDER, manifest=None):
+        """Load leagues, teams and players, then every stat file concurrently.
+
+        other_files limits the stat files to the given names (None loads them all). With a StageManifest,
+        files unchanged since they were last loaded are not upserted again. Returns the load summary.
+        """
+        runner = LoadRunner(self, max_workers=max_workers, batch_size=batch_size, manifest=manifest)
+        runner.run(self.load_jobs(essential_files, other_files, final_data_folder))
+        return runner.summary
@@ -0,0 +1,199 @@
+import os
+import time
+import logging
+import threading
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from config.db_config import LOAD_MAX_WORKERS, LOAD_MAX_PER_TABLE, UPSERT_BATCH_SIZE
+from fbref import tracing
+
+# Foreign keys between the core tables; every stat table hangs off players or teams
+CORE_DEPENDENCIES = {
+    'leagues': [],
+    'teams': ['leagues'],
+    'players': ['teams']
+}
+
+def table_dependencies(table_name):
+    """Tables that must be loaded before table_name."""
+    if table_name in CORE_DEPENDENCIES:
+        return CORE_DEPENDENCIES[table_name]
+    if table_name.startswith('player_'):
+        return ['players']
+    if table_name.startswith('team_'):
+        return ['teams']
+    return []
+
+def dependency_levels(tables):
+    """Group tables into levels whose dependencies are all in earlier levels.
+
+    Dependencies that are not part of this load are assumed to be in the database already.
+    """
+    tables = set(tables)
+    pending = {table: {dep for dep in table_dependencies(table) if dep in tables} for table in tables}
+    levels = []
+    while pending:
+        ready = sorted(table for table, deps in pending.items() if not deps)
+        if not ready:
+            raise ValueError(f"Circular table dependencies between {', '.join(sorted(pending))}")
+        levels.append(ready)
+        for table in ready:
+            del pending[table]
+        for deps in pending.values():
+            deps.difference_update(ready)
+    return levels
+
+class LoadRunner:
+    def __init__(self, inserter, max_workers=LOAD_MAX_WORKERS, max_per_table=LOAD_MAX_PER_TABLE,
+                 batch_size=UPSERT_BATCH_SIZE, manifest=None):
+        self.inserter = inserter  # DataInserter whose backend receives the rows
+        self.manifest = manifest  # StageManifest of an incremental run: unchanged files are not upserted again
+        self.max_workers = max_workers
+        self.max_per_table = max_per_table  # Backpressure: concurrent files per target table
+        self.batch_size = batch_size
+        self.local = threading.local()
+        self.worker_backends = []
+        self.lock = threading.Lock()
+        self.summary = {}
+
+    def _worker_backend(self):
+        """The backend of the calling thread, created on its first load."""
+        backend = getattr(self.local, 'backend', None)
+        if backend is None:
+            backend = self.inserter.backend.for_worker()
+            self.local.backend = backend
+            with self.lock:
+                self.worker_backends.append(backend)
+        return backend
+
+    def _fingerprint(self, job):
+        """Manifest fingerprint of a job: the final file plus the target table, season and backend."""
+        path, table_name = job[0], job[1]
+        salt = f"{table_name}:{self.inserter.season}:{type(self.inserter.backend).__name__}"
+        return self.manifest.fingerprint(self.inserter.storage, [path], salt)
+
+    def _run_job(self, job):
+        """Upsert one (path, table, key, league) job and report its outcome instead of raising."""
+        path, table_name, primary_key_field, league = job
+        start = time.perf_counter()
+        result = {'path': path, 'table': table_name, 'status': 'loaded', 'rows': 0, 'error': None}
+        fingerprint = None
+        if self.manifest is not None:
+            fingerprint = self._fingerprint(job)
+            entry = self.manifest.fresh('load', league, os.path.basename(path), fingerprint)
+            if entry:
+                # Nothing is sent, so the file adds no rows to the load's throughput
+                result.update(status='unchanged', seconds=0.0)
+                return result
+        with tracing.span('load', league=league, file=os.path.basename(path), table=table_name) as span:
+            try:
+                stats = self.inserter.upsert_csv_to_table(path, table_name, primary_key_field, self.batch_size,
+                                                          backend=self._worker_backend(), league=league)
+                result['rows'] = stats['rows']
+                if self.manifest is not None:
+                    self.manifest.record('load', league, os.path.basename(path), fingerprint, [], result['rows'])
+            except Exception as e:
+                result['status'] = 'failed'
+                result['error'] = f"{type(e).__name__}: {e}"
+                if self.manifest is not None:
+                    self.manifest.forget('load', league, os.path.basename(path))
+        result['seconds'] = time.perf_counter() - start
+        # Rows upserted into the database are this job's rows out
+        result['trace'] = dict(span.event, status=result['status'], rows_out=result['rows'])
+        return result
+
+    def _run_level(self, executor, jobs, workers):
+        """Run one dependency level, keeping at most max_per_table files in flight per table."""
+        pending = list(jobs)
+        running = {}
+        in_flight = defaultdict(int)
+        results = []
+        while pending or running:
+            for job in list(pending):
+                if len(running) >= workers:
+                    break
+                if in_flight[job[1]] < self.max_per_table:
+                    pending.remove(job)
+                    in_flight[job[1]] += 1
+                    running[executor.submit(self._run_job, job)] = job
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                job = running.pop(future)
+                in_flight[job[1]] -= 1
+                results.append(future.result())
+        return results
+
+    def run(self, jobs):
+        """Load (path, table, key, league) jobs level by level and return the per-file results."""
+        jobs = list(jobs)
+        levels = dependency_levels({job[1] for job in jobs})
+        limit = self.inserter.backend.max_concurrency
+        workers = max(1, min(self.max_workers, limit or self.max_workers))
+        start = time.perf_counter()
+
+        results = []
+        failed_tables = set()
+        try:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                for level in levels:
+                    level_jobs = []
+                    for job in jobs:
+                        if job[1] not in level:
+                            continue
+                        # Skip tables whose parent rows did not make it into the database
+                        blocked = [dep for dep in table_dependencies(job[1]) if dep in failed_tables]
+                        if blocked:
+                            results.append({'path': job[0], 'table': job[1], 'status': 'skipped', 'rows': 0,
+                                            'seconds': 0.0, 'error': f"Depends on failed {', '.join(blocked)}"})
+                            failed_tables.add(job[1])
+                        else:
+                            level_jobs.append(job)
+                    level_results = self._run_level(executor, level_jobs, workers)
+                    failed_tables.update(r['table'] for r in level_results if r['status'] == 'failed')
+                    results.extend(level_results)
+        finally:
+            for backend in self.worker_backends:
+                if backend is not self.inserter.backend:
+                    backend.close()
+            self.worker_backends = []
+            if self.manifest is not None:
+                self.manifest.save()
+
+        elapsed = time.perf_counter() - start
+        self.summary = self.summarize(results, elapsed, workers)
+        return results
+
+    def summarize(self, results, elapsed, workers):
+        """Aggregate file results into counts, wall-clock and rows/s per target table."""
+        counts = {status: sum(1 for r in results if r['status'] == status)
+                  for status in ('loaded', 'unchanged', 'skipped', 'failed')}
+        tables = {}
+        for r in results:
+            stats = tables.setdefault(r['table'], {'files': 0, 'rows': 0, 'seconds': 0.0})
+            stats['files'] += 1
+            stats['rows'] += r['rows']
+            stats['seconds'] += r['seconds']
+        for stats in tables.values():
+            stats['rows_per_second'] = stats['rows'] / stats['seconds'] if stats['seconds'] > 0 else 0.0
+
+        rows = sum(r['rows'] for r in results)
+        summary = {
+            'files': len(results),
+            **counts,
+            'rows': rows,
+            'elapsed': elapsed,
+            'rows_per_second': rows / elapsed if elapsed > 0 else 0.0,
+            'workers': workers,
+            'tables': tables,
+            'errors': [(r['path'], r['error']) for r in results if r['status'] in ('skipped', 'failed')]
+        }
+
+        logging.info(f"Loaded {counts['loaded']}/{len(results)} files ({counts['unchanged']} unchanged, "
+                     f"{counts['skipped']} skipped, {counts['failed']} failed), {rows} rows in {elapsed:.2f}s with {workers} workers "
+                     f"({summary['rows_per_second']:.0f} rows/s)")
+        for table_name, stats in sorted(tables.items()):
+            logging.info(f"  {table_name}: {stats['rows']} rows from {stats['files']} files in "
+                         f"{stats['seconds']:.2f}s ({stats['rows_per_second']:.0f} rows/s)")
+        for path, error in summary['errors']:
+            logging.warning(f"{path}: {error}")
+        return summary
@@ -0,0 +1,26 @@
+import os
+import tempfile
+from contextlib import contextmanager
+
+@contextmanager
+def atomic_output(path, mode='w', **open_kwargs):
+    """Open a temp file next to path that replaces it only when the block completes.
+
+    A crash or exception leaves the previous file (or none) in place, never a half-written one.
+    """
+    directory = os.path.dirname(path) or '.'
+    os.makedirs(directory, exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(dir=directory, prefix=f".{os.path.basename(path)}.", suffix='.tmp')
+    try:
+        with os.fdopen(fd, mode, **open_kwargs) as f:
+            yield f
+        os.replace(temp_path, path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+def write_csv_atomic(df, path, **to_csv_kwargs):
+    """DataFrame.to_csv through atomic_output."""
+    with atomic_output(path, 'w', newline='', encoding='utf-8') as f:
+        df.to_csv(f, **to_csv_kwargs)
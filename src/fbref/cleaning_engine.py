@@ -0,0 +1,172 @@
+import os
+import pandas as pd
+from fbref.raw_tables import load_raw_table, display_columns
+from fbref.cleaning_specs import LEAGUES
+from fbref.storage import TableStorage
+from fbref.seasons import partition_dir
+
+# "27-123" -> years "27" and days "123"; the days part is absent on older pages
+AGE_PATTERN = r'^(?P<Age>[^-]*)(?:-(?P<Age_days>[^-]*))?'
+# "eng ENG" -> flag prefix "eng" and country code "ENG"; values without a space are kept whole
+NATION_PATTERN = r'^\s*(?:(?P<Nation_flag>.*?)\s+)?(?P<Nation>\S+)\s*$'
+
+# Identity column -> (pattern, column the extra part is stored in)
+IDENTITY_COLUMNS = {
+    'Age': (AGE_PATTERN, 'Age_days'),
+    'Nation': (NATION_PATTERN, 'Nation_flag')
+}
+
+class PlayerIdentityNormalizer:
+    """Vectorized Age / Nation parsing that reuses every value it has already parsed."""
+
+    def __init__(self):
+        self.cache = {}  # Identity column -> DataFrame of parsed parts indexed by the raw value
+
+    def parse(self, column, series):
+        """Return the parsed parts of a raw Age or Nation column, aligned with its index."""
+        raw = series.dropna().astype(str)
+        cached = self.cache.get(column)
+
+        # Only values never seen by an earlier table go through the regex
+        unseen = raw.unique() if cached is None else raw[~raw.isin(cached.index)].unique()
+        if len(unseen):
+            parsed = pd.Series(unseen, index=unseen).str.extract(IDENTITY_COLUMNS[column][0])
+            cached = parsed if cached is None else pd.concat([cached, parsed])
+            self.cache[column] = cached
+
+        parts = cached.reindex(raw.values)
+        parts.index = raw.index
+        return parts.reindex(series.index)
+
+    def normalize(self, df):
+        """Keep the integer years of "Age" and the country code of "Nation", adding "Age_days" and "Nation_flag"."""
+        for column, (_, extra_column) in IDENTITY_COLUMNS.items():
+            if column not in df.columns:
+                continue
+            parts = self.parse(column, df[column])
+            df[column] = parts[column]
+            extra = parts[extra_column]
+            if extra_column == 'Age_days':
+                df[column] = pd.to_numeric(df[column], errors='coerce').astype('Int64')
+                extra = pd.to_numeric(extra, errors='coerce').astype('Int64')
+            df.insert(df.columns.get_loc(column) + 1, extra_column, extra)
+        return df
+
+def to_numeric_block(df, string_columns, label=''):
+    """Convert every non-string column to numbers in one pass, filling unparseable cells with 0.
+
+    Columns whose name is duplicated are left untouched, as they cannot be addressed by name.
+    """
+    names = list(df.columns)
+    counts = pd.Series(names).value_counts()
+    for name in counts[counts > 1].index:
+        if name not in string_columns:
+            print(f"Error converting column {name} in {label}: duplicate column name")
+
+    positions = [i for i, name in enumerate(names) if name not in string_columns and counts[name] == 1]
+    if not positions:
+        return df
+
+    # Work on positional labels so the block assignment never trips over duplicate names
+    df = df.copy()
+    df.columns = range(len(names))
+    df[positions] = df[positions].apply(pd.to_numeric, errors='coerce').fillna(0)
+    df.columns = names
+    return df
+
+class CleaningEngine:
+    def __init__(self, data_folder, cleaned_data_folder, specs, leagues=LEAGUES, storage=None, season=None):
+        self.data_folder = data_folder
+        self.cleaned_data_folder = cleaned_data_folder
+        self.specs = specs  # {table name: spec}, see fbref.cleaning_specs
+        self.leagues = leagues
+        self.identity = PlayerIdentityNormalizer()  # Shared by the tables this engine (or its worker copy) cleans
+        self.storage = storage or TableStorage()  # Format raw tables are read and cleaned tables written in
+        self.season = season  # Tables live in <folder>/<league>/<season>/ when set, <folder>/<league>/ otherwise
+
+    def source_path(self, table, league):
+        return os.path.join(partition_dir(self.data_folder, league, self.season), self.specs[table]['source'].format(league=league))
+
+    def output_path(self, table, league):
+        return os.path.join(partition_dir(self.cleaned_data_folder, league, self.season), self.specs[table]['output'].format(league=league))
+
+    def fingerprint(self, table, league, manifest):
+        """Manifest fingerprint of a job: the raw table (and its header sidecar) plus the table spec."""
+        return manifest.fingerprint(self.storage, [self.source_path(table, league)], repr(self.specs[table]))
+
+    def clean_frame(self, table, df, display_headers, league=''):
+        """Apply a table spec to a raw frame and its (group, label) headers."""
+        spec = self.specs[table]
+
+        # Remove specific columns under a header group, then flatten to (suffixed) labels
+        drop_headers = set(spec.get('drop_headers', []))
+        if drop_headers:
+            positions = [i for i, header in enumerate(display_headers) if header not in drop_headers]
+            df = df.iloc[:, positions]
+            display_headers = [display_headers[i] for i in positions]
+        df = df.copy()
+        df.columns = display_columns(display_headers, spec.get('group_suffixes'))
+
+        if 'keep' in spec:
+            df = df.loc[:, df.columns.intersection(spec['keep'])]
+
+        drop = [col for col in df.columns if col in spec.get('drop', [])]
+        if drop:
+            df = df.drop(columns=drop)
+
+        if spec.get('player_identity'):
+            df = self.identity.normalize(df)
+
+        names = list(df.columns)
+        if 'duplicate_suffix' in spec:
+            # The 2nd and later occurrences of a label belong to a later header group
+            suffix, labels = spec['duplicate_suffix']
+            seen = set()
+            for i, name in enumerate(names):
+                if name in labels and name in seen:
+                    names[i] = f"{name}{suffix}"
+                seen.add(name)
+        renames = spec.get('rename', {})
+        names = [renames.get(name, name) for name in names]
+        df.columns = names
+
+        df = to_numeric_block(df, spec['string_columns'], league)
+
+        if 'fill_value' in spec:
+            df = df.fillna(spec['fill_value'])
+        return df
+
+    def clean_to_file(self, table, league):
+        """Clean one league's table and return (cleaned file path, row count).
+
+        Raises FileNotFoundError when the raw table is missing.
+        """
+        league_path = self.source_path(table, league)
+        if not self.storage.exists(league_path):
+            raise FileNotFoundError(league_path)
+
+        df, display_headers = load_raw_table(league_path, self.storage)
+        df = self.clean_frame(table, df, display_headers, league)
+
+        # Save the cleaned DataFrame next to the other cleaned tables
+        cleaned_file_path = self.storage.write(df, self.output_path(table, league))
+        return cleaned_file_path, len(df)
+
+    def clean_table(self, table, league):
+        """Clean one league's table and return the cleaned file path, or None if the source is missing."""
+        try:
+            cleaned_file_path, _ = self.clean_to_file(table, league)
+        except FileNotFoundError as e:
+            print(f"File {e} does not exist. Skipping this league.")
+            return None
+        print(f"Cleaned data saved to {cleaned_file_path}")
+        return cleaned_file_path
+
+    def jobs(self, tables=None):
+        """List the (league, table) pairs of a run, tables in spec order."""
+        tables = tables or list(self.specs)
+        return [(league, table) for table in tables for league in self.leagues]
+
+    def run(self, tables=None):
+        """Clean every table (or the given ones) for every league in one pass."""
+        return {(league, table): self.clean_table(table, league) for league, table in self.jobs(tables)}
@@ -0,0 +1,121 @@
+import os
+import time
+import logging
+from concurrent.futures import ProcessPoolExecutor
+from config.fbref_config import CLEAN_MAX_WORKERS
+from fbref import tracing
+
+def run_cleaning_job(cleaner, league, table):
+    """Clean one (league, table) job and report its outcome instead of raising."""
+    start = time.perf_counter()
+    result = {'league': league, 'table': table, 'status': 'cleaned', 'output': None, 'rows': 0, 'error': None}
+    with tracing.span('clean', league=league, table=table) as span:
+        try:
+            result['output'], result['rows'] = cleaner.clean_to_file(table, league)
+        except FileNotFoundError as e:
+            result['status'] = 'skipped'
+            result['error'] = f"Missing source file {e}"
+        except Exception as e:
+            result['status'] = 'failed'
+            result['error'] = f"{type(e).__name__}: {e}"
+    result['seconds'] = time.perf_counter() - start
+    result['trace'] = dict(span.event, status=result['status'])
+    return result
+
+def run_cleaning_batch(cleaner, jobs):
+    """Clean several (league, table) jobs of one cleaner in order, so they share its Age / Nation parse cache."""
+    return [run_cleaning_job(cleaner, league, table) for league, table in jobs]
+
+class CleaningRunner:
+    def __init__(self, cleaners, max_workers=CLEAN_MAX_WORKERS, manifest=None):
+        self.cleaners = cleaners  # CleaningEngine instances, e.g. DataCleaner and PlayerDataCleaner
+        self.max_workers = max_workers
+        self.manifest = manifest  # StageManifest of an incremental run: unchanged raw tables are not cleaned again
+        self.summary = {}
+
+    def jobs(self):
+        """Every (cleaner, league, table) job, in the order a serial run would clean them."""
+        return [(cleaner, league, table) for cleaner in self.cleaners for league, table in cleaner.jobs()]
+
+    def _manifest_table(self, cleaner, league, table):
+        return os.path.basename(cleaner.output_path(table, league))
+
+    def _unchanged(self, job, fingerprint):
+        """The result of a job the manifest says is up to date, or None."""
+        cleaner, league, table = job
+        entry = self.manifest.fresh('clean', league, self._manifest_table(cleaner, league, table), fingerprint,
+                                    cleaner.storage)
+        if entry is None:
+            return None
+        return {'league': league, 'table': table, 'status': 'unchanged', 'output': entry['outputs'][0],
+                'rows': entry['rows'], 'error': None, 'seconds': 0.0}
+
+    def run(self):
+        """Clean every job on a process pool and return the per-job results in job order."""
+        jobs = self.jobs()
+        start = time.perf_counter()
+
+        results = [None] * len(jobs)
+        fingerprints = {}
+        if self.manifest is not None:
+            for i, job in enumerate(jobs):
+                fingerprints[i] = job[0].fingerprint(job[2], job[1], self.manifest)
+                results[i] = self._unchanged(job, fingerprints[i])
+        pending = [i for i, result in enumerate(results) if result is None]
+
+        if self.max_workers <= 1:
+            for i in pending:
+                results[i] = run_cleaning_job(*jobs[i])
+        else:
+            # A worker receives a pickled copy of the cleaner, so each league's tables go to one worker
+            # together and reuse the player names the first of them parsed
+            batches = {}
+            for i in pending:
+                cleaner, league, table = jobs[i]
+                batches.setdefault((id(cleaner), league), []).append(i)
+            with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
+                futures = {tuple(batch): executor.submit(run_cleaning_batch, jobs[batch[0]][0],
+                                                         [jobs[i][1:] for i in batch])
+                           for batch in batches.values()}
+                for batch, future in futures.items():
+                    for i, result in zip(batch, future.result()):
+                        results[i] = result
+
+        if self.manifest is not None:
+            for i in pending:
+                cleaner, league, table = jobs[i]
+                manifest_table = self._manifest_table(cleaner, league, table)
+                if results[i]['status'] == 'cleaned':
+                    self.manifest.record('clean', league, manifest_table, fingerprints[i],
+                                         [results[i]['output']], results[i]['rows'])
+                else:
+                    self.manifest.forget('clean', league, manifest_table)
+            self.manifest.save()
+
+        elapsed = time.perf_counter() - start
+        self.summary = self.summarize(results, elapsed)
+        return results
+
+    def summarize(self, results, elapsed):
+        """Aggregate job results into counts, timings and the list of problems."""
+        counts = {status: sum(1 for r in results if r['status'] == status)
+                  for status in ('cleaned', 'unchanged', 'skipped', 'failed')}
+        job_seconds = sum(r['seconds'] for r in results)
+        slowest = max(results, key=lambda r: r['seconds'], default=None)
+        summary = {
+            'jobs': len(results),
+            **counts,
+            'rows': sum(r['rows'] for r in results),
+            'elapsed': elapsed,
+            'job_seconds': job_seconds,
+            'workers': self.max_workers,
+            'slowest': (slowest['league'], slowest['table'], slowest['seconds']) if slowest else None,
+            'errors': [(r['league'], r['table'], r['error']) for r in results if r['status'] in ('skipped', 'failed')]
+        }
+
+        logging.info(f"Cleaned {counts['cleaned']}/{len(results)} tables ({counts['unchanged']} unchanged, "
+                     f"{counts['skipped']} skipped, {counts['failed']} failed) in {elapsed:.2f}s with {self.max_workers} workers "
+                     f"({job_seconds:.2f}s of job time)")
+        for league, table, error in summary['errors']:
+            logging.warning(f"{league} / {table}: {error}")
+        return summary
@@ -0,0 +1,201 @@
+# Declarative specs for the cleaning engine, one per raw table.
+#
+# Keys a spec can use (all optional except source/output/string_columns):
+#   source            raw file name inside <data_folder>/<league>/, may use {league}
+#   output            cleaned file name inside <cleaned_data_folder>/<league>/, may use {league}
+#   group_suffixes    level-0 header group -> suffix appended to its labels (e.g. 'Total' -> '_total')
+#   drop_headers      (group, label) pairs removed before flattening
+#   keep              keep-list applied with Index.intersection after flattening
+#   drop              flat column names removed (every occurrence)
+#   player_identity   split Age into years + Age_days and Nation into code + Nation_flag
+#   duplicate_suffix  (suffix, labels): 2nd+ occurrence of each label gets the suffix
+#   rename            label -> new name for every occurrence
+#   string_columns    columns left as text; everything else is converted to numbers
+#   fill_value        value used to fill the remaining NaNs before saving
+
+LEAGUES = ['Bundesliga', 'Premier_League', 'Serie_A', 'La_Liga', 'Ligue_1']
+
+# Labels repeated under "Per 90 Minutes" in the standard stats tables
+PER_90_COLUMNS = ['Gls', 'Ast', 'G+A', 'G-PK', 'G+A-PK', 'xG', 'xAG', 'xG+xAG', 'npxG', 'npxG+xAG']
+
+SQUAD_STRING_COLUMNS = ['Squad']
+PLAYER_STRING_COLUMNS = ['Player', 'Nation', 'Nation_flag', 'Pos', 'Squad']
+
+PASSING_SUFFIXES = {'Total': '_total', 'Short': '_short', 'Medium': '_medium', 'Long': '_long'}
+CREATION_SUFFIXES = {'SCA Types': '_sca', 'GCA Types': '_gca'}
+DEFENSE_SUFFIXES = {'Tackles': '_tackles', 'Challenges': '_challenges', 'Blocks': '_blocks'}
+
+SQUAD_TABLE_SPECS = {
+    'Squad_Standard_Stats': {
+        'source': '{league}_Squad_Standard_Stats.csv',
+        'output': '{league}_Squad_Standard_Stats_cleaned.csv',
+        'keep': [
+            'Squad', '# Pl', 'Age', 'Poss', 'MP', 'Starts', 'Min', '90s',
+            'Gls', 'Ast', 'G+A', 'G-PK', 'PK', 'PKatt', 'CrdY', 'CrdR',
+            'xG', 'npxG', 'xAG', 'npxG+xAG', 'PrgC', 'PrgP'
+        ] + PER_90_COLUMNS,
+        'duplicate_suffix': ('_per_90', PER_90_COLUMNS),
+        'string_columns': SQUAD_STRING_COLUMNS
+    },
+    'Squad_Goalkeeping': {
+        'source': '{league}_Squad_Goalkeeping.csv',
+        'output': '{league}_Squad_Goalkeeping_cleaned.csv',
+        # Everything under "Penalty Kicks" is left out
+        'keep': [
+            'Squad', '# Pl', 'MP', 'Starts', 'Min', '90s', 'GA', 'GA90',
+            'SoTA', 'Saves', 'Save%', 'W', 'D', 'L', 'CS', 'CS%'
+        ],
+        'string_columns': SQUAD_STRING_COLUMNS
+    },
+    'Squad_Advanced_Goalkeeping': {
+        'source': '{league}_Squad_Advanced_Goalkeeping.csv',
+        'output': '{league}_Squad_Advanced_Goalkeeping_cleaned.csv',
+        'drop_headers': [('Goal Kicks', 'Att'), ('Goal Kicks', 'Launch%'), ('Goal Kicks', 'AvgLen')],
+        'string_columns': SQUAD_STRING_COLUMNS
+    },
+    'Squad_Shooting': {
+        'source': '{league}_Squad_Shooting.csv',
+        'output': '{league}_Squad_Shooting_cleaned.csv',
+        'string_columns': SQUAD_STRING_COLUMNS
+    },
+    'Squad_Passing': {
+        'source': '{league}_Squad_Passing.csv',
+        'output': '{league}_Squad_Passing_cleaned.csv',
+        'group_suffixes': PASSING_SUFFIXES,
+        'string_columns': SQUAD_STRING_COLUMNS
+    },
+    'Squad_Pass_Types': {
+        'source': '{league}_Squad_Pass_Types.csv',
+        'output': '{league}_Squad_Pass_Types_cleaned.csv',
+        'string_columns': SQUAD_STRING_COLUMNS
+    },
+    'Squad_Goal_and_Shot_Creation': {
+        'source': '{league}_Squad_Goal_and_Shot_Creation.csv',
+        'output': '{league}_Squad_Goal_and_Shot_Creation_cleaned.csv',
+        'group_suffixes': CREATION_SUFFIXES,
+        'string_columns': SQUAD_STRING_COLUMNS
+    },
+    'Squad_Defensive_Actions': {
+        'source': '{league}_Squad_Defensive_Actions.csv',
+        'output': '{league}_Squad_Defensive_Actions_cleaned.csv',
+        'group_suffixes': DEFENSE_SUFFIXES,
+        'string_columns': SQUAD_STRING_COLUMNS
+    },
+    'Squad_Possession': {
+        'source': '{league}_Squad_Possession.csv',
+        'output': '{league}_Squad_Possession_cleaned.csv',
+        'string_columns': SQUAD_STRING_COLUMNS
+    },
+    'Squad_Playing_Time': {
+        'source': '{league}_Squad_Playing_Time.csv',
+        'output': '{league}_Squad_Playing_Time_cleaned.csv',
+        'string_columns': SQUAD_STRING_COLUMNS
+    },
+    'Squad_Miscellaneous_Stats': {
+        'source': '{league}_Squad_Miscellaneous_Stats.csv',
+        'output': '{league}_Squad_Miscellaneous_Stats_cleaned.csv',
+        'string_columns': SQUAD_STRING_COLUMNS
+    }
+}
+
+PLAYER_TABLE_SPECS = {
+    'Standard': {
+        'source': 'Standard.csv',
+        'output': 'Standard_cleaned.csv',
+        'keep': [
+            'Rk', 'Player', 'Nation', 'Pos', 'Squad', 'Age', 'Born', 'MP', 'Starts', 'Min', '90s',
+            'Gls', 'Ast', 'G+A', 'G-PK', 'PK', 'PKatt', 'CrdY', 'CrdR',
+            'xG', 'npxG', 'xAG', 'npxG+xAG', 'PrgC', 'PrgP', 'PrgR'
+        ] + PER_90_COLUMNS,
+        'drop': ['Matches'],
+        'player_identity': True,
+        'duplicate_suffix': ('_per_90', PER_90_COLUMNS),
+        'string_columns': PLAYER_STRING_COLUMNS
+    },
+    'Keeper': {
+        'source': 'Keeper.csv',
+        'output': 'Keeper_cleaned.csv',
+        'drop': ['Matches'],
+        'player_identity': True,
+        # Labels under "Penalty Kicks" clash with other tables
+        'rename': {col: f"{col}_penalty" for col in ['Att', 'Allowed', 'Saved', 'Missed', 'Save%']},
+        'string_columns': PLAYER_STRING_COLUMNS,
+        'fill_value': 0
+    },
+    'Keeper_Adv': {
+        'source': 'Keeper_Adv.csv',
+        'output': 'Keeper_Adv_cleaned.csv',
+        'group_suffixes': {'Goal Kicks': '_kicks'},
+        'drop': ['Matches'],
+        'player_identity': True,
+        'string_columns': PLAYER_STRING_COLUMNS,
+        'fill_value': ''
+    },
+    'Shooting': {
+        'source': 'Shooting.csv',
+        'output': 'Shooting_cleaned.csv',
+        'drop': ['Matches'],
+        'player_identity': True,
+        'string_columns': PLAYER_STRING_COLUMNS,
+        'fill_value': ''
+    },
+    'Passing': {
+        'source': 'Passing.csv',
+        'output': 'Passing_cleaned.csv',
+        'group_suffixes': PASSING_SUFFIXES,
+        'drop': ['Matches'],
+        'player_identity': True,
+        'string_columns': PLAYER_STRING_COLUMNS,
+        'fill_value': ''
+    },
+    'Passing_Types': {
+        'source': 'Passing_Types.csv',
+        'output': 'Passing_Types_cleaned.csv',
+        'drop': ['Matches'],
+        'player_identity': True,
+        'string_columns': PLAYER_STRING_COLUMNS,
+        'fill_value': ''
+    },
+    'Gca': {
+        'source': 'Gca.csv',
+        'output': 'Gca_cleaned.csv',
+        'group_suffixes': CREATION_SUFFIXES,
+        'drop': ['Matches'],
+        'player_identity': True,
+        'string_columns': PLAYER_STRING_COLUMNS,
+        'fill_value': ''
+    },
+    'Defense': {
+        'source': 'Defense.csv',
+        'output': 'Defense_cleaned.csv',
+        'group_suffixes': DEFENSE_SUFFIXES,
+        'drop': ['Matches'],
+        'player_identity': True,
+        'string_columns': PLAYER_STRING_COLUMNS,
+        'fill_value': ''
+    },
+    'Possession': {
+        'source': 'Possession.csv',
+        'output': 'Possession_cleaned.csv',
+        'drop': ['Matches'],
+        'player_identity': True,
+        'string_columns': PLAYER_STRING_COLUMNS,
+        'fill_value': ''
+    },
+    'Playing_Time': {
+        'source': 'Playing_Time.csv',
+        'output': 'Playing_Time_cleaned.csv',
+        'drop': ['Matches', 'On-Off'],
+        'player_identity': True,
+        'string_columns': PLAYER_STRING_COLUMNS,
+        'fill_value': ''
+    },
+    'Misc': {
+        'source': 'Misc.csv',
+        'output': 'Misc_cleaned.csv',
+        'drop': ['Matches'],
+        'player_identity': True,
+        'string_columns': PLAYER_STRING_COLUMNS,
+        'fill_value': ''
+    }
+}
@@ -1,51 +1,78 @@
 import os
-import time
-import requests
 import pandas as pd
-from bs4 import BeautifulSoup
-from io import StringIO
 import logging
 from config.fbref_config import FBREF_PLAYERS_STATS_URLS  # Import the URLs from the config file
+from fbref.fetch_engine import FetchEngine
+from fbref.table_extractor import find_id, extract_table
+from fbref.raw_tables import write_raw_table
+from fbref.storage import TableStorage
+from fbref.seasons import partition_dir
 
 # Set up logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
 class FBRefPlayerScraper:
-    def __init__(self, save_path, delay=4):
+    # Table ID map based on the structure provided
+    TABLE_WRAPPER_ID_MAP = {
+        'stats': 'all_stats_standard',
+        'keepers': 'all_stats_keeper',
+        'keepersadv': 'all_stats_keeper_adv',
+        'shooting': 'all_stats_shooting',
+        'passing': 'all_stats_passing',
+        'passing_types': 'all_stats_passing_types',
+        'gca': 'all_stats_gca',
+        'defense': 'all_stats_defense',
+        'possession': 'all_stats_possession',
+        'playingtime': 'all_stats_playing_time',
+        'misc': 'all_stats_misc'
+    }
+
+    TABLE_ID_MAP = {
+        'stats': 'stats_standard',
+        'keepers': 'stats_keeper',
+        'keepersadv': 'stats_keeper_adv',
+        'shooting': 'stats_shooting',
+        'passing': 'stats_passing',
+        'passing_types': 'stats_passing_types',
+        'gca': 'stats_gca',
+        'defense': 'stats_defense',
+        'possession': 'stats_possession',
+        'playingtime': 'stats_playing_time',
+        'misc': 'stats_misc'
+    }
+
+    def __init__(self, save_path, delay=4, engine=None, single_pass=True, storage=None, season=None):
         self.save_path = save_path
+        self.storage = storage or TableStorage()  # Format the raw tables are written in
         self.delay = delay
+        self.engine = engine or FetchEngine(delay=delay)  # Shared, rate-limited fetcher
+        self.single_pass = single_pass  # Pull every table a page carries instead of one table per fetch
+        self.season = season  # Saves under <save_path>/<league>/<season>/ when set
 
         if not os.path.exists(save_path):
             os.makedirs(save_path)
 
+    @staticmethod
+    def table_file_name(table_id):
+        """Raw file name of a player table: stats_keeper_adv -> Keeper_Adv.csv."""
+        table_name = table_id.replace('stats_', '').replace('_', ' ').title()
+        return f"{table_name.replace(' ', '_')}.csv"
+
     def fetch_page(self, url):
         """Fetch HTML content from a URL."""
-        try:
-            response = requests.get(url)
-            response.raise_for_status()
-            return response.text
-        except requests.RequestException as e:
-            logging.error(f"Error fetching page {url}: {e}")
-            return ""
-
-    def parse_table(self, soup, table_wrapper_id, table_id):
-        """Parse a table from the BeautifulSoup object, including commented tables."""
-        # Find the specific wrapper by its ID
-        wrapper = soup.find('div', {'id': table_wrapper_id})
-        if wrapper:
-            # The table might be within a commented section, so let's handle that
-            comment = wrapper.find(string=lambda text: isinstance(text, str) and table_id in text)
-            if comment:
-                # Remove comment tags and parse the table
-                comment_soup = BeautifulSoup(comment, 'html.parser')
-                table = comment_soup.find('table', {'id': table_id})
-            else:
-                # If not found in comments, find directly in the wrapper
-                table = wrapper.find('table', {'id': table_id})
+        return self.engine.fetch_page(url)
 
-            if table:
-                table_html = str(table)
-                return pd.read_html(StringIO(table_html))[0]  # Use StringIO to parse table HTML to DataFrame
+    def parse_table(self, html, table_wrapper_id, table_id):
+        """Parse a table from the page HTML, including commented tables."""
+        # Find the specific wrapper by its ID
+        wrapper_start = find_id(html, table_wrapper_id)
+        if wrapper_start != -1:
+            # The table might be within a commented section; the text scan finds it either way.
+            # Columns are keyed by data-stat and FBref's repeated header rows are dropped here
+            df = extract_table(html, table_id, columns='data-stat', skip_header_rows=True, start=wrapper_start)
+
+            if df is not None:
+                return df
             else:
                 logging.warning(f"Table with ID {table_id} not found inside wrapper {table_wrapper_id}.")
                 return pd.DataFrame()  # Return an empty DataFrame if the table is not found
@@ -60,74 +87,94 @@ class FBRefPlayerScraper:
         if not html:
             return
 
-        soup = BeautifulSoup(html, 'html.parser')
-        df = self.parse_table(soup, table_wrapper_id, table_id)
-
-        if not df.empty:
-            # Create a folder for the league if it doesn't exist
-            league_folder_path = os.path.join(self.save_path, league_name)
-            os.makedirs(league_folder_path, exist_ok=True)
-            
-            # Create file name from table name and league name
-            table_name = table_id.replace('stats_', '').replace('_', ' ').title()
-            filename = f"{table_name.replace(' ', '_')}.csv"
-            file_path = os.path.join(league_folder_path, filename)
-            df.to_csv(file_path, index=False)
-            logging.info(f"Data saved to {file_path}")
-        else:
-            logging.warning(f"No data found for {table_id} in {league_name}.")
+        self.save_player_tables(league_name, html, [(table_wrapper_id, table_id)])
 
-    def scrape_league(self, league_name, urls):
-        """Scrape all player data tables for a specific league."""
-        logging.info(f"Scraping league: {league_name}")
-
-        # Table ID map based on the structure provided
-        table_wrapper_id_map = {
-            'stats': 'all_stats_standard',
-            'keepers': 'all_stats_keeper',
-            'keepersadv': 'all_stats_keeper_adv',
-            'shooting': 'all_stats_shooting',
-            'passing': 'all_stats_passing',
-            'passing_types': 'all_stats_passing_types',
-            'gca': 'all_stats_gca',
-            'defense': 'all_stats_defense',
-            'possession': 'all_stats_possession',
-            'playingtime': 'all_stats_playing_time',
-            'misc': 'all_stats_misc'
-        }
-
-        table_id_map = {
-            'stats': 'stats_standard',
-            'keepers': 'stats_keeper',
-            'keepersadv': 'stats_keeper_adv',
-            'shooting': 'stats_shooting',
-            'passing': 'stats_passing',
-            'passing_types': 'stats_passing_types',
-            'gca': 'stats_gca',
-            'defense': 'stats_defense',
-            'possession': 'stats_possession',
-            'playingtime': 'stats_playing_time',
-            'misc': 'stats_misc'
-        }
-
-        # Iterate through each URL and determine which table to scrape
+    def save_player_tables(self, league_name, html, page_tables):
+        """Parse every (wrapper_id, table_id) table out of a fetched page and save each as CSV."""
+        for table_wrapper_id, table_id in page_tables:
+            df = self.parse_table(html, table_wrapper_id, table_id)
+
+            if not df.empty:
+                # Create a folder for the league (and season) if it doesn't exist
+                league_folder_path = partition_dir(self.save_path, league_name, self.season)
+                os.makedirs(league_folder_path, exist_ok=True)
+
+                file_path = os.path.join(league_folder_path, self.table_file_name(table_id))
+                write_raw_table(df, file_path, self.storage)  # Data-stat keyed table plus its display headers
+                logging.info(f"Data saved to {self.storage.path(file_path)}")
+            else:
+                logging.warning(f"No data found for {table_id} in {league_name}.")
+
+    def league_tables(self, league_name, urls):
+        """Return the (url, wrapper_id, table_id) player tables to scrape for a league."""
+        tables = []
         for url in urls:
             # Extract the key part of the URL to match with the table ID map
             key_part = url.split('/')[-2]
-            table_wrapper_id = table_wrapper_id_map.get(key_part)
-            table_id = table_id_map.get(key_part)
+            table_wrapper_id = self.TABLE_WRAPPER_ID_MAP.get(key_part)
+            table_id = self.TABLE_ID_MAP.get(key_part)
 
             if table_wrapper_id and table_id:
-                # Scrape the data table for this category
-                self.scrape_player_data(league_name, url, table_wrapper_id, table_id)
-                time.sleep(self.delay)
+                tables.append((url, table_wrapper_id, table_id))
             else:
                 logging.warning(f"URL {url} does not match any known table ID patterns.")
+        return tables
+
+    def probe_page(self, league_name, tables, html):
+        """Save every wanted table a page carries and return the IDs of the tables found."""
+        page_tables = [(wrapper_id, table_id) for _, wrapper_id, table_id in tables if f'id="{table_id}"' in html]
+        self.save_player_tables(league_name, html, page_tables)
+        return {table_id for _, table_id in page_tables}
+
+    def build_page_plan(self, tables, found=()):
+        """Group the tables not yet found by page so each distinct page is fetched once."""
+        plan = {}
+        for url, table_wrapper_id, table_id in tables:
+            if table_id not in found:
+                plan.setdefault(url, []).append((table_wrapper_id, table_id))
+        return plan
+
+    def scrape_leagues(self, league_urls):
+        """Scrape the player tables of several leagues through the shared fetch engine."""
+        tables = {}
+        for league_name, urls in league_urls.items():
+            logging.info(f"Scraping league: {league_name}")
+            tables[league_name] = self.league_tables(league_name, urls)
+
+        # Probe each league's first page for every table it embeds (often in HTML comments)
+        found = {}
+        if self.single_pass:
+            probe_jobs = [
+                (league_name, league_tables[0][0],
+                 lambda html, league_name=league_name, league_tables=league_tables: self.probe_page(
+                     league_name, league_tables, html))
+                for league_name, league_tables in tables.items() if league_tables
+            ]
+            found = self.engine.run(probe_jobs)
+
+        # Fetch the remaining pages once each and pull every planned table from them
+        jobs = []
+        for league_name, league_tables in tables.items():
+            league_found = found.get(league_name) or set()
+            plan = self.build_page_plan(league_tables, league_found)
+            probed = 1 if league_name in found else 0
+            logging.info(f"{league_name}: {len(league_tables)} tables from {len(plan) + probed} page fetches")
+
+            for url, page_tables in plan.items():
+                handler = lambda html, league_name=league_name, page_tables=page_tables: self.save_player_tables(
+                    league_name, html, page_tables)
+                jobs.append(((league_name, url), url, handler))
+
+        # Run every league's pages through one pool so downloads and parsing overlap
+        self.engine.run(jobs)
+
+    def scrape_league(self, league_name, urls):
+        """Scrape all player data tables for a specific league."""
+        self.scrape_leagues({league_name: urls})
 
     def scrape_all_leagues(self):
         """Scrape all leagues provided in FBREF_PLAYERS_STATS_URLS."""
-        for league_name, urls in FBREF_PLAYERS_STATS_URLS.items():
-            self.scrape_league(league_name, urls)
+        self.scrape_leagues(FBREF_PLAYERS_STATS_URLS)
 
 # Example usage
 if __name__ == "__main__":
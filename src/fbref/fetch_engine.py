@@ -0,0 +1,170 @@
+import time
+import threading
+import logging
+import requests
+from email.utils import parsedate_to_datetime
+from datetime import datetime, timezone
+from urllib.parse import urlparse
+from concurrent.futures import ThreadPoolExecutor
+from config.fbref_config import (
+    FETCH_DELAY, FETCH_BURST, FETCH_MAX_WORKERS, FETCH_TIMEOUT, FETCH_MAX_RETRIES, FETCH_BACKOFF
+)
+from fbref.http_session import create_session
+
+# Set up logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+# Status codes worth retrying; anything else is a permanent failure
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+class FetchError(Exception):
+    """Raised when a page cannot be fetched within its retry budget."""
+
+class TokenBucket:
+    def __init__(self, rate, capacity=1):
+        self.rate = rate  # Tokens added per second
+        self.capacity = capacity  # Maximum burst size
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        """Block until a token is available, then consume it."""
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+    def defer(self, seconds):
+        """Hold back the next token for at least `seconds` (e.g. after a 429)."""
+        with self.lock:
+            self.tokens = min(self.tokens, 1 - seconds * self.rate)
+
+def parse_retry_after(value):
+    """Return the wait in seconds from a Retry-After header (delta-seconds or HTTP date)."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+class FetchEngine:
+    def __init__(self, delay=FETCH_DELAY, max_workers=FETCH_MAX_WORKERS, burst=FETCH_BURST,
+                 timeout=FETCH_TIMEOUT, max_retries=FETCH_MAX_RETRIES, backoff=FETCH_BACKOFF, session=None,
+                 cache=None):
+        self.delay = delay  # Politeness budget: one request per `delay` seconds per host
+        self.max_workers = max_workers
+        self.burst = burst
+        self.timeout = timeout
+        self.max_retries = max_retries  # Retry budget for each URL
+        self.backoff = backoff  # Base of the exponential backoff, in seconds
+        self.session = session or create_session(pool_size=max_workers)  # Pooled keep-alive connections
+        self.cache = cache  # Optional ResponseCache checked before the network
+        self.buckets = {}  # One token bucket per host
+        self.lock = threading.Lock()
+        self.cache_hits = 0
+        self.bytes_downloaded = 0  # Response bodies received from the network, cache hits excluded
+        self.last_run = {}
+
+    def _bucket_for(self, url):
+        """Return the token bucket for the host of a URL, creating it if needed."""
+        host = urlparse(url).netloc
+        with self.lock:
+            if host not in self.buckets:
+                self.buckets[host] = TokenBucket(rate=1.0 / self.delay, capacity=self.burst)
+            return self.buckets[host]
+
+    def fetch_page(self, url):
+        """Fetch HTML content from a URL, retrying transient failures with backoff."""
+        # Serve from the cache when the entry is fresh or we are replaying offline
+        entry = self.cache.lookup(url) if self.cache else None
+        if entry and (self.cache.offline or self.cache.is_fresh(entry)):
+            with self.lock:
+                self.cache_hits += 1
+            return self.cache.read_body(entry)
+        if self.cache and self.cache.offline:
+            raise FetchError(f"Page {url} is not in the offline cache")
+        headers = self.cache.conditional_headers(entry) if entry else {}
+
+        bucket = self._bucket_for(url)
+        attempt = 0
+        while True:
+            bucket.acquire()
+            retry_after = None
+            try:
+                response = self.session.get(url, headers=headers, timeout=self.timeout)
+                if response.status_code == 304 and entry:
+                    self.cache.refresh(url, entry)  # Unchanged since the cached copy
+                    return self.cache.read_body(entry)
+                with self.lock:
+                    self.bytes_downloaded += len(response.content)
+                if response.status_code not in RETRY_STATUSES:
+                    response.raise_for_status()  # Check if the request was successful
+                    if self.cache:
+                        self.cache.store(url, response)
+                    return response.text
+                error = f"HTTP {response.status_code}"
+                retry_after = parse_retry_after(response.headers.get('Retry-After'))
+            except requests.HTTPError as e:
+                raise FetchError(f"Error fetching page {url}: {e}") from e
+            except requests.RequestException as e:
+                error = str(e)
+
+            attempt += 1
+            if attempt > self.max_retries:
+                raise FetchError(f"Error fetching page {url} after {attempt} attempts: {error}")
+
+            # Honor Retry-After when the server sends it, otherwise back off exponentially
+            wait = retry_after if retry_after is not None else self.backoff * 2 ** (attempt - 1)
+            logging.warning(f"{error} for {url}, retrying in {wait:.1f}s ({attempt}/{self.max_retries})")
+            bucket.defer(wait)
+
+    def _run_job(self, url, handler):
+        """Fetch a page and hand its HTML to the job's handler."""
+        html = self.fetch_page(url)
+        return handler(html)
+
+    def run(self, jobs):
+        """Run (key, url, handler) jobs on the worker pool and return {key: handler result}."""
+        jobs = list(jobs)
+        start = time.monotonic()
+        hits_before = self.cache_hits
+
+        # Fetch and parse concurrently; the token buckets keep the per-host request rate
+        results = {}
+        failures = []
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = [(key, url, executor.submit(self._run_job, url, handler)) for key, url, handler in jobs]
+            for key, url, future in futures:
+                try:
+                    results[key] = future.result()
+                except FetchError as e:
+                    logging.error(str(e))
+                    results[key] = None
+                    failures.append(url)
+
+        elapsed = time.monotonic() - start
+        cache_hits = self.cache_hits - hits_before
+        requests_made = len(jobs) - cache_hits
+        rate = requests_made / elapsed if elapsed > 0 else 0.0
+        self.last_run = {'pages': len(jobs), 'requests': requests_made, 'cache_hits': cache_hits,
+                         'failed': len(failures), 'elapsed': elapsed, 'requests_per_second': rate}
+        logging.info(f"Fetched {len(jobs)} pages ({cache_hits} from cache) in {elapsed:.1f}s "
+                     f"({rate:.2f} requests/s)")
+
+        # Fail the run instead of silently leaving partial outputs behind
+        if failures:
+            raise FetchError(f"{len(failures)} of {len(jobs)} pages could not be fetched: {', '.join(failures)}")
+        return results
@@ -0,0 +1,542 @@
+# Columns and pandas dtypes of every final_data table, in the order they are written and loaded.
+# FinalDataTransformation casts its output with these and database.db_creation builds the schema from them.
+
+TABLE_COLUMNS = {
+    'leagues': {
+        'league_id': 'int',
+        'league_name': 'string'
+    },
+    'teams': {
+        'team_id': 'int64',
+        'team_name': 'string',
+        'league_id': 'int64'
+    },
+    'players': {
+        'player_id': 'Int64',
+        'player_name': 'string',
+        'nation': 'string',
+        'position': 'string',
+        'team_id': 'Int64',
+        'age': 'int',
+        'date_of_birth': 'float'
+    },
+    'player_advanced_goalkeeping': {
+        'stat_id': 'Int64',
+        'player_id': 'Int64',
+        'ninety_s': 'float',
+        'ga': 'int',
+        'pka': 'int',
+        'fk': 'int',
+        'ck': 'int',
+        'og': 'int',
+        'psxg': 'float',
+        'psxg_per_sot': 'float',
+        'psxg_plus_minus': 'float',
+        'psxg_plus_minus_per_90': 'float',
+        'cmp': 'int',
+        'att': 'int',
+        'cmp_percent': 'float',
+        'att_gk': 'int',
+        'thr': 'int',
+        'launch_percent': 'float',
+        'avg_len': 'float',
+        'opp': 'int',
+        'stp': 'int',
+        'stp_percent': 'float',
+        'opa': 'int',
+        'opa_per_90': 'float',
+        'avg_dist': 'float'
+    },
+    'player_defensive_actions': {
+        'stat_id': 'Int64',
+        'player_id': 'Int64',
+        'ninety_s': 'float',
+        'tkl_tackles': 'int',
+        'tklw_tackles': 'int',
+        'def_3rd_tackles': 'int',
+        'mid_3rd_tackles': 'int',
+        'att_3rd_tackles': 'int',
+        'tkl_challenges': 'int',
+        'att_challenges': 'int',
+        'tkl_percent_challenges': 'float',
+        'lost_challenges': 'int',
+        'blocks_blocks': 'int',
+        'sh_blocks': 'int',
+        'pass_blocks': 'int',
+        'interceptions': 'int',
+        'tkl_plus_int': 'int',
+        'clr': 'int',
+        'err': 'int'
+    },
+    'player_goal_and_shot_creation': {
+        'stat_id': 'Int64',
+        'player_id': 'Int64',
+        'ninety_s': 'float',
+        'sca': 'int',
+        'sca_per_90': 'float',
+        'passlive_sca': 'int',
+        'passdead_sca': 'int',
+        'to_sca': 'int',
+        'sh_sca': 'int',
+        'fld_sca': 'int',
+        'def_sca': 'int',
+        'gca': 'int',
+        'gca_per_90': 'float',
+        'passlive_gca': 'int',
+        'passdead_gca': 'int',
+        'to_gca': 'int',
+        'sh_gca': 'int',
+        'fld_gca': 'int',
+        'def_gca': 'int'
+    },
+    'player_goalkeeping': {
+        'stat_id': 'Int64',
+        'player_id': 'Int64',
+        'mp': 'int',
+        'starts': 'int',
+        'min': 'int',
+        'ninety_s': 'float',
+        'ga': 'int',
+        'ga_per_90': 'float',
+        'sota': 'int',
+        'saves': 'int',
+        'save_percent': 'float',
+        'w': 'int',
+        'd': 'int',
+        'l': 'int',
+        'cs': 'int',
+        'cs_percent': 'float',
+        'pkatt': 'int',
+        'pka': 'int',
+        'pk_sv': 'int',
+        'pk_missed': 'int'
+    },
+    'player_miscellaneous_stats': {
+        'stat_id': 'Int64',
+        'player_id': 'Int64',
+        'ninety_s': 'float',
+        'crd_y': 'int',
+        'crd_r': 'int',
+        'two_crd_y': 'int',
+        'fls': 'int',
+        'fld': 'int',
+        'off': 'int',
+        'crs': 'int',
+        'interceptions': 'int',
+        'tklw': 'int',
+        'pkwon': 'int',
+        'pkcon': 'int',
+        'og': 'int',
+        'recov': 'int',
+        'won': 'int',
+        'lost': 'int',
+        'won_percent': 'float'
+    },
+    'player_pass_types': {
+        'stat_id': 'Int64',
+        'player_id': 'Int64',
+        'ninety_s': 'float',
+        'att': 'int',
+        'live': 'int',
+        'dead': 'int',
+        'fk': 'int',
+        'tb': 'int',
+        'sw': 'int',
+        'crs': 'int',
+        'ti': 'int',
+        'ck': 'int',
+        'inn': 'int',
+        'outt': 'int',
+        'str': 'int',
+        'cmp': 'int',
+        'off': 'int',
+        'blocks': 'int'
+    },
+    'player_passing': {
+        'stat_id': 'Int64',
+        'player_id': 'Int64',
+        'ninety_s': 'float',
+        'cmp_total': 'int',
+        'att_total': 'int',
+        'cmp_percent_total': 'float',
+        'tot_dist_total': 'float',
+        'prg_dist_total': 'float',
+        'cmp_short': 'int',
+        'att_short': 'int',
+        'cmp_percent_short': 'float',
+        'cmp_medium': 'int',
+        'att_medium': 'int',
+        'cmp_percent_medium': 'float',
+        'cmp_long': 'int',
+        'att_long': 'int',
+        'cmp_percent_long': 'float',
+        'ast': 'int',
+        'xa': 'float',
+        'xag': 'float',
+        'a_xag': 'float',
+        'kp': 'int',
+        'one_third_ppa': 'int',
+        'crspa': 'int',
+        'prgp': 'int'
+    },
+    'player_playing_time': {
+        'stat_id': 'Int64',
+        'player_id': 'Int64',
+        'mp': 'int',
+        'min': 'int',
+        'ninety_s': 'float',
+        'starts': 'int',
+        'mn_per_start': 'float',
+        'compl': 'int',
+        'subs': 'int',
+        'mn_per_subs': 'float',
+        'unsub': 'int',
+        'ppm': 'float',
+        'on_g': 'int',
+        'on_ga': 'int',
+        'plus_minus': 'int',
+        'plus_minus_per_90': 'float',
+        'onxg': 'float',
+        'onxga': 'float',
+        'xg_plus_minus': 'float',
+        'xg_plus_minus_per_90': 'float'
+    },
+    'player_possession': {
+        'stat_id': 'Int64',
+        'player_id': 'Int64',
+        'ninety_s': 'float',
+        'touches': 'int',
+        'def_pen': 'int',
+        'def_3rd': 'int',
+        'mid_3rd': 'int',
+        'att_3rd': 'int',
+        'att_pen': 'int',
+        'live': 'int',
+        'att': 'int',
+        'succ': 'int',
+        'succ_percent': 'float',
+        'tkld': 'int',
+        'tkld_percent': 'float',
+        'carries': 'int',
+        'tot_dist': 'float',
+        'prg_dist': 'float',
+        'prgc': 'int',
+        'one_third': 'int',
+        'cpa': 'int',
+        'mis': 'int',
+        'dis': 'int',
+        'rec': 'int',
+        'prgr': 'int'
+    },
+    'player_shooting': {
+        'stat_id': 'Int64',
+        'player_id': 'Int64',
+        'ninety_s': 'float',
+        'gls': 'int',
+        'sh': 'int',
+        'sot': 'int',
+        'sot_percent': 'float',
+        'sh_per_90': 'float',
+        'sot_per_90': 'float',
+        'g_per_sh': 'float',
+        'g_per_sot': 'float',
+        'dist': 'float',
+        'fk': 'int',
+        'pk': 'int',
+        'pkatt': 'int',
+        'xg': 'float',
+        'npxg': 'float',
+        'npxg_per_sh': 'float',
+        'g_minus_xg': 'float',
+        'npg_minus_xg': 'float'
+    },
+    'player_standard_stats': {
+        'stat_id': 'Int64',
+        'player_id': 'Int64',
+        'mp': 'int',
+        'min': 'int',
+        'ninety_s': 'float',
+        'starts': 'int',
+        'gls': 'int',
+        'gls_per_90': 'float',
+        'ast': 'int',
+        'ast_per_90': 'float',
+        'g_a': 'int',
+        'g_a_per_90': 'float',
+        'g_pk': 'int',
+        'g_pk_per_90': 'float',
+        'pk': 'int',
+        'pkatt': 'int',
+        'crd_y': 'int',
+        'crd_r': 'int',
+        'xg': 'float',
+        'xg_per_90': 'float',
+        'npxg': 'float',
+        'npxg_per_90': 'float',
+        'xag': 'float',
+        'xag_per_90': 'float',
+        'npxg_xag': 'float',
+        'npxg_xag_per_90': 'float'
+    },
+    'team_advanced_goalkeeping': {
+        'stat_id': 'Int64',
+        'team_id': 'Int64',
+        'ninety_s': 'float',
+        'ga': 'int',
+        'pka': 'int',
+        'fk': 'int',
+        'ck': 'int',
+        'og': 'int',
+        'psxg': 'float',
+        'psxg_per_sot': 'float',
+        'psxg_plus_minus': 'float',
+        'psxg_plus_minus_per_90': 'float',
+        'cmp': 'int',
+        'att': 'int',
+        'cmp_percent': 'float',
+        'att_gk': 'int',
+        'thr': 'int',
+        'launch_percent': 'float',
+        'avg_len': 'float',
+        'opp': 'int',
+        'stp': 'int',
+        'stp_percent': 'float',
+        'opa': 'int',
+        'opa_per_90': 'float',
+        'avg_dist': 'float'
+    },
+    'team_defensive_actions': {
+        'stat_id': 'Int64',
+        'team_id': 'Int64',
+        'ninety_s': 'float',
+        'tkl_tackles': 'int',
+        'tklw_tackles': 'int',
+        'def_3rd_tackles': 'int',
+        'mid_3rd_tackles': 'int',
+        'att_3rd_tackles': 'int',
+        'tkl_challenges': 'int',
+        'att_challenges': 'int',
+        'tkl_percent_challenges': 'float',
+        'lost_challenges': 'int',
+        'blocks_blocks': 'int',
+        'sh_blocks': 'int',
+        'pass_blocks': 'int',
+        'interceptions': 'int',
+        'tkl_plus_int': 'int',
+        'clr': 'int',
+        'err': 'int'
+    },
+    'team_goal_and_shot_creation': {
+        'stat_id': 'Int64',
+        'team_id': 'Int64',
+        'ninety_s': 'float',
+        'sca': 'int',
+        'sca_per_90': 'float',
+        'passlive_sca': 'int',
+        'passdead_sca': 'int',
+        'to_sca': 'int',
+        'sh_sca': 'int',
+        'fld_sca': 'int',
+        'def_sca': 'int',
+        'gca': 'int',
+        'gca_per_90': 'float',
+        'passlive_gca': 'int',
+        'passdead_gca': 'int',
+        'to_gca': 'int',
+        'sh_gca': 'int',
+        'fld_gca': 'int',
+        'def_gca': 'int'
+    },
+    'team_goalkeeping': {
+        'stat_id': 'Int64',
+        'team_id': 'Int64',
+        'mp': 'int',
+        'starts': 'int',
+        'min': 'int',
+        'ninety_s': 'float',
+        'ga': 'int',
+        'ga_per_90': 'float',
+        'sota': 'int',
+        'saves': 'int',
+        'save_percent': 'float',
+        'w': 'int',
+        'd': 'int',
+        'l': 'int',
+        'cs': 'int',
+        'cs_percent': 'float'
+    },
+    'team_miscellaneous_stats': {
+        'stat_id': 'Int64',
+        'team_id': 'Int64',
+        'ninety_s': 'float',
+        'crd_y': 'int',
+        'crd_r': 'int',
+        'two_crd_y': 'int',
+        'fls': 'int',
+        'fld': 'int',
+        'off': 'int',
+        'crs': 'int',
+        'interceptions': 'int',
+        'tklw': 'int',
+        'pkwon': 'int',
+        'pkcon': 'int',
+        'og': 'int',
+        'recov': 'int',
+        'won': 'int',
+        'lost': 'int',
+        'won_percent': 'float'
+    },
+    'team_pass_types': {
+        'stat_id': 'Int64',
+        'team_id': 'Int64',
+        'ninety_s': 'float',
+        'att': 'int',
+        'live': 'int',
+        'dead': 'int',
+        'fk': 'int',
+        'tb': 'int',
+        'sw': 'int',
+        'crs': 'int',
+        'ti': 'int',
+        'ck': 'int',
+        'inn': 'int',
+        'outt': 'int',
+        'str': 'int',
+        'cmp': 'int',
+        'off': 'int',
+        'blocks': 'int'
+    },
+    'team_passing': {
+        'stat_id': 'Int64',
+        'team_id': 'Int64',
+        'ninety_s': 'float',
+        'cmp_total': 'int',
+        'att_total': 'int',
+        'cmp_percent_total': 'float',
+        'tot_dist_total': 'float',
+        'prg_dist_total': 'float',
+        'cmp_short': 'int',
+        'att_short': 'int',
+        'cmp_percent_short': 'float',
+        'cmp_medium': 'int',
+        'att_medium': 'int',
+        'cmp_percent_medium': 'float',
+        'cmp_long': 'int',
+        'att_long': 'int',
+        'cmp_percent_long': 'float',
+        'ast': 'int',
+        'kp': 'int',
+        'one_third': 'int',
+        'crspa': 'int',
+        'prgp': 'int'
+    },
+    'team_playing_time': {
+        'stat_id': 'Int64',
+        'team_id': 'Int64',
+        'age': 'float',
+        'mp': 'int',
+        'min': 'int',
+        'mn_per_mp': 'float',
+        'min_percent': 'float',
+        'ninety_s': 'float',
+        'starts': 'int',
+        'mn_per_start': 'float',
+        'compl': 'int',
+        'subs': 'int',
+        'mn_per_sub': 'float',
+        'unsub': 'int',
+        'ppm': 'float',
+        'on_g': 'int',
+        'on_ga': 'int',
+        'plus_minus': 'int',
+        'plus_minus_per_90': 'float',
+        'onxg': 'float',
+        'onxga': 'float',
+        'xg_plus_minus': 'float',
+        'xg_plus_minus_per_90': 'float'
+    },
+    'team_possession': {
+        'stat_id': 'Int64',
+        'team_id': 'Int64',
+        'ninety_s': 'float',
+        'touches': 'int',
+        'def_pen': 'int',
+        'def_3rd': 'int',
+        'mid_3rd': 'int',
+        'att_3rd': 'int',
+        'att_pen': 'int',
+        'live': 'int',
+        'att': 'int',
+        'succ': 'int',
+        'succ_percent': 'float',
+        'tkld': 'int',
+        'tkld_percent': 'float',
+        'carries': 'int',
+        'tot_dist': 'float',
+        'prg_dist': 'float',
+        'prgc': 'int',
+        'one_third': 'int',
+        'cpa': 'int',
+        'mis': 'int',
+        'dis': 'int',
+        'rec': 'int',
+        'prgr': 'int'
+    },
+    'team_shooting': {
+        'stat_id': 'Int64',
+        'team_id': 'Int64',
+        'ninety_s': 'float',
+        'gls': 'int',
+        'sh': 'int',
+        'sot': 'int',
+        'sot_percent': 'float',
+        'sh_per_90': 'float',
+        'sot_per_90': 'float',
+        'g_per_sh': 'float',
+        'g_per_sot': 'float',
+        'dist': 'float',
+        'fk': 'int',
+        'pk': 'int',
+        'pkatt': 'int',
+        'xg': 'float',
+        'npxg': 'float',
+        'npxg_per_sh': 'float',
+        'g_minus_xg': 'float',
+        'npg_minus_xg': 'float'
+    },
+    'team_standard_stats': {
+        'stat_id': 'Int64',
+        'team_id': 'Int64',
+        'age': 'float',
+        'poss': 'float',
+        'mp': 'int',
+        'starts': 'int',
+        'min': 'int',
+        'ninety_s': 'float',
+        'gls': 'int',
+        'gls_per_90': 'float',
+        'ast': 'int',
+        'ast_per_90': 'float',
+        'g_a': 'int',
+        'g_a_per_90': 'float',
+        'g_pk': 'int',
+        'g_pk_per_90': 'float',
+        'pk': 'int',
+        'pkatt': 'int',
+        'crd_y': 'int',
+        'crd_r': 'int',
+        'xg': 'float',
+        'xg_per_90': 'float',
+        'npxg': 'float',
+        'npxg_per_90': 'float',
+        'xag': 'float',
+        'xag_per_90': 'float',
+        'npxg_xag': 'float',
+        'npxg_xag_per_90': 'float'
+    }
+}
+
+def to_schema(df, table):
+    """Select a table's columns in schema order and cast them to their dtypes."""
+    columns = TABLE_COLUMNS[table]
+    return df[list(columns)].astype(columns)
@@ -1,10 +1,57 @@
 import os
+import time
+import logging
 import pandas as pd
+from concurrent.futures import ProcessPoolExecutor
+from config.db_config import SEASON
+from config.fbref_config import TRANSFORM_MAX_WORKERS, TRANSFORM_CHUNK_ROWS
+from fbref.final_columns import TABLE_COLUMNS, to_schema
+from fbref.id_resolver import IdResolver, STAT_ENTITY_COLUMNS, hash_ids, player_ids, player_keys, stat_ids
+from fbref.manifest import code_hash
+from fbref import tracing
+from fbref.storage import TableStorage
+from fbref.seasons import partition_dir
+
+# Transformer of a worker process, set once by init_transform_worker
+_worker_transformer = None
+
+def init_transform_worker(transformer):
+    """Keep the transformer (and its read-only id indexes) for every job of this worker."""
+    global _worker_transformer
+    _worker_transformer = transformer
+
+def run_transform_job(transformer, league, input_dir, file):
+    """Transform one (league, file) job and report its outcome instead of raising."""
+    transformer = transformer or _worker_transformer
+    start = time.perf_counter()
+    result = {'league': league, 'file': file, 'status': 'transformed', 'output': None, 'rows': 0, 'error': None}
+    with tracing.span('transform', league=league, file=file) as span:
+        try:
+            result['output'], result['rows'] = transformer._transform_file(league, input_dir, file)
+        except Exception as e:
+            result['status'] = 'failed'
+            result['error'] = f"{type(e).__name__}: {e}"
+    result['seconds'] = time.perf_counter() - start
+    result['trace'] = dict(span.event, status=result['status'])
+    return result
+
+def table_key(file_name, league=None):
+    """Canonical table key of a cleaned or final file: Bundesliga_Squad_Passing_cleaned.csv -> Squad_Passing."""
+    if league and file_name.startswith(f"{league}_"):
+        file_name = file_name[len(league) + 1:]
+    for suffix in ('_cleaned.csv', '.csv'):
+        if file_name.endswith(suffix):
+            return file_name[:-len(suffix)]
+    return file_name
 
 class FinalDataTransformation:
-    def __init__(self):
+    def __init__(self, input_dirs=None, output_dir=None, first_tables_dir=None, storage=None, season=None):
+        # Format cleaned tables are read and final tables written in
+        self.storage = storage or TableStorage()
+        self.season = season  # Final tables go to <output_dir>/<league>/<season>/ when set
+
         # Directories for input data
-        self.input_dirs = {
+        self.input_dirs = input_dirs or {
             'Bundesliga': r'C:/Users/asus/Desktop/Football_project/cleaned_data/Bundesliga',
             'La_Liga': r'C:/Users/asus/Desktop/Football_project/cleaned_data/La_Liga',
             'Ligue_1': r'C:/Users/asus/Desktop/Football_project/cleaned_data/Ligue_1',
@@ -14,19 +61,22 @@ class FinalDataTransformation:
         }
 
         # Directory for final output
-        self.output_dir = r'C:/Users/asus/Desktop/Football_project/final_data'
+        self.output_dir = output_dir or r'C:/Users/asus/Desktop/Football_project/final_data'
 
         # Ensure final output folders exist for each league
         self._create_output_directories()
         
-        self.teams_df = pd.read_csv(r"C:\Users\asus\Desktop\Football_project\final_data\First_Tables\teams.csv")
+        self.first_tables_dir = first_tables_dir or r"C:\Users\asus\Desktop\Football_project\final_data\First_Tables"
+        teams_path = os.path.join(self.first_tables_dir, "teams.csv")
+        self.teams_df = self.storage.read(teams_path) if self.storage.exists(teams_path) else None
+
+        # Name -> id hash indexes for leagues, teams and players, built once per run
+        self.ids = IdResolver.from_folder(self.first_tables_dir, self.storage)
         
     def _get_team_id(self, team_name):
-        # Match the team_name in the 'teams_df' and return the corresponding team_id
-        team_row = self.teams_df[self.teams_df['team_name'] == team_name]
-        if not team_row.empty:
-            return team_row.iloc[0]['team_id']
-        return None
+        # Look the team_name up in the team index and return the corresponding team_id
+        team_id = self.ids.indexes['teams'].get(team_name)
+        return None if team_id is None else int(team_id)
 
     def _create_output_directories(self):
         """Create output directories for each league in the final_data folder."""
@@ -34,102 +84,211 @@ class FinalDataTransformation:
             os.makedirs(self.output_dir)
         
         for league in self.input_dirs.keys():
-            league_output_dir = os.path.join(self.output_dir, league)
+            league_output_dir = partition_dir(self.output_dir, league, self.season)
             if not os.path.exists(league_output_dir):
                 os.makedirs(league_output_dir)
 
-    def transform_and_save(self):
-        """Run transformations and save each CSV into its respective folder."""
+    def transform_and_save(self, tables=None, max_workers=TRANSFORM_MAX_WORKERS, manifest=None):
+        """Run transformations and save each CSV into its respective folder.
+
+        tables limits the run to the given table keys (e.g. ['Standard', 'Squad_Passing']). With
+        max_workers > 1 the (league, file) jobs run on a process pool; every worker receives this
+        transformer, and with it the team and player indexes, once. With a StageManifest, files whose
+        inputs are unchanged since the last run are not transformed again. Returns the per-file results.
+        """
+        if tables is not None:
+            unknown = [key for key in tables if key not in TRANSFORMS]
+            if unknown:
+                raise ValueError(f"Unknown table keys {', '.join(unknown)}, expected some of {', '.join(TRANSFORMS)}")
+            tables = set(tables)
+
+        jobs = []
         for league, input_dir in self.input_dirs.items():
             # Skip the 'First_Tables' directory since it doesn't have Standard_cleaned.csv
             if league == 'First_Tables':
                 continue
             
-            self._process_league(league, input_dir)
-
-    def _process_league(self, league, input_dir):
-        """Process all files in a league's folder and apply transformations."""
-        files = os.listdir(input_dir)
+            jobs += self._league_jobs(league, input_dir, tables)
+
+        start = time.perf_counter()
+        results = [None] * len(jobs)
+        fingerprints = {}
+        if manifest is not None:
+            for i, (league, input_dir, file) in enumerate(jobs):
+                fingerprints[i] = self._fingerprint(league, input_dir, file, manifest)
+                entry = manifest.fresh('transform', league, file, fingerprints[i], self.storage)
+                if entry:
+                    results[i] = {'league': league, 'file': file, 'status': 'unchanged', 'output': entry['outputs'][0],
+                                  'rows': entry['rows'], 'error': None, 'seconds': 0.0}
+        pending = [i for i, result in enumerate(results) if result is None]
+
+        if max_workers <= 1:
+            for i in pending:
+                results[i] = run_transform_job(self, *jobs[i])
+        elif pending:
+            # Each job reads one cleaned file and writes its own final file
+            with ProcessPoolExecutor(max_workers=max_workers, initializer=init_transform_worker,
+                                     initargs=(self,)) as executor:
+                futures = {i: executor.submit(run_transform_job, None, *jobs[i]) for i in pending}
+                for i, future in futures.items():
+                    results[i] = future.result()
+        elapsed = time.perf_counter() - start
+
+        if manifest is not None:
+            for i in pending:
+                league, _, file = jobs[i]
+                if results[i]['status'] == 'transformed':
+                    manifest.record('transform', league, file, fingerprints[i], [results[i]['output']], results[i]['rows'])
+                else:
+                    manifest.forget('transform', league, file)
+            manifest.save()
+
+        failed = [r for r in results if r['status'] == 'failed']
+        unchanged = sum(1 for r in results if r['status'] == 'unchanged')
+        logging.info(f"Transformed {len(results) - len(failed) - unchanged}/{len(results)} files ({unchanged} unchanged), "
+                     f"{sum(r['rows'] for r in results)} rows in {elapsed:.2f}s with {max_workers} workers")
+        for r in failed:
+            logging.warning(f"{r['league']} / {r['file']}: {r['error']}")
+        return results
+
+    def transform_first_tables(self, source_dir=None, manifest=None, league_files=None):
+        """Transform the regrouped leagues, teams and players tables into the First_Tables folder.
+
+        They run in that order so every table's ids are indexed before the next one resolves them;
+        players take their team from the Standard_cleaned table of every league, or from league_files
+        (e.g. every season's, newest first, as the first one listing a player wins). With a StageManifest,
+        the three tables are only transformed again when one of their inputs changed. Returns the output paths.
+        """
+        source_dir = source_dir or self.input_dirs['First_Tables']
+        league_files = league_files or [os.path.join(input_dir, "Standard_cleaned.csv")
+                                        for league, input_dir in self.input_dirs.items() if league != 'First_Tables']
+        os.makedirs(self.first_tables_dir, exist_ok=True)
+
+        fingerprint = None
+        if manifest is not None:
+            salt = ''.join(code_hash(TRANSFORMS[key]['transform']) for key in ('leagues', 'teams', 'players'))
+            fingerprint = manifest.fingerprint(
+                self.storage, [os.path.join(source_dir, f"{key}.csv") for key in ('leagues', 'teams', 'players')]
+                + league_files, salt)
+            entry = manifest.fresh('transform', 'First_Tables', 'first_tables', fingerprint, self.storage)
+            if entry:
+                # The indexes were built from these unchanged tables in __init__
+                return entry['outputs']
+
+        output_paths = []
+        rows = 0
+        for key in ('leagues', 'teams', 'players'):
+            df = self._transform_frame(self.storage.read(os.path.join(source_dir, f"{key}.csv")), key, league_files)
+            output_path = self.storage.write(df, os.path.join(self.first_tables_dir, f"{key}.csv"),
+                                             schema=TABLE_COLUMNS[TRANSFORMS[key]['table']])
+            print(f"Saved transformed file to {output_path}")
+            output_paths.append(output_path)
+            rows += len(df)
+        self.teams_df = self.storage.read(os.path.join(self.first_tables_dir, "teams.csv"))
+
+        if manifest is not None:
+            manifest.record('transform', 'First_Tables', 'first_tables', fingerprint, output_paths, rows)
+            manifest.save()
+        return output_paths
+
+    def _fingerprint(self, league, input_dir, file, manifest):
+        """Manifest fingerprint of a (league, file) job.
+
+        Besides the cleaned file it covers the final teams and players tables the ids resolve
+        through, and the code of the transform and the column schema it produces.
+        """
+        spec = TRANSFORMS[table_key(file, league)]
+        inputs = [os.path.join(input_dir, file)]
+        if spec.get('needs_league_file'):
+            inputs.append(os.path.join(input_dir, "Standard_cleaned.csv"))
+        inputs += [os.path.join(self.first_tables_dir, f"{table}.csv") for table in ('teams', 'players')]
+        salt = code_hash(spec['transform']) + repr(TABLE_COLUMNS[spec['table']])
+        salt += code_hash(stat_ids) + (self.season or SEASON)  # Rows without ids get their stat_id here
+        return manifest.fingerprint(self.storage, inputs, salt)
+
+    def _league_jobs(self, league, input_dir, tables=None):
+        """List the (league, input_dir, file) jobs of a league folder, failing on files without a transform."""
+        files = self.storage.list_tables(input_dir)
         
         # Get the league file path for player-team mapping from the cleaned data folder
         league_file_path = os.path.join(input_dir, "Standard_cleaned.csv")
         
-        if not os.path.exists(league_file_path):
+        if not self.storage.exists(league_file_path):
             print(f"Error: {league_file_path} does not exist.")
-            return  # Skip processing this league if the file does not exist
-        
+            return []  # Skip processing this league if the file does not exist
+
+        jobs = []
         for file in files:
-            file_path = os.path.join(input_dir, file)
-            if file.endswith('.csv'):
-                df = pd.read_csv(file_path)
-                
-                # Match file type to the correct transformation function
-                
-                # First Tables
-                if 'leagues' in file:
-                    df = self._transform_leagues(df)
-                elif 'teams' in file:
-                    df = self._transform_teams(df)
-                elif 'players' in file:
-                    df = self._transform_players(df, league_file_path)  # Pass the correct league_file_path here
-                
-                # Non-squad league data
-                elif 'Keeper_Adv' in file:
-                    df = self._transform_advanced_goalkeeping(df)
-                elif 'Defense' in file and 'Squad' not in file:
-                    df = self._transform_defensive_actions(df)
-                elif 'Gca' in file and 'Squad' not in file:
-                    df = self._transform_goal_and_shot_creation(df)
-                elif 'Keeper' in file and 'Adv' not in file and 'Squad' not in file:
-                    df = self._transform_goalkeeping(df)
-                elif 'Misc_cleaned' in file and 'Squad' not in file:
-                    df = self._transform_miscellaneous_stats(df)
-                elif 'Passing_Types' in file and 'Squad' not in file:
-                    df = self._transform_pass_types(df)
-                elif 'Passing_cleaned' in file and 'Squad' not in file:
-                    df = self._transform_passing(df)
-                elif 'Playing_Time' in file and 'Squad' not in file:
-                    df = self._transform_playing_time(df)
-                elif 'Possession' in file and 'Squad' not in file:
-                    df = self._transform_possession(df)
-                elif 'Shooting' in file and 'Squad' not in file:
-                    df = self._transform_shooting(df)
-                elif 'Standard' in file and 'Squad' not in file:
-                    df = self._transform_standard_stats(df)
-                
-                # Squad data
-                elif 'Squad_Advanced_Goalkeeping' in file:
-                    df = self._transform_team_advanced_goalkeeping(df)
-                elif 'Squad_Defensive_Actions' in file:
-                    df = self._transform_team_defensive_actions(df)
-                elif 'Squad_Goal_and_Shot_Creation' in file:
-                    df = self._transform_team_goal_and_shot_creation(df)
-                elif 'Squad_Goalkeeping' in file:
-                    df = self._transform_team_goalkeeping(df)
-                elif 'Squad_Miscellaneous_Stats' in file:
-                    df = self._transform_team_miscellaneous_stats(df)
-                elif 'Squad_Pass_Types' in file:
-                    df = self._transform_team_pass_types(df)
-                elif 'Squad_Passing' in file and 'Pass_Types' not in file:
-                    df = self._transform_team_passing(df)
-                elif 'Squad_Playing_Time' in file:
-                    df = self._transform_team_playing_time(df)
-                elif 'Squad_Possession' in file:
-                    df = self._transform_team_possession(df)
-                elif 'Squad_Shooting' in file:
-                    df = self._transform_team_shooting(df)
-                elif 'Squad_Standard_Stats' in file:
-                    df = self._transform_team_standard_stats(df)
-                
-                # Save transformed DataFrame
-                self._save_transformed_data(df, league, file)
+            # Match the file to its transformation; unknown files are an error, not a silent copy
+            key = table_key(file, league)
+            if key not in TRANSFORMS:
+                raise ValueError(f"No transform registered for {file} in {league} (table key {key!r})")
+            if tables is None or key in tables:
+                jobs.append((league, input_dir, file))
+        return jobs
+
+    def _process_league(self, league, input_dir, tables=None):
+        """Process all files (or the given table keys) in a league's folder and apply transformations."""
+        for job in self._league_jobs(league, input_dir, tables):
+            self._transform_file(*job)
+
+    def _transform_frame(self, df, key, league_file_path, league=None):
+        """Apply the registered transform of a table key and fill its player_id / team_id.
+
+        Stat rows whose player or team has no id get their stat_id here, hashed from the names the
+        final file no longer carries; the loader derives every other stat_id from the ids.
+        """
+        # Player / Squad names resolve to player_id / team_id once the transform has run
+        names = self.ids.entity_names(df)
+
+        spec = TRANSFORMS[key]
+        if spec.get('needs_league_file'):
+            df = spec['transform'](self, df, league_file_path)
+        else:
+            df = spec['transform'](self, df)
+        df = self.ids.fill_ids(df, names)
+        self.ids.check_ids(df, spec['table'])
+
+        if 'stat_id' in df.columns:
+            entity_columns = [col for col in STAT_ENTITY_COLUMNS if col in df.columns]
+            unresolved = df[entity_columns].isna().all(axis=1) & df['stat_id'].isna()
+            natural_keys = self.ids.natural_keys(names)
+            if unresolved.any() and natural_keys is not None:
+                rows = unresolved & natural_keys.reindex(df.index).notna()
+                # Player, Born and Squad identify a row on their own, so chunking cannot change these ids
+                df.loc[rows, 'stat_id'] = stat_ids(df[rows], league, self.season or SEASON, key,
+                                                   natural_keys.reindex(df.index)[rows]).astype('Int64')
+        return df
+
+    def _transform_file(self, league, input_dir, file, chunk_rows=TRANSFORM_CHUNK_ROWS):
+        """Transform one cleaned file into final_data and return (output path, rows).
+
+        Stat tables are streamed chunk_rows rows at a time; the output only replaces the
+        previous file once every chunk has been written.
+        """
+        key = table_key(file, league)
+        file_path = os.path.join(input_dir, file)
+        league_file_path = os.path.join(input_dir, "Standard_cleaned.csv")
+
+        if TRANSFORMS[key].get('whole_file'):
+            df = self._transform_frame(self.storage.read(file_path), key, league_file_path, league)
+            return self._save_transformed_data(df, league, file), len(df)
+
+        chunks = (self._transform_frame(chunk, key, league_file_path, league)
+                  for chunk in self.storage.read_chunks(file_path, chunk_rows))
+        output_path = os.path.join(partition_dir(self.output_dir, league, self.season), file)
+        output_path, rows = self.storage.write_chunks(chunks, output_path, schema=TABLE_COLUMNS[TRANSFORMS[key]['table']])
+        print(f"Saved transformed file to {output_path}")
+        return output_path, rows
 
     def _save_transformed_data(self, df, league, filename):
-        """Save the transformed DataFrame to the respective league folder."""
-        league_output_dir = os.path.join(self.output_dir, league)
-        output_path = os.path.join(league_output_dir, filename)
-        df.to_csv(output_path, index=False)
+        """Save the transformed DataFrame to the respective league (and season) folder."""
+        league_output_dir = partition_dir(self.output_dir, league, self.season)
+        schema = TABLE_COLUMNS[TRANSFORMS[table_key(filename, league)]['table']]
+        # Temp file + rename, never half-written
+        output_path = self.storage.write(df, os.path.join(league_output_dir, filename), schema=schema)
         print(f"Saved transformed file to {output_path}")
+        return output_path
 
     def _transform_leagues(self, df):
         """Transform the Leagues data to match the schema."""
@@ -138,7 +297,9 @@ class FinalDataTransformation:
             'league_name': 'league_name'
         }, inplace=True)
         
-        return df[['league_id', 'league_name']].astype({'league_id': 'int'})  # Ensure correct column order and data type
+        df = to_schema(df, 'leagues')  # Ensure correct column order and data type
+        self.ids.update('leagues', df)
+        return df
 
 
     def _transform_teams(self, df):
@@ -164,68 +325,51 @@ class FinalDataTransformation:
                 'Torino', 'Udinese', 'Venezia']
         }
 
-        # Initialize the team_id as an empty list
-        df['team_id'] = range(1, len(df) + 1)  # Generating unique team_id
+        # Hash the team_id from the team name, so it does not move when the league table reorders teams
+        df['team_id'] = hash_ids(df['team_name'])
         
-        # Map the league_id based on team name
-        def get_league_id(team_name):
-            for league_id, teams in league_mapping.items():
-                if team_name in teams:
-                    return league_id
-            return None  # If no match, return None
-
-        df['league_id'] = df['team_name'].apply(get_league_id)
+        # Map the league_id based on team name through a team -> league_id index
+        team_league_ids = {team: league_id for league_id, teams in league_mapping.items() for team in teams}
+        df['league_id'] = df['team_name'].map(team_league_ids)
+        if 'league_name' in df.columns:
+            # Teams missing from the mapping (promoted clubs, synthetic data) take the league regroup found them in
+            df['league_id'] = df['league_id'].fillna(self.ids.league_ids(df['league_name']))
 
         # Ensure the columns are in the correct order and the right data types
-        df = df[['team_id', 'team_name', 'league_id']].astype({
-            'team_id': 'int64',
-            'league_id': 'int64',
-            'team_name': 'string'
-        })
+        df = to_schema(df, 'teams')
+        self.ids.update('teams', df)
 
         return df
 
     def _transform_players(self, df, league_file_path):
-        """Transform the Players data to match the schema."""
-        
-        # Load the teams.csv to get the team_name and team_id mapping
-        teams_df = pd.read_csv(r"C:\Users\asus\Desktop\Football_project\final_data\First_Tables\teams.csv")
+        """Transform the Players data to match the schema.
+
+        league_file_path is one league table with 'Player', 'Born' and 'Squad' columns, or a list of them.
+        """
         
         # Load the league data that contains the 'Squad' (team_name) and 'Player' (player_name)
-        league_df = pd.read_csv(league_file_path)
-        
-        # Merge the teams dataframe with league dataframe based on 'Squad' column from league and 'team_name' from teams
-        merged_df = pd.merge(df, league_df[['Player', 'Squad']], left_on='player_name', right_on='Player', how='left')
+        columns = ['Player', 'Born', 'Squad']
+        if isinstance(league_file_path, (list, tuple)):
+            league_df = pd.concat([self.storage.read(path, columns=columns)
+                                   for path in league_file_path if self.storage.exists(path)], ignore_index=True)
+        else:
+            league_df = self.storage.read(league_file_path, columns=columns)
         
-        # Merge again to assign team_id from teams.csv based on the Squad (team_name)
-        merged_df = pd.merge(merged_df, teams_df[['team_id', 'team_name']], left_on='Squad', right_on='team_name', how='left')
-        
-        # Drop unnecessary columns
-        merged_df.drop(columns=['Player', 'Squad', 'team_name'], inplace=True)
-
-        # Rename columns to match the schema
-        merged_df.rename(columns={
-            'player_name': 'player_name',
-            'nation': 'nation',
-            'position': 'position',
-            'age': 'age',
-            'date_of_birth': 'date_of_birth',
-            'team_id': 'team_id'
-        }, inplace=True)
+        # A player is a name and birth year, so namesakes ("Danilo", "Rodri") stay separate players
+        league_df['player_key'] = player_keys(league_df['Player'], league_df['Born'])
+        merged_df = df.assign(player_key=player_keys(df['player_name'], df['date_of_birth']))
+        merged_df = merged_df.drop_duplicates(subset='player_key').reset_index(drop=True)
 
-        # Add 'player_id' column, initialized with None
-        merged_df['player_id'] = None
+        # Resolve each player's Squad, then the Squad's team_id, through hash indexes instead of merges
+        player_squads = league_df.drop_duplicates(subset='player_key').set_index('player_key')['Squad']
+        merged_df['team_id'] = self.ids.team_ids(merged_df['player_key'].map(player_squads))
 
-        # Reorder the columns: player_id, player_name, nation, position, team_id, age, date_of_birth
-        merged_df = merged_df[['player_id', 'player_name', 'nation', 'position', 'team_id', 'age', 'date_of_birth']]
+        # Hash the ids from the same key, so a player keeps their id when others join or leave the roster
+        merged_df['player_id'] = player_ids(merged_df['player_name'], merged_df['date_of_birth'])
 
-        # Set correct data types
-        merged_df = merged_df.astype({
-            'player_id': 'Int64',  # Nullable integer for player_id
-            'team_id': 'Int64',    # Nullable integer for team_id
-            'age': 'int',
-            'date_of_birth': 'float'  # For proper date formatting, can be updated if required
-        })
+        # Reorder the columns (player_id, player_name, nation, position, team_id, age, date_of_birth) and set the data types
+        merged_df = to_schema(merged_df, 'players')
+        self.ids.update('players', merged_df)
 
         return merged_df
 
@@ -266,35 +410,7 @@ class FinalDataTransformation:
         }, inplace=True)
 
         # Return columns in the correct order for database insertion
-        return df[['stat_id', 'player_id', 'ninety_s', 'ga', 'pka', 'fk', 'ck', 'og', 'psxg', 'psxg_per_sot',
-                'psxg_plus_minus', 'psxg_plus_minus_per_90', 'cmp', 'att', 'cmp_percent', 'att_gk', 'thr',
-                'launch_percent', 'avg_len', 'opp', 'stp', 'stp_percent', 'opa', 'opa_per_90', 'avg_dist']].astype({
-            'stat_id': 'Int64',  # Nullable integer
-            'player_id': 'Int64',  # Nullable integer
-            'ninety_s': 'float',
-            'ga': 'int',
-            'pka': 'int',
-            'fk': 'int',
-            'ck': 'int',
-            'og': 'int',
-            'psxg': 'float',
-            'psxg_per_sot': 'float',
-            'psxg_plus_minus': 'float',
-            'psxg_plus_minus_per_90': 'float',
-            'cmp': 'int',
-            'att': 'int',
-            'cmp_percent': 'float',
-            'att_gk': 'int',
-            'thr': 'int',
-            'launch_percent': 'float',
-            'avg_len': 'float',
-            'opp': 'int',
-            'stp': 'int',
-            'stp_percent': 'float',
-            'opa': 'int',
-            'opa_per_90': 'float',
-            'avg_dist': 'float'
-        })
+        return to_schema(df, 'player_advanced_goalkeeping')
 
                    
     def _transform_defensive_actions(self, df):
@@ -328,29 +444,7 @@ class FinalDataTransformation:
         }, inplace=True)
 
         # Return columns in the correct order for database insertion
-        return df[['stat_id', 'player_id', 'ninety_s', 'tkl_tackles', 'tklw_tackles', 'def_3rd_tackles', 'mid_3rd_tackles', 
-                'att_3rd_tackles', 'tkl_challenges', 'att_challenges', 'tkl_percent_challenges', 'lost_challenges', 
-                'blocks_blocks', 'sh_blocks', 'pass_blocks', 'interceptions', 'tkl_plus_int', 'clr', 'err']].astype({
-            'stat_id': 'Int64',  # Nullable integer
-            'player_id': 'Int64',  # Nullable integer
-            'ninety_s': 'float',
-            'tkl_tackles': 'int',
-            'tklw_tackles': 'int',
-            'def_3rd_tackles': 'int',
-            'mid_3rd_tackles': 'int',
-            'att_3rd_tackles': 'int',
-            'tkl_challenges': 'int',
-            'att_challenges': 'int',
-            'tkl_percent_challenges': 'float',
-            'lost_challenges': 'int',
-            'blocks_blocks': 'int',
-            'sh_blocks': 'int',
-            'pass_blocks': 'int',
-            'interceptions': 'int',
-            'tkl_plus_int': 'int',
-            'clr': 'int',
-            'err': 'int'
-        })
+        return to_schema(df, 'player_defensive_actions')
     
     def _transform_goal_and_shot_creation(self, df):
         """Transform the Goal and Shot Creation data to match the schema."""
@@ -383,29 +477,7 @@ class FinalDataTransformation:
         }, inplace=True)
 
         # Return columns in the correct order for database insertion
-        return df[['stat_id', 'player_id', 'ninety_s', 'sca', 'sca_per_90', 'passlive_sca', 'passdead_sca', 'to_sca', 
-                'sh_sca', 'fld_sca', 'def_sca', 'gca', 'gca_per_90', 'passlive_gca', 'passdead_gca', 'to_gca', 
-                'sh_gca', 'fld_gca', 'def_gca']].astype({
-            'stat_id': 'Int64',  # Nullable integer
-            'player_id': 'Int64',  # Nullable integer
-            'ninety_s': 'float',
-            'sca': 'int',
-            'sca_per_90': 'float',
-            'passlive_sca': 'int',
-            'passdead_sca': 'int',
-            'to_sca': 'int',
-            'sh_sca': 'int',
-            'fld_sca': 'int',
-            'def_sca': 'int',
-            'gca': 'int',
-            'gca_per_90': 'float',
-            'passlive_gca': 'int',
-            'passdead_gca': 'int',
-            'to_gca': 'int',
-            'sh_gca': 'int',
-            'fld_gca': 'int',
-            'def_gca': 'int'
-        })
+        return to_schema(df, 'player_goal_and_shot_creation')
 
     def _transform_goalkeeping(self, df):
         """Transform the Goalkeeping data to match the schema."""
@@ -439,29 +511,7 @@ class FinalDataTransformation:
         }, inplace=True)
 
         # Return columns in the correct order for database insertion
-        return df[['stat_id', 'player_id', 'mp', 'starts', 'min', 'ninety_s', 'ga', 'ga_per_90', 'sota', 'saves', 
-                'save_percent', 'w', 'd', 'l', 'cs', 'cs_percent', 'pkatt', 'pka', 'pk_sv', 'pk_missed']].astype({
-            'stat_id': 'Int64',  # Nullable integer
-            'player_id': 'Int64',  # Nullable integer
-            'mp': 'int',
-            'starts': 'int',
-            'min': 'int',
-            'ninety_s': 'float',
-            'ga': 'int',
-            'ga_per_90': 'float',
-            'sota': 'int',
-            'saves': 'int',
-            'save_percent': 'float',
-            'w': 'int',
-            'd': 'int',
-            'l': 'int',
-            'cs': 'int',
-            'cs_percent': 'float',
-            'pkatt': 'int',
-            'pka': 'int',
-            'pk_sv': 'int',
-            'pk_missed': 'int'
-        })
+        return to_schema(df, 'player_goalkeeping')
 
     def _transform_miscellaneous_stats(self, df):
         """Transform the Miscellaneous Stats data to match the schema."""
@@ -494,28 +544,7 @@ class FinalDataTransformation:
         }, inplace=True)
 
         # Return columns in the correct order for database insertion
-        return df[['stat_id', 'player_id', 'ninety_s', 'crd_y', 'crd_r', 'two_crd_y', 'fls', 'fld', 'off', 'crs', 
-                'interceptions', 'tklw', 'pkwon', 'pkcon', 'og', 'recov', 'won', 'lost', 'won_percent']].astype({
-            'stat_id': 'Int64',  # Nullable integer
-            'player_id': 'Int64',  # Nullable integer
-            'ninety_s': 'float',
-            'crd_y': 'int',
-            'crd_r': 'int',
-            'two_crd_y': 'int',
-            'fls': 'int',
-            'fld': 'int',
-            'off': 'int',
-            'crs': 'int',
-            'interceptions': 'int',
-            'tklw': 'int',
-            'pkwon': 'int',
-            'pkcon': 'int',
-            'og': 'int',
-            'recov': 'int',
-            'won': 'int',
-            'lost': 'int',
-            'won_percent': 'float'
-        })
+        return to_schema(df, 'player_miscellaneous_stats')
     
     def _transform_pass_types(self, df):
         """Transform the Pass Types data to match the schema."""
@@ -547,27 +576,7 @@ class FinalDataTransformation:
         }, inplace=True)
 
         # Return columns in the correct order for database insertion
-        return df[['stat_id', 'player_id', 'ninety_s', 'att', 'live', 'dead', 'fk', 'tb', 'sw', 'crs', 'ti', 'ck', 
-                'inn', 'outt', 'str', 'cmp', 'off', 'blocks']].astype({
-            'stat_id': 'Int64',  # Nullable integer
-            'player_id': 'Int64',  # Nullable integer
-            'ninety_s': 'float',
-            'att': 'int',
-            'live': 'int',
-            'dead': 'int',
-            'fk': 'int',
-            'tb': 'int',
-            'sw': 'int',
-            'crs': 'int',
-            'ti': 'int',
-            'ck': 'int',
-            'inn': 'int',
-            'outt': 'int',
-            'str': 'int',
-            'cmp': 'int',
-            'off': 'int',
-            'blocks': 'int'
-        })
+        return to_schema(df, 'player_pass_types')
 
     def _transform_passing(self, df):
         """Transform the Passing data to match the schema."""
@@ -606,36 +615,7 @@ class FinalDataTransformation:
         }, inplace=True)
 
         # Return columns in the correct order for database insertion
-        return df[['stat_id', 'player_id', 'ninety_s', 'cmp_total', 'att_total', 'cmp_percent_total', 'tot_dist_total',
-                'prg_dist_total', 'cmp_short', 'att_short', 'cmp_percent_short', 'cmp_medium', 'att_medium',
-                'cmp_percent_medium', 'cmp_long', 'att_long', 'cmp_percent_long', 'ast', 'xa', 'xag', 'a_xag', 'kp',
-                'one_third_ppa', 'crspa', 'prgp']].astype({
-            'stat_id': 'Int64',  # Nullable integer
-            'player_id': 'Int64',  # Nullable integer
-            'ninety_s': 'float',
-            'cmp_total': 'int',
-            'att_total': 'int',
-            'cmp_percent_total': 'float',
-            'tot_dist_total': 'float',
-            'prg_dist_total': 'float',
-            'cmp_short': 'int',
-            'att_short': 'int',
-            'cmp_percent_short': 'float',
-            'cmp_medium': 'int',
-            'att_medium': 'int',
-            'cmp_percent_medium': 'float',
-            'cmp_long': 'int',
-            'att_long': 'int',
-            'cmp_percent_long': 'float',
-            'ast': 'int',
-            'xa': 'float',
-            'xag': 'float',
-            'a_xag': 'float',  # Corrected here
-            'kp': 'int',
-            'one_third_ppa': 'int',
-            'crspa': 'int',
-            'prgp': 'int'
-        })
+        return to_schema(df, 'player_passing')
 
     def _transform_playing_time(self, df):
         """Transform the Playing Time data to match the schema."""
@@ -669,30 +649,7 @@ class FinalDataTransformation:
         }, inplace=True)
 
         # Return columns in the correct order for database insertion
-        return df[['stat_id', 'player_id', 'mp', 'min', 'ninety_s', 'starts', 'mn_per_start', 'compl', 'subs', 
-                'mn_per_subs', 'unsub', 'ppm', 'on_g', 'on_ga', 'plus_minus', 'plus_minus_per_90', 'onxg', 'onxga', 
-                'xg_plus_minus', 'xg_plus_minus_per_90']].astype({
-            'stat_id': 'Int64',  # Nullable integer
-            'player_id': 'Int64',  # Nullable integer
-            'mp': 'int',
-            'min': 'int',
-            'ninety_s': 'float',
-            'starts': 'int',
-            'mn_per_start': 'float',
-            'compl': 'int',
-            'subs': 'int',
-            'mn_per_subs': 'float',
-            'unsub': 'int',
-            'ppm': 'float',
-            'on_g': 'int',
-            'on_ga': 'int',
-            'plus_minus': 'int',
-            'plus_minus_per_90': 'float',
-            'onxg': 'float',
-            'onxga': 'float',
-            'xg_plus_minus': 'float',
-            'xg_plus_minus_per_90': 'float'
-        })
+        return to_schema(df, 'player_playing_time')
 
     def _transform_possession(self, df):
         """Transform the Possession data to match the schema."""
@@ -731,35 +688,7 @@ class FinalDataTransformation:
         }, inplace=True)
 
         # Return columns in the correct order for database insertion
-        return df[['stat_id', 'player_id', 'ninety_s', 'touches', 'def_pen', 'def_3rd', 'mid_3rd', 'att_3rd', 'att_pen', 'live', 
-                'att', 'succ', 'succ_percent', 'tkld', 'tkld_percent', 'carries', 'tot_dist', 'prg_dist', 'prgc', 
-                'one_third', 'cpa', 'mis', 'dis', 'rec', 'prgr']].astype({
-            'stat_id': 'Int64',  # Nullable integer
-            'player_id': 'Int64',  # Nullable integer
-            'ninety_s': 'float',
-            'touches': 'int',
-            'def_pen': 'int',
-            'def_3rd': 'int',
-            'mid_3rd': 'int',
-            'att_3rd': 'int',
-            'att_pen': 'int',
-            'live': 'int',
-            'att': 'int',
-            'succ': 'int',
-            'succ_percent': 'float',
-            'tkld': 'int',
-            'tkld_percent': 'float',
-            'carries': 'int',
-            'tot_dist': 'float',
-            'prg_dist': 'float',
-            'prgc': 'int',
-            'one_third': 'int',
-            'cpa': 'int',
-            'mis': 'int',
-            'dis': 'int',
-            'rec': 'int',
-            'prgr': 'int'
-        })
+        return to_schema(df, 'player_possession')
                    
     def _transform_shooting(self, df):
         """Transform the Shooting data to match the schema."""
@@ -793,29 +722,7 @@ class FinalDataTransformation:
         }, inplace=True)
 
         # Return columns in the correct order for database insertion
-        return df[['stat_id', 'player_id', 'ninety_s', 'gls', 'sh', 'sot', 'sot_percent', 'sh_per_90', 'sot_per_90', 'g_per_sh', 
-                'g_per_sot', 'dist', 'fk', 'pk', 'pkatt', 'xg', 'npxg', 'npxg_per_sh', 'g_minus_xg', 'npg_minus_xg']].astype({
-            'stat_id': 'Int64',  # Nullable integer
-            'player_id': 'Int64',  # Nullable integer
-            'ninety_s': 'float',
-            'gls': 'int',
-            'sh': 'int',
-            'sot': 'int',
-            'sot_percent': 'float',
-            'sh_per_90': 'float',
-            'sot_per_90': 'float',
-            'g_per_sh': 'float',
-            'g_per_sot': 'float',
-            'dist': 'float',
-            'fk': 'int',
-            'pk': 'int',
-            'pkatt': 'int',
-            'xg': 'float',
-            'npxg': 'float',
-            'npxg_per_sh': 'float',
-            'g_minus_xg': 'float',
-            'npg_minus_xg': 'float'
-        })
+        return to_schema(df, 'player_shooting')
 
     def _transform_standard_stats(self, df):
         """Transform the Standard Stats data to match the schema."""
@@ -855,36 +762,7 @@ class FinalDataTransformation:
         }, inplace=True)
 
         # Return columns in the correct order for database insertion
-        return df[['stat_id', 'player_id', 'mp', 'min', 'ninety_s', 'starts', 'gls', 'gls_per_90', 'ast', 
-                'ast_per_90', 'g_a', 'g_a_per_90', 'g_pk', 'g_pk_per_90', 'pk', 'pkatt', 'crd_y', 'crd_r', 'xg', 
-                'xg_per_90', 'npxg', 'npxg_per_90', 'xag', 'xag_per_90', 'npxg_xag', 'npxg_xag_per_90']].astype({
-            'stat_id': 'Int64',  # Nullable integer
-            'player_id': 'Int64',  # Nullable integer
-            'mp': 'int',
-            'min': 'int',
-            'ninety_s': 'float',
-            'starts': 'int',
-            'gls': 'int',
-            'gls_per_90': 'float',
-            'ast': 'int',
-            'ast_per_90': 'float',
-            'g_a': 'int',
-            'g_a_per_90': 'float',
-            'g_pk': 'int',
-            'g_pk_per_90': 'float',
-            'pk': 'int',
-            'pkatt': 'int',
-            'crd_y': 'int',
-            'crd_r': 'int',
-            'xg': 'float',
-            'xg_per_90': 'float',
-            'npxg': 'float',
-            'npxg_per_90': 'float',
-            'xag': 'float',
-            'xag_per_90': 'float',
-            'npxg_xag': 'float',
-            'npxg_xag_per_90': 'float'
-        })
+        return to_schema(df, 'player_standard_stats')
 
 
     
@@ -929,35 +807,7 @@ class FinalDataTransformation:
         }, inplace=True)
 
         # Return columns in the correct order for database insertion
-        return df[['stat_id', 'team_id', 'ninety_s', 'ga', 'pka', 'fk', 'ck', 'og', 'psxg', 'psxg_per_sot', 'psxg_plus_minus', 
-                'psxg_plus_minus_per_90', 'cmp', 'att', 'cmp_percent', 'att_gk', 'thr', 'launch_percent', 'avg_len', 
-                'opp', 'stp', 'stp_percent', 'opa', 'opa_per_90', 'avg_dist']].astype({
-            'stat_id': 'Int64',  # Nullable integer
-            'team_id': 'Int64',  # Nullable integer
-            'ninety_s': 'float',
-            'ga': 'int',
-            'pka': 'int',
-            'fk': 'int',
-            'ck': 'int',
-            'og': 'int',
-            'psxg': 'float',
-            'psxg_per_sot': 'float',
-            'psxg_plus_minus': 'float',
-            'psxg_plus_minus_per_90': 'float',
-            'cmp': 'int',
-            'att': 'int',
-            'cmp_percent': 'float',
-            'att_gk': 'int',
-            'thr': 'int',
-            'launch_percent': 'float',
-            'avg_len': 'float',
-            'opp': 'int',
-            'stp': 'int',
-            'stp_percent': 'float',
-            'opa': 'int',
-            'opa_per_90': 'float',
-            'avg_dist': 'float'
-        })
+        return to_schema(df, 'team_advanced_goalkeeping')
 
     def _transform_team_defensive_actions(self, df):
         """Transform the Team Defensive Actions data to match the schema."""
@@ -990,29 +840,7 @@ class FinalDataTransformation:
         }, inplace=True)
 
         # Return columns in the correct order for database insertion
-        return df[['stat_id', 'team_id', 'ninety_s', 'tkl_tackles', 'tklw_tackles', 'def_3rd_tackles', 'mid_3rd_tackles', 
-                'att_3rd_tackles', 'tkl_challenges', 'att_challenges', 'tkl_percent_challenges', 'lost_challenges', 
-                'blocks_blocks', 'sh_blocks', 'pass_blocks', 'interceptions', 'tkl_plus_int', 'clr', 'err']].astype({
-            'stat_id': 'Int64',  # Nullable integer
-            'team_id': 'Int64',  # Nullable integer
-            'ninety_s': 'float',
-            'tkl_tackles': 'int',
-            'tklw_tackles': 'int',
-            'def_3rd_tackles': 'int',
-            'mid_3rd_tackles': 'int',
-            'att_3rd_tackles': 'int',
-            'tkl_challenges': 'int',
-            'att_challenges': 'int',
-            'tkl_percent_challenges': 'float',
-            'lost_challenges': 'int',
-            'blocks_blocks': 'int',
-            'sh_blocks': 'int',
-            'pass_blocks': 'int',
-            'interceptions': 'int',
-            'tkl_plus_int': 'int',
-            'clr': 'int',
-            'err': 'int'
-        })
+        return to_schema(df, 'team_defensive_actions')
 
     def _transform_team_goal_and_shot_creation(self, df):
         """Transform the Team Goal and Shot Creation data to match the schema."""
@@ -1045,29 +873,7 @@ class FinalDataTransformation:
         }, inplace=True)
 
         # Return columns in the correct order for database insertion
-        return df[['stat_id', 'team_id', 'ninety_s', 'sca', 'sca_per_90', 'passlive_sca', 'passdead_sca', 'to_sca', 
-                'sh_sca', 'fld_sca', 'def_sca', 'gca', 'gca_per_90', 'passlive_gca', 'passdead_gca', 'to_gca', 
-                'sh_gca', 'fld_gca', 'def_gca']].astype({
-            'stat_id': 'Int64',  # Nullable integer
-            'team_id': 'Int64',  # Nullable integer
-            'ninety_s': 'float',
-            'sca': 'int',
-            'sca_per_90': 'float',
-            'passlive_sca': 'int',
-            'passdead_sca': 'int',
-            'to_sca': 'int',
-            'sh_sca': 'int',
-            'fld_sca': 'int',
-            'def_sca': 'int',
-            'gca': 'int',
-            'gca_per_90': 'float',
-            'passlive_gca': 'int',
-            'passdead_gca': 'int',
-            'to_gca': 'int',
-            'sh_gca': 'int',
-            'fld_gca': 'int',
-            'def_gca': 'int'
-        })
+        return to_schema(df, 'team_goal_and_shot_creation')
 
     def _transform_team_goalkeeping(self, df):
         """Transform the Team Goalkeeping data to match the schema."""
@@ -1097,25 +903,7 @@ class FinalDataTransformation:
         }, inplace=True)
 
         # Return columns in the correct order for database insertion
-        return df[['stat_id', 'team_id', 'mp', 'starts', 'min', 'ninety_s', 'ga', 'ga_per_90', 'sota', 'saves', 'save_percent', 
-                'w', 'd', 'l', 'cs', 'cs_percent']].astype({
-            'stat_id': 'Int64',  # Nullable integer
-            'team_id': 'Int64',  # Nullable integer
-            'mp': 'int',
-            'starts': 'int',
-            'min': 'int',
-            'ninety_s': 'float',
-            'ga': 'int',
-            'ga_per_90': 'float',
-            'sota': 'int',
-            'saves': 'int',
-            'save_percent': 'float',
-            'w': 'int',
-            'd': 'int',
-            'l': 'int',
-            'cs': 'int',
-            'cs_percent': 'float'
-        })
+        return to_schema(df, 'team_goalkeeping')
 
     def _transform_team_miscellaneous_stats(self, df):
         """Transform the Team Miscellaneous Stats data to match the schema."""
@@ -1148,28 +936,7 @@ class FinalDataTransformation:
         }, inplace=True)
 
         # Return columns in the correct order for database insertion
-        return df[['stat_id', 'team_id', 'ninety_s', 'crd_y', 'crd_r', 'two_crd_y', 'fls', 'fld', 'off', 'crs', 
-                'interceptions', 'tklw', 'pkwon', 'pkcon', 'og', 'recov', 'won', 'lost', 'won_percent']].astype({
-            'stat_id': 'Int64',  # Nullable integer
-            'team_id': 'Int64',  # Nullable integer
-            'ninety_s': 'float',
-            'crd_y': 'int',
-            'crd_r': 'int',
-            'two_crd_y': 'int',
-            'fls': 'int',
-            'fld': 'int',
-            'off': 'int',
-            'crs': 'int',
-            'interceptions': 'int',
-            'tklw': 'int',
-            'pkwon': 'int',
-            'pkcon': 'int',
-            'og': 'int',
-            'recov': 'int',
-            'won': 'int',
-            'lost': 'int',
-            'won_percent': 'float'
-        })
+        return to_schema(df, 'team_miscellaneous_stats')
 
     def _transform_team_pass_types(self, df):
         """Transform the Team Pass Types data to match the schema."""
@@ -1201,27 +968,7 @@ class FinalDataTransformation:
         }, inplace=True)
 
         # Return columns in the correct order for database insertion
-        return df[['stat_id', 'team_id', 'ninety_s', 'att', 'live', 'dead', 'fk', 'tb', 'sw', 'crs', 'ti', 'ck', 'inn', 'outt', 
-                'str', 'cmp', 'off', 'blocks']].astype({
-            'stat_id': 'Int64',  # Nullable integer
-            'team_id': 'Int64',  # Nullable integer
-            'ninety_s': 'float',
-            'att': 'int',
-            'live': 'int',
-            'dead': 'int',
-            'fk': 'int',
-            'tb': 'int',
-            'sw': 'int',
-            'crs': 'int',
-            'ti': 'int',
-            'ck': 'int',
-            'inn': 'int',
-            'outt': 'int',
-            'str': 'int',
-            'cmp': 'int',
-            'off': 'int',
-            'blocks': 'int'
-        })
+        return to_schema(df, 'team_pass_types')
 
     def _transform_team_passing(self, df):
         """Transform the Team Passing data to match the schema."""
@@ -1259,33 +1006,7 @@ class FinalDataTransformation:
         }, inplace=True)
 
         # Return columns in the correct order for database insertion
-        return df[['stat_id', 'team_id', 'ninety_s', 'cmp_total', 'att_total', 'cmp_percent_total', 'tot_dist_total', 
-                'prg_dist_total', 'cmp_short', 'att_short', 'cmp_percent_short', 'cmp_medium', 'att_medium', 
-                'cmp_percent_medium', 'cmp_long', 'att_long', 'cmp_percent_long', 'ast', 'kp', 'one_third', 'crspa', 
-                'prgp']].astype({
-            'stat_id': 'Int64',  # Nullable integer
-            'team_id': 'Int64',  # Nullable integer
-            'ninety_s': 'float',
-            'cmp_total': 'int',
-            'att_total': 'int',
-            'cmp_percent_total': 'float',
-            'tot_dist_total': 'float',
-            'prg_dist_total': 'float',
-            'cmp_short': 'int',
-            'att_short': 'int',
-            'cmp_percent_short': 'float',
-            'cmp_medium': 'int',
-            'att_medium': 'int',
-            'cmp_percent_medium': 'float',
-            'cmp_long': 'int',
-            'att_long': 'int',
-            'cmp_percent_long': 'float',
-            'ast': 'int',
-            'kp': 'int',
-            'one_third': 'int',
-            'crspa': 'int',
-            'prgp': 'int'
-        })
+        return to_schema(df, 'team_passing')
 
     def _transform_team_playing_time(self, df):
         """Transform the Team Playing Time data to match the schema."""
@@ -1322,33 +1043,7 @@ class FinalDataTransformation:
         }, inplace=True)
 
         # Return columns in the correct order for database insertion
-        return df[['stat_id', 'team_id', 'age', 'mp', 'min', 'mn_per_mp', 'min_percent', 'ninety_s', 'starts', 
-                'mn_per_start', 'compl', 'subs', 'mn_per_sub', 'unsub', 'ppm', 'on_g', 'on_ga', 'plus_minus', 
-                'plus_minus_per_90', 'onxg', 'onxga', 'xg_plus_minus', 'xg_plus_minus_per_90']].astype({
-            'stat_id': 'Int64',  # Nullable integer
-            'team_id': 'Int64',  # Nullable integer
-            'age': 'float',
-            'mp': 'int',
-            'min': 'int',
-            'mn_per_mp': 'float',
-            'min_percent': 'float',
-            'ninety_s': 'float',
-            'starts': 'int',
-            'mn_per_start': 'float',
-            'compl': 'int',
-            'subs': 'int',
-            'mn_per_sub': 'float',
-            'unsub': 'int',
-            'ppm': 'float',
-            'on_g': 'int',
-            'on_ga': 'int',
-            'plus_minus': 'int',
-            'plus_minus_per_90': 'float',
-            'onxg': 'float',
-            'onxga': 'float',
-            'xg_plus_minus': 'float',
-            'xg_plus_minus_per_90': 'float'
-        })
+        return to_schema(df, 'team_playing_time')
 
     def _transform_team_possession(self, df):
         """Transform the Team Possession data to match the schema."""
@@ -1387,35 +1082,7 @@ class FinalDataTransformation:
         }, inplace=True)
 
         # Return columns in the correct order for database insertion
-        return df[['stat_id', 'team_id', 'ninety_s', 'touches', 'def_pen', 'def_3rd', 'mid_3rd', 'att_3rd', 'att_pen', 
-                'live', 'att', 'succ', 'succ_percent', 'tkld', 'tkld_percent', 'carries', 'tot_dist', 'prg_dist', 
-                'prgc', 'one_third', 'cpa', 'mis', 'dis', 'rec', 'prgr']].astype({
-            'stat_id': 'Int64',  # Nullable integer
-            'team_id': 'Int64',  # Nullable integer
-            'ninety_s': 'float',
-            'touches': 'int',
-            'def_pen': 'int',
-            'def_3rd': 'int',
-            'mid_3rd': 'int',
-            'att_3rd': 'int',
-            'att_pen': 'int',
-            'live': 'int',
-            'att': 'int',
-            'succ': 'int',
-            'succ_percent': 'float',
-            'tkld': 'int',
-            'tkld_percent': 'float',
-            'carries': 'int',
-            'tot_dist': 'float',
-            'prg_dist': 'float',
-            'prgc': 'int',
-            'one_third': 'int',
-            'cpa': 'int',
-            'mis': 'int',
-            'dis': 'int',
-            'rec': 'int',
-            'prgr': 'int'
-        })
+        return to_schema(df, 'team_possession')
 
     def _transform_team_shooting(self, df):
         """Transform the Team Shooting data to match the schema."""
@@ -1449,30 +1116,7 @@ class FinalDataTransformation:
         }, inplace=True)
 
         # Return columns in the correct order for database insertion
-        return df[['stat_id', 'team_id', 'ninety_s', 'gls', 'sh', 'sot', 'sot_percent', 'sh_per_90', 'sot_per_90', 
-                'g_per_sh', 'g_per_sot', 'dist', 'fk', 'pk', 'pkatt', 'xg', 'npxg', 'npxg_per_sh', 
-                'g_minus_xg', 'npg_minus_xg']].astype({
-            'stat_id': 'Int64',  # Nullable integer
-            'team_id': 'Int64',  # Nullable integer
-            'ninety_s': 'float',
-            'gls': 'int',
-            'sh': 'int',
-            'sot': 'int',
-            'sot_percent': 'float',
-            'sh_per_90': 'float',
-            'sot_per_90': 'float',
-            'g_per_sh': 'float',
-            'g_per_sot': 'float',
-            'dist': 'float',
-            'fk': 'int',
-            'pk': 'int',
-            'pkatt': 'int',
-            'xg': 'float',
-            'npxg': 'float',
-            'npxg_per_sh': 'float',
-            'g_minus_xg': 'float',
-            'npg_minus_xg': 'float'
-        })
+        return to_schema(df, 'team_shooting')
 
     def _transform_team_standard_stats(self, df):
         """Transform the Team Standard Stats data to match the schema."""
@@ -1514,38 +1158,37 @@ class FinalDataTransformation:
         }, inplace=True)
 
         # Return columns in the correct order for database insertion
-        return df[['stat_id', 'team_id', 'age', 'poss', 'mp', 'starts', 'min', 'ninety_s', 'gls', 'gls_per_90', 
-                'ast', 'ast_per_90', 'g_a', 'g_a_per_90', 'g_pk', 'g_pk_per_90', 'pk', 'pkatt', 'crd_y', 
-                'crd_r', 'xg', 'xg_per_90', 'npxg', 'npxg_per_90', 'xag', 'xag_per_90', 'npxg_xag', 
-                'npxg_xag_per_90']].astype({
-            'stat_id': 'Int64',  # Nullable integer
-            'team_id': 'Int64',  # Nullable integer
-            'age': 'float',
-            'poss': 'float',
-            'mp': 'int',
-            'starts': 'int',
-            'min': 'int',
-            'ninety_s': 'float',
-            'gls': 'int',
-            'gls_per_90': 'float',
-            'ast': 'int',
-            'ast_per_90': 'float',
-            'g_a': 'int',
-            'g_a_per_90': 'float',
-            'g_pk': 'int',
-            'g_pk_per_90': 'float',
-            'pk': 'int',
-            'pkatt': 'int',
-            'crd_y': 'int',
-            'crd_r': 'int',
-            'xg': 'float',
-            'xg_per_90': 'float',
-            'npxg': 'float',
-            'npxg_per_90': 'float',
-            'xag': 'float',
-            'xag_per_90': 'float',
-            'npxg_xag': 'float',
-            'npxg_xag_per_90': 'float'
-        })
+        return to_schema(df, 'team_standard_stats')
                 
 
+
+# Table key -> transform and the schema table (fbref.final_columns) it produces.
+# whole_file tables number their rows, so they are never transformed chunk by chunk.
+TRANSFORMS = {
+    'leagues': {'transform': FinalDataTransformation._transform_leagues, 'table': 'leagues', 'whole_file': True},
+    'teams': {'transform': FinalDataTransformation._transform_teams, 'table': 'teams', 'whole_file': True},
+    'players': {'transform': FinalDataTransformation._transform_players, 'table': 'players', 'needs_league_file': True,
+                'whole_file': True},
+    'Keeper_Adv': {'transform': FinalDataTransformation._transform_advanced_goalkeeping, 'table': 'player_advanced_goalkeeping'},
+    'Defense': {'transform': FinalDataTransformation._transform_defensive_actions, 'table': 'player_defensive_actions'},
+    'Gca': {'transform': FinalDataTransformation._transform_goal_and_shot_creation, 'table': 'player_goal_and_shot_creation'},
+    'Keeper': {'transform': FinalDataTransformation._transform_goalkeeping, 'table': 'player_goalkeeping'},
+    'Misc': {'transform': FinalDataTransformation._transform_miscellaneous_stats, 'table': 'player_miscellaneous_stats'},
+    'Passing_Types': {'transform': FinalDataTransformation._transform_pass_types, 'table': 'player_pass_types'},
+    'Passing': {'transform': FinalDataTransformation._transform_passing, 'table': 'player_passing'},
+    'Playing_Time': {'transform': FinalDataTransformation._transform_playing_time, 'table': 'player_playing_time'},
+    'Possession': {'transform': FinalDataTransformation._transform_possession, 'table': 'player_possession'},
+    'Shooting': {'transform': FinalDataTransformation._transform_shooting, 'table': 'player_shooting'},
+    'Standard': {'transform': FinalDataTransformation._transform_standard_stats, 'table': 'player_standard_stats'},
+    'Squad_Advanced_Goalkeeping': {'transform': FinalDataTransformation._transform_team_advanced_goalkeeping, 'table': 'team_advanced_goalkeeping'},
+    'Squad_Defensive_Actions': {'transform': FinalDataTransformation._transform_team_defensive_actions, 'table': 'team_defensive_actions'},
+    'Squad_Goal_and_Shot_Creation': {'transform': FinalDataTransformation._transform_team_goal_and_shot_creation, 'table': 'team_goal_and_shot_creation'},
+    'Squad_Goalkeeping': {'transform': FinalDataTransformation._transform_team_goalkeeping, 'table': 'team_goalkeeping'},
+    'Squad_Miscellaneous_Stats': {'transform': FinalDataTransformation._transform_team_miscellaneous_stats, 'table': 'team_miscellaneous_stats'},
+    'Squad_Pass_Types': {'transform': FinalDataTransformation._transform_team_pass_types, 'table': 'team_pass_types'},
+    'Squad_Passing': {'transform': FinalDataTransformation._transform_team_passing, 'table': 'team_passing'},
+    'Squad_Playing_Time': {'transform': FinalDataTransformation._transform_team_playing_time, 'table': 'team_playing_time'},
+    'Squad_Possession': {'transform': FinalDataTransformation._transform_team_possession, 'table': 'team_possession'},
+    'Squad_Shooting': {'transform': FinalDataTransformation._transform_team_shooting, 'table': 'team_shooting'},
+    'Squad_Standard_Stats': {'transform': FinalDataTransformation._transform_team_standard_stats, 'table': 'team_standard_stats'}
+}
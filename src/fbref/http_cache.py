@@ -0,0 +1,90 @@
+import os
+import gzip
+import json
+import time
+import hashlib
+import tempfile
+import logging
+from config.fbref_config import HTTP_CACHE_DIR, HTTP_CACHE_TTL, HTTP_CACHE_OFFLINE
+
+class ResponseCache:
+    def __init__(self, cache_dir=HTTP_CACHE_DIR, ttl=HTTP_CACHE_TTL, offline=HTTP_CACHE_OFFLINE):
+        self.cache_dir = cache_dir
+        self.ttl = ttl  # Seconds a cached page is served without revalidation
+        self.offline = offline  # Replay mode: never touch the network
+
+        # Bodies are stored by content hash, the index maps URLs to bodies and validators
+        self.index_dir = os.path.join(cache_dir, 'index')
+        self.bodies_dir = os.path.join(cache_dir, 'bodies')
+        os.makedirs(self.index_dir, exist_ok=True)
+        os.makedirs(self.bodies_dir, exist_ok=True)
+
+    def _index_path(self, url):
+        url_hash = hashlib.sha256(url.encode('utf-8')).hexdigest()
+        return os.path.join(self.index_dir, f"{url_hash}.json")
+
+    def _body_path(self, digest):
+        return os.path.join(self.bodies_dir, digest[:2], f"{digest}.html.gz")
+
+    def _write_atomic(self, path, data):
+        """Write bytes through a temp file so concurrent readers never see partial files."""
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+
+    def lookup(self, url):
+        """Return the cache entry for a URL, or None if it was never cached."""
+        index_path = self._index_path(url)
+        if not os.path.exists(index_path):
+            return None
+        with open(index_path, 'r', encoding='utf-8') as f:
+            entry = json.load(f)
+        if not os.path.exists(self._body_path(entry['digest'])):
+            return None
+        return entry
+
+    def is_fresh(self, entry):
+        """Check whether an entry is young enough to skip revalidation."""
+        return self.ttl is not None and time.time() - entry['fetched_at'] < self.ttl
+
+    def read_body(self, entry):
+        """Decompress and return the cached HTML of an entry."""
+        with gzip.open(self._body_path(entry['digest']), 'rt', encoding='utf-8') as f:
+            return f.read()
+
+    def conditional_headers(self, entry):
+        """Build If-None-Match / If-Modified-Since headers from an entry's validators."""
+        headers = {}
+        if entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        if entry.get('last_modified'):
+            headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+
+    def refresh(self, url, entry):
+        """Mark an entry as revalidated after a 304 Not Modified."""
+        entry['fetched_at'] = time.time()
+        self._write_atomic(self._index_path(url), json.dumps(entry).encode('utf-8'))
+
+    def store(self, url, response):
+        """Store a fetched response body and its validators."""
+        body = response.text.encode('utf-8')
+        digest = hashlib.sha256(body).hexdigest()
+
+        # Identical pages share one compressed body
+        body_path = self._body_path(digest)
+        if not os.path.exists(body_path):
+            self._write_atomic(body_path, gzip.compress(body))
+
+        entry = {
+            'url': url,
+            'digest': digest,
+            'etag': response.headers.get('ETag'),
+            'last_modified': response.headers.get('Last-Modified'),
+            'fetched_at': time.time()
+        }
+        self._write_atomic(self._index_path(url), json.dumps(entry).encode('utf-8'))
+        logging.debug(f"Cached {url} as {digest}")
+        return entry
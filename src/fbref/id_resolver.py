@@ -0,0 +1,159 @@
+import os
+import numpy as np
+import pandas as pd
+from fbref.storage import TableStorage
+
+def build_index(df, name_column, id_column):
+    """Hash index name -> Int64 id, keeping the first id of a repeated name and skipping rows without an id."""
+    if df is None or name_column not in df.columns or id_column not in df.columns:
+        return pd.Series(dtype='Int64')
+    rows = df[[name_column, id_column]].dropna().drop_duplicates(subset=name_column)
+    return pd.Series(rows[id_column].astype('Int64').array, index=rows[name_column].astype(str).to_numpy())
+
+# Entity a stat row is keyed on, in order of preference; rows with neither use their natural key, else their position
+STAT_ENTITY_COLUMNS = ['player_id', 'team_id']
+
+def hash_ids(keys):
+    """Deterministic 63-bit ids of a Series or frame of keys; the top bit is dropped so every id fits a signed BIGINT."""
+    hashes = pd.util.hash_pandas_object(keys, index=False).to_numpy()
+    return pd.Series((hashes & np.uint64(0x7FFFFFFFFFFFFFFF)).astype('int64'), index=keys.index)
+
+def birth_years(values):
+    """Birth years as nullable ints, so 1991 and 1991.0 key alike."""
+    return pd.to_numeric(values, errors='coerce').astype('Int64')
+
+def player_keys(names, born=None):
+    """Player name and birth year as one key ("Danilo|1991"), which tells namesakes apart; None without a name."""
+    years = birth_years(born) if born is not None else pd.Series(pd.NA, index=names.index, dtype='Int64')
+    keys = names.astype('string').str.cat(years.astype('string').fillna(''), sep='|')
+    return keys.astype(object).where(names.notna(), None)
+
+def player_ids(names, born=None):
+    """Stable player_ids hashed from name and birth year, unchanged when other players join or leave a roster."""
+    return hash_ids(player_keys(names, born))
+
+def stat_ids(df, league, season, source, natural_keys=None):
+    """Deterministic 63-bit stat_ids hashed from (league, season, source table, entity) for every row.
+
+    The same row of the same table gets the same id on every run, so re-loads upsert in place.
+    Rows without a player_id or team_id are keyed on natural_keys (e.g. from IdResolver.natural_keys)
+    when given, so adding or removing another row does not move their ids.
+    """
+    entity_kind = np.full(len(df), len(STAT_ENTITY_COLUMNS) + 1, dtype='int64')
+    entity = np.arange(len(df), dtype='int64')
+    if natural_keys is not None:
+        present = natural_keys.notna().to_numpy()
+        entity_kind[present] = len(STAT_ENTITY_COLUMNS)
+        entity[present] = hash_ids(natural_keys[present]).to_numpy()
+    for kind, column in reversed(list(enumerate(STAT_ENTITY_COLUMNS))):
+        if column in df.columns:
+            values = pd.to_numeric(df[column], errors='coerce')
+            present = values.notna().to_numpy()
+            entity_kind[present] = kind
+            entity[present] = values[present].astype('int64')
+
+    keys = pd.DataFrame({
+        'league': league or '',
+        'season': season or '',
+        'source': source,
+        'entity_kind': entity_kind,
+        'entity': entity
+    })
+    # A player listed once per club in the same season keeps one id per row
+    keys['occurrence'] = keys.groupby(['entity_kind', 'entity']).cumcount()
+    return hash_ids(keys).set_axis(df.index)
+
+class IdResolver:
+    """Resolves league, team and player names to their ids one whole column at a time."""
+
+    # Source column -> (id column it fills, index it is resolved through)
+    ENTITY_COLUMNS = {
+        'Player': ('player_id', 'players'),
+        'Squad': ('team_id', 'teams')
+    }
+
+    # Index -> (name column, id column) of its table
+    INDEX_COLUMNS = {
+        'leagues': ('league_name', 'league_id'),
+        'teams': ('team_name', 'team_id'),
+        'players': ('player_name', 'player_id')
+    }
+
+    def __init__(self, leagues_df=None, teams_df=None, players_df=None):
+        self.indexes = {}
+        for index, df in (('leagues', leagues_df), ('teams', teams_df), ('players', players_df)):
+            self.update(index, df)
+
+    @classmethod
+    def from_folder(cls, first_tables_dir, storage=None):
+        """Build the indexes from the leagues/teams/players tables that exist in a final First_Tables folder."""
+        storage = storage or TableStorage()
+        frames = {}
+        for table in ('leagues', 'teams', 'players'):
+            path = os.path.join(first_tables_dir, f"{table}.csv")
+            frames[table] = storage.read(path) if storage.exists(path) else None
+        return cls(frames['leagues'], frames['teams'], frames['players'])
+
+    def update(self, index, df):
+        """Rebuild one index from a freshly transformed leagues / teams / players frame.
+
+        Players are indexed by player_keys (name and birth year), so namesakes resolve to their own ids.
+        """
+        if index == 'players' and df is not None and 'date_of_birth' in df.columns:
+            df = df.assign(player_name=player_keys(df['player_name'], df['date_of_birth']))
+        self.indexes[index] = build_index(df, *self.INDEX_COLUMNS[index])
+
+    def resolve(self, index, names):
+        """Map a column of names to nullable int ids through one of the indexes.
+
+        Ids are taken by position from the Int64 index, never through float64, which cannot hold 63-bit hashes.
+        """
+        ids = self.indexes[index]
+        positions = ids.index.get_indexer(names.astype(str))
+        positions[names.isna().to_numpy()] = -1
+        return pd.Series(ids.array.take(positions, allow_fill=True), index=names.index)
+
+    def league_ids(self, names):
+        return self.resolve('leagues', names)
+
+    def team_ids(self, names):
+        return self.resolve('teams', names)
+
+    def player_ids(self, names, born=None):
+        return self.resolve('players', player_keys(names, born))
+
+    def entity_names(self, df):
+        """Keep the Player / Born / Squad columns of a source frame before its transform drops them."""
+        return {col: df[col] for col in (*self.ENTITY_COLUMNS, 'Born') if col in df.columns}
+
+    def natural_keys(self, names):
+        """Player / Born / Squad of every row as one string ("Danilo|1991|Juventus"), None without a name."""
+        if not any(col in names for col in self.ENTITY_COLUMNS):
+            return None
+        parts = []
+        for col in ('Player', 'Born', 'Squad'):
+            if col in names:
+                values = names[col]
+                if col == 'Born':
+                    values = birth_years(values)
+                parts.append(values.astype('string').fillna(''))
+        named = pd.concat([names[col].notna() for col in self.ENTITY_COLUMNS if col in names], axis=1).any(axis=1)
+        return parts[0].str.cat(parts[1:], sep='|').astype(object).where(named, None)
+
+    def fill_ids(self, df, names):
+        """Fill the player_id / team_id columns of a transformed frame from the source names (and Born)."""
+        for col, (id_column, index) in self.ENTITY_COLUMNS.items():
+            if id_column in df.columns and col in names:
+                keys = player_keys(names[col], names.get('Born')) if index == 'players' else names[col]
+                df[id_column] = self.resolve(index, keys).reindex(df.index)
+        return df
+
+    def check_ids(self, df, table):
+        """Raise ValueError when a player_id / team_id of a transformed frame is not in the players / teams table."""
+        for id_column, index in self.ENTITY_COLUMNS.values():
+            if id_column in df.columns:
+                ids = df[id_column].dropna()
+                unknown = ids[~ids.isin(self.indexes[index].array)]
+                if len(unknown):
+                    raise ValueError(f"{len(unknown)} {id_column}s of {table} are not in the {index} table, "
+                                     f"e.g. {unknown.iloc[0]}")
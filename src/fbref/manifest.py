@@ -0,0 +1,89 @@
+import os
+import json
+import time
+import hashlib
+import threading
+from config.fbref_config import MANIFEST_PATH
+from fbref.atomic_files import atomic_output
+
+def code_hash(func):
+    """Hash of a function's bytecode, names and plain constants, so editing a transform re-runs it."""
+    code = func.__code__
+    constants = [const for const in code.co_consts if not hasattr(const, 'co_code')]
+    return hashlib.sha256(code.co_code + repr((code.co_names, constants)).encode('utf-8')).hexdigest()
+
+class StageManifest:
+    """Input hashes, outputs and row counts of every (stage, league, table) a run has produced.
+
+    A job is fresh when its inputs hash to what the manifest recorded and its outputs still exist,
+    so an incremental run can skip it. force ignores the recorded entries but still records new ones.
+    """
+
+    def __init__(self, path=MANIFEST_PATH, force=False):
+        self.path = path
+        self.force = force
+        self.lock = threading.Lock()  # The load stage records from several threads
+        self.entries = {}
+        self.partitions = {}  # Season -> StageManifest of that season's tables
+        if os.path.exists(path):
+            with open(path, 'r', encoding='utf-8') as f:
+                self.entries = json.load(f)
+
+    def partition(self, season=None):
+        """The manifest of one season's tables, kept next to this one as <name>-<season>.json.
+
+        Seasons repeat the same (stage, league, table) keys, so each gets its own file; None is this manifest.
+        """
+        if season is None:
+            return self
+        with self.lock:
+            if season not in self.partitions:
+                base, ext = os.path.splitext(self.path)
+                self.partitions[season] = StageManifest(f"{base}-{season}{ext}", force=self.force)
+            return self.partitions[season]
+
+    def key(self, stage, league, table):
+        return f"{stage}/{league or ''}/{table}"
+
+    def fingerprint(self, storage, paths, salt=''):
+        """One hash over the contents of the input tables plus a salt (spec, transform code, season...).
+
+        Returns None when an input is missing, which never matches a recorded entry.
+        """
+        digest = hashlib.sha256(salt.encode('utf-8'))
+        for path in paths:
+            table_hash = storage.fingerprint(path)
+            if table_hash is None:
+                return None
+            digest.update(f"{os.path.basename(path)}:{table_hash}".encode('utf-8'))
+        return digest.hexdigest()
+
+    def fresh(self, stage, league, table, fingerprint, storage=None):
+        """The recorded entry of a job whose inputs are unchanged and outputs exist, else None."""
+        entry = self.entries.get(self.key(stage, league, table))
+        if self.force or fingerprint is None or entry is None or entry['fingerprint'] != fingerprint:
+            return None
+        if storage is not None and not all(storage.exists(path) for path in entry['outputs']):
+            return None
+        return entry
+
+    def record(self, stage, league, table, fingerprint, outputs, rows):
+        if fingerprint is None:
+            return
+        with self.lock:
+            self.entries[self.key(stage, league, table)] = {
+                'fingerprint': fingerprint,
+                'outputs': list(outputs),
+                'rows': rows,
+                'updated_at': time.time()
+            }
+
+    def forget(self, stage, league, table):
+        """Drop a job's entry, e.g. after it failed, so the next run retries it."""
+        with self.lock:
+            self.entries.pop(self.key(stage, league, table), None)
+
+    def save(self):
+        with self.lock:
+            with atomic_output(self.path, 'w', encoding='utf-8') as f:
+                json.dump(self.entries, f, indent=2, sort_keys=True)
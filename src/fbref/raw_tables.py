@@ -0,0 +1,62 @@
+import pandas as pd
+from fbref import tracing
+from fbref.storage import TableStorage
+
+def write_raw_table(df, csv_path, storage=None):
+    """Save a data-stat keyed table plus its display headers.
+
+    The table has a single header row of FBref data-stat keys, so its schema does not move when
+    FBref relabels a column; the sidecar keeps the (group, label) display header of every key.
+    Tables with read_html's two-level headers are keyed by position (col_0, col_1, ...).
+    """
+    storage = storage or TableStorage()
+    if isinstance(df.columns, pd.MultiIndex):
+        groups = ['' if str(group).startswith('Unnamed:') else group for group in df.columns.get_level_values(0)]
+        labels = df.columns.get_level_values(1).tolist()
+        df = df.copy()
+        df.columns = [f"col_{i}" for i in range(len(labels))]
+        df.attrs['headers'] = dict(zip(df.columns, zip(groups, labels)))
+    storage.write(df, csv_path)
+    headers = df.attrs.get('headers', {})
+    columns = [
+        {'data_stat': key, 'group': headers.get(key, ('', key))[0], 'label': headers.get(key, ('', key))[1]}
+        for key in df.columns
+    ]
+    storage.write_headers(csv_path, columns)
+
+def _read_legacy_table(csv_path):
+    """Read a raw table saved with read_html's two-level header and repeated header rows."""
+    df = pd.read_csv(csv_path, header=[0, 1])
+    groups = ['' if group.startswith('Unnamed:') else group for group in df.columns.get_level_values(0)]
+    labels = df.columns.get_level_values(1).tolist()
+
+    # Drop the header rows FBref repeats inside long tables in one vectorized comparison
+    df = df[~(df.astype(str) == labels).all(axis=1)]
+    df.columns = [f"col_{i}" for i in range(len(labels))]
+    tracing.count(rows_in=len(df))
+    return df, list(zip(groups, labels))
+
+def load_raw_table(csv_path, storage=None):
+    """Read a raw table as (df, display_headers) with one (group, label) pair per column."""
+    storage = storage or TableStorage()
+    columns = storage.read_headers(csv_path)
+    if columns is not None:
+        df = storage.read(csv_path)
+        headers = {column['data_stat']: (column['group'], column['label']) for column in columns}
+        return df, [headers.get(key, ('', key)) for key in df.columns]
+    return _read_legacy_table(csv_path)
+
+def display_columns(display_headers, group_suffixes=None):
+    """Flat column names: each label plus group_suffixes[group] when its group is listed."""
+    group_suffixes = group_suffixes or {}
+    return [label + group_suffixes.get(group, '') for group, label in display_headers]
+
+def read_raw_table(csv_path, group_suffixes=None, storage=None):
+    """Read a raw player table with flat display column names.
+
+    Each column is named after its display label, plus group_suffixes[group] when its
+    over-header group is listed there (e.g. {'Total': '_total'}).
+    """
+    df, display_headers = load_raw_table(csv_path, storage)
+    df.columns = display_columns(display_headers, group_suffixes)
+    return df
@@ -1,9 +1,15 @@
 import pandas as pd
 import os
+from fbref.storage import TableStorage
+
+def table_paths(paths):
+    """(league, path) pairs of a {league: path} dict or of an iterable of pairs; earlier pairs win duplicates."""
+    return paths.items() if isinstance(paths, dict) else paths
 
 class RegroupData:
-    def __init__(self, save_folder):
+    def __init__(self, save_folder, storage=None):
         self.save_folder = save_folder
+        self.storage = storage or TableStorage()  # Format cleaned tables are read and first tables written in
         os.makedirs(save_folder, exist_ok=True)
 
     def create_league_table(self):
@@ -15,8 +21,7 @@ class RegroupData:
         df_leagues = pd.DataFrame(league_data)
 
         # Save the DataFrame to a CSV
-        league_file_path = os.path.join(self.save_folder, 'leagues.csv')
-        df_leagues.to_csv(league_file_path, index=False)
+        league_file_path = self.storage.write(df_leagues, os.path.join(self.save_folder, 'leagues.csv'))
         print(f"Leagues table saved to {league_file_path}")
 
     def create_team_table(self, league_paths):
@@ -24,12 +29,13 @@ class RegroupData:
         teams_df = pd.DataFrame()
 
         # Loop through each league CSV
-        for league, path in league_paths.items():
-            df = pd.read_csv(path)
+        for league, path in table_paths(league_paths):
+            df = self.storage.read(path, columns=['Squad'])
 
-            # Extract the 'Squad' column, rename it to 'team_name'
+            # Extract the 'Squad' column, rename it to 'team_name', and keep the league it plays in
             df_teams = df[['Squad']].copy()
             df_teams.columns = ['team_name']
+            df_teams['league_name'] = league
 
             # Append teams to the main DataFrame
             teams_df = pd.concat([teams_df, df_teams], ignore_index=True)
@@ -38,8 +44,7 @@ class RegroupData:
         teams_df.drop_duplicates(subset='team_name', inplace=True)
 
         # Save the result as CSV
-        team_file_path = os.path.join(self.save_folder, 'teams.csv')
-        teams_df.to_csv(team_file_path, index=False)
+        team_file_path = self.storage.write(teams_df, os.path.join(self.save_folder, 'teams.csv'))
         print(f"Teams table saved to {team_file_path}")
 
     def create_player_table(self, player_paths):
@@ -47,8 +52,8 @@ class RegroupData:
         players_df = pd.DataFrame()
 
         # Loop through each league's player CSV
-        for league, path in player_paths.items():
-            df = pd.read_csv(path)
+        for league, path in table_paths(player_paths):
+            df = self.storage.read(path, columns=['Player', 'Nation', 'Pos', 'Age', 'Born'])
 
             # Extract relevant columns and rename them
             df_players = df[['Player', 'Nation', 'Pos', 'Age', 'Born']].copy()
@@ -57,10 +62,9 @@ class RegroupData:
             # Append players to the main DataFrame
             players_df = pd.concat([players_df, df_players], ignore_index=True)
 
-        # Remove duplicate players
-        players_df.drop_duplicates(subset='player_name', inplace=True)
+        # Remove duplicate players; namesakes with different birth years are different players
+        players_df.drop_duplicates(subset=['player_name', 'date_of_birth'], inplace=True)
 
         # Save the result as CSV
-        player_file_path = os.path.join(self.save_folder, 'players.csv')
-        players_df.to_csv(player_file_path, index=False)
+        player_file_path = self.storage.write(players_df, os.path.join(self.save_folder, 'players.csv'))
         print(f"Players table saved to {player_file_path}")
@@ -1,35 +1,42 @@
-import time
-import requests
 import pandas as pd
-from bs4 import BeautifulSoup
-from io import StringIO
 from config.fbref_config import FBREF_URLS
+from fbref.fetch_engine import FetchEngine
+from fbref.table_extractor import extract_table
 import logging
 
 # Set up logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
 class FBRefScraper:
-    def __init__(self, delay=4):
+    # Squad table name (raw file suffix) -> table ID on the league page
+    SQUAD_TABLE_ID_MAP = {
+        "Squad_Standard_Stats": "stats_squads_standard_for",
+        "Squad_Goalkeeping": "stats_squads_keeper_for",
+        "Squad_Advanced_Goalkeeping": "stats_squads_keeper_adv_for",
+        "Squad_Shooting": "stats_squads_shooting_for",
+        "Squad_Passing": "stats_squads_passing_for",
+        "Squad_Pass_Types": "stats_squads_passing_types_for",
+        "Squad_Goal_and_Shot_Creation": "stats_squads_gca_for",
+        "Squad_Defensive_Actions": "stats_squads_defense_for",
+        "Squad_Possession": "stats_squads_possession_for",
+        "Squad_Playing_Time": "stats_squads_playing_time_for",
+        "Squad_Miscellaneous_Stats": "stats_squads_misc_for"
+    }
+
+    def __init__(self, delay=4, engine=None):
         self.delay = delay
+        self.engine = engine or FetchEngine(delay=delay)  # Shared, rate-limited fetcher
         self.dataframes = {}  # Dictionary to store DataFrames
 
     def fetch_page(self, url):
         """Fetch HTML content from a URL."""
-        try:
-            response = requests.get(url)
-            response.raise_for_status()  # Check if the request was successful
-            return response.text
-        except requests.RequestException as e:
-            logging.error(f"Error fetching page {url}: {e}")
-            return ""
+        return self.engine.fetch_page(url)
 
-    def parse_table(self, soup, table_id):
-        """Parse a table from the BeautifulSoup object."""
-        table = soup.find('table', {'id': table_id})
-        if table:
-            table_html = str(table)
-            return pd.read_html(StringIO(table_html))[0]  # Use StringIO
+    def parse_table(self, html, table_id):
+        """Parse a table from the page HTML."""
+        df = extract_table(html, table_id)  # Parses only the table fragment, not the whole page
+        if df is not None:
+            return df
         else:
             logging.warning(f"Table with ID {table_id} not found.")
             return pd.DataFrame()  # Return an empty DataFrame if the table is not found
@@ -41,40 +48,33 @@ class FBRefScraper:
         if not html:
             return {}  # Return empty if the page couldn't be fetched
 
-        soup = BeautifulSoup(html, 'html.parser')
+        return self.parse_league(league_name, html)
 
-        tables = {
-            "Squad_Standard_Stats": "stats_squads_standard_for",
-            "Squad_Goalkeeping": "stats_squads_keeper_for",
-            "Squad_Advanced_Goalkeeping": "stats_squads_keeper_adv_for",
-            "Squad_Shooting": "stats_squads_shooting_for",
-            "Squad_Passing": "stats_squads_passing_for",
-            "Squad_Pass_Types": "stats_squads_passing_types_for",
-            "Squad_Goal_and_Shot_Creation": "stats_squads_gca_for",
-            "Squad_Defensive_Actions": "stats_squads_defense_for",
-            "Squad_Possession": "stats_squads_possession_for",
-            "Squad_Playing_Time": "stats_squads_playing_time_for",
-            "Squad_Miscellaneous_Stats": "stats_squads_misc_for"
-        }
+    def parse_league(self, league_name, html):
+        """Parse the squad tables of a fetched league page into DataFrames."""
+        tables = self.SQUAD_TABLE_ID_MAP
 
         # Store DataFrames in class attribute
         league_dataframes = {}
         for name, table_id in tables.items():
-            df = self.parse_table(soup, table_id)
+            df = self.parse_table(html, table_id)
             if not df.empty:
                 league_dataframes[f"{league_name}_{name}"] = df
 
         self.dataframes[league_name] = league_dataframes
         return league_dataframes
 
-    def scrape_all(self):
-        """Scrape data from all leagues."""
-        all_data = {}
-        for league_name, url in FBREF_URLS.items():
-            league_dataframes = self.scrape_league(league_name, url)
-            all_data[league_name] = league_dataframes
-            time.sleep(self.delay)  # Delay between requests
-        return all_data
+    def scrape_all(self, league_urls=None):
+        """Scrape data from all leagues, or from the given {league: url} pages (e.g. a past season's)."""
+        league_urls = league_urls or FBREF_URLS
+        jobs = []
+        for league_name, url in league_urls.items():
+            logging.info(f"Scraping {league_name} from {url}...")
+            jobs.append((league_name, url, lambda html, league_name=league_name: self.parse_league(league_name, html)))
+
+        # The engine overlaps downloads and parsing while keeping the per-host delay
+        results = self.engine.run(jobs)
+        return {league_name: results[league_name] or {} for league_name in league_urls}
 
 # Example usage
 if __name__ == "__main__":
@@ -0,0 +1,59 @@
+import os
+import re
+from config.db_config import SEASON
+from config.fbref_config import FBREF_URLS, FBREF_PLAYERS_STATS_URLS
+
+# Seasons are named like FBref names them: "2023-2024"
+SEASON_PATTERN = re.compile(r'^(\d{4})-(\d{4})$')
+
+def validate_season(season):
+    """Return the season, or raise ValueError unless it reads "YYYY-YYYY" with consecutive years."""
+    match = SEASON_PATTERN.match(season or '')
+    if not match or int(match.group(2)) != int(match.group(1)) + 1:
+        raise ValueError(f"Invalid season {season!r}, expected e.g. {SEASON!r}")
+    return season
+
+def season_range(first, last):
+    """Every season from first to last, inclusive: season_range('2021-2022', '2023-2024')."""
+    start = int(validate_season(first)[:4])
+    end = int(validate_season(last)[:4])
+    if end < start:
+        raise ValueError(f"Season range {first}:{last} runs backwards")
+    return [f"{year}-{year + 1}" for year in range(start, end + 1)]
+
+def parse_seasons(values):
+    """Seasons from command-line values, each a season or a FIRST:LAST range; oldest first, no repeats."""
+    seasons = set()
+    for value in values:
+        if ':' in value:
+            seasons.update(season_range(*value.split(':', 1)))
+        else:
+            seasons.add(validate_season(value))
+    return sorted(seasons)
+
+def season_url(url, season=None):
+    """URL of a past season's page; the current season (or None) keeps the configured URL.
+
+    .../comps/9/Premier-League-Stats       -> .../comps/9/2023-2024/2023-2024-Premier-League-Stats
+    .../comps/9/stats/Premier-League-Stats -> .../comps/9/2023-2024/stats/2023-2024-Premier-League-Stats
+    """
+    if season is None or season == SEASON:
+        return url
+    validate_season(season)
+    prefix, path = url.split('/comps/', 1)
+    comp_id, *sections, page = path.split('/')
+    return '/'.join([f"{prefix}/comps", comp_id, season, *sections, f"{season}-{page}"])
+
+def league_urls(season=None, leagues=None):
+    """{league: league page URL} of a season, like FBREF_URLS."""
+    return {league: season_url(url, season) for league, url in FBREF_URLS.items()
+            if leagues is None or league in leagues}
+
+def player_stats_urls(season=None, leagues=None):
+    """{league: [player stats page URLs]} of a season, like FBREF_PLAYERS_STATS_URLS."""
+    return {league: [season_url(url, season) for url in urls] for league, urls in FBREF_PLAYERS_STATS_URLS.items()
+            if leagues is None or league in leagues}
+
+def partition_dir(folder, league, season=None):
+    """Folder of one league's tables: <folder>/<league>, or <folder>/<league>/<season> for a season partition."""
+    return os.path.join(folder, league, season) if season else os.path.join(folder, league)
@@ -0,0 +1,290 @@
+import os
+import json
+import hashlib
+import pandas as pd
+from contextlib import ExitStack
+from config.fbref_config import STORAGE_FORMAT, STORAGE_EXPORT_CSV
+from fbref import tracing
+from fbref.atomic_files import atomic_output
+
+# Storage format -> file extension
+FORMATS = {
+    'csv': '.csv',
+    'parquet': '.parquet',
+    'feather': '.feather'  # Arrow IPC file
+}
+
+# Id columns hold 63-bit hashes: CSV reads them as nullable ints, as a blank cell would make them (rounded) floats
+ID_DTYPES = {col: 'Int64' for col in ('stat_id', 'player_id', 'team_id', 'league_id')}
+
+def _pyarrow():
+    try:
+        import pyarrow
+        import pyarrow.parquet
+        import pyarrow.ipc
+    except ImportError as e:
+        raise ImportError("Parquet / Feather storage needs pyarrow (pip install pyarrow)") from e
+    return pyarrow
+
+def mangle_duplicates(columns):
+    """Rename repeated column names the way pd.read_csv does on read (Save%, Save%.1, ...).
+
+    Columnar formats reject duplicate names, and this keeps them readable exactly like the CSV.
+    """
+    seen = {}
+    names = []
+    for name in columns:
+        count = seen.get(name, 0)
+        names.append(name if count == 0 else f"{name}.{count}")
+        seen[name] = count + 1
+    return names
+
+def arrow_table(pa, df):
+    """Convert a frame to Arrow, storing object columns that mix numbers and text as text."""
+    try:
+        return pa.Table.from_pandas(df, preserve_index=False)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        df = df.copy()
+        for col in df.columns[df.dtypes == object]:
+            df[col] = df[col].map(lambda value: value if pd.isna(value) else str(value))
+        return pa.Table.from_pandas(df, preserve_index=False)
+
+def cast_schema(df, schema):
+    """Apply an explicit {column: dtype} schema before writing."""
+    return df.astype({col: dtype for col, dtype in schema.items() if col in df.columns}) if schema else df
+
+def columns_path(csv_path):
+    """Path of the header sidecar that sits next to a raw table."""
+    return os.path.splitext(csv_path)[0] + '.columns.json'
+
+class TableStorage:
+    """Reads and writes the tables of every stage in one format.
+
+    Callers keep passing the .csv paths they always used; the storage swaps the extension for
+    its format. Reads fall back to an existing CSV so folders written before a format switch
+    stay readable, and export_csv writes a CSV copy next to every columnar file.
+    """
+
+    def __init__(self, fmt=STORAGE_FORMAT, export_csv=STORAGE_EXPORT_CSV):
+        if fmt not in FORMATS:
+            raise ValueError(f"Unknown storage format {fmt!r}, expected one of {', '.join(FORMATS)}")
+        self.format = fmt
+        self.export_csv = export_csv and fmt != 'csv'
+
+    def path(self, csv_path):
+        """Physical path of a table stored under a .csv path."""
+        return os.path.splitext(csv_path)[0] + FORMATS[self.format]
+
+    def source(self, csv_path):
+        """(path, format) a table is read from: this storage's file, else the CSV."""
+        path = self.path(csv_path)
+        if os.path.exists(path):
+            return path, self.format
+        return csv_path, 'csv'
+
+    def exists(self, csv_path):
+        return os.path.exists(self.source(csv_path)[0])
+
+    def csv_name(self, file_name):
+        """Map a file name in a storage folder back to its .csv name, or None for other files."""
+        base, ext = os.path.splitext(file_name)
+        if ext in (FORMATS[self.format], '.csv'):
+            return base + '.csv'
+        return None
+
+    def list_tables(self, folder):
+        """The .csv names of every table stored in a folder, whichever format it was written in."""
+        return sorted({name for name in map(self.csv_name, os.listdir(folder)) if name})
+
+    def write(self, df, csv_path, schema=None):
+        """Write a table atomically and return the path written."""
+        return self.write_chunks([df], csv_path, schema)[0]
+
+    def write_chunks(self, chunks, csv_path, schema=None):
+        """Stream frames into one table atomically; returns (path written, rows)."""
+        path = self.path(csv_path)
+        rows = 0
+        first = True
+        with ExitStack() as stack:
+            if self.format == 'csv':
+                csv_file = stack.enter_context(atomic_output(path, 'w', newline='', encoding='utf-8'))
+            else:
+                pa = _pyarrow()
+                f = stack.enter_context(atomic_output(path, 'wb'))
+                csv_file = (stack.enter_context(atomic_output(csv_path, 'w', newline='', encoding='utf-8'))
+                            if self.export_csv else None)
+                writer = None
+
+            for df in chunks:
+                df = cast_schema(df, schema)
+                if self.format != 'csv':
+                    columnar = df
+                    if df.columns.has_duplicates:
+                        columnar = df.copy()
+                        columnar.columns = mangle_duplicates(df.columns)
+                    table = arrow_table(pa, columnar)
+                    if writer is None:
+                        arrow_schema = table.schema
+                        writer = (pa.parquet.ParquetWriter(f, arrow_schema) if self.format == 'parquet'
+                                  else pa.ipc.new_file(f, arrow_schema))
+                    # Later chunks are cast to the first chunk's schema (e.g. an all-null column)
+                    writer.write_table(table.cast(arrow_schema))
+                if csv_file:
+                    df.to_csv(csv_file, index=False, header=first)
+                first = False
+                rows += len(df)
+
+            if self.format != 'csv' and writer is not None:
+                writer.close()
+        written = os.path.getsize(path) + (os.path.getsize(csv_path) if self.export_csv else 0)
+        tracing.count(rows_out=rows, bytes_written=written)
+        return path, rows
+
+    def read(self, csv_path, columns=None):
+        """Read a table, optionally only the given columns."""
+        path, fmt = self.source(csv_path)
+        if fmt == 'csv':
+            df = pd.read_csv(path, usecols=columns, dtype=ID_DTYPES)
+        elif fmt == 'parquet':
+            _pyarrow()
+            df = pd.read_parquet(path, columns=columns)
+        else:
+            _pyarrow()
+            df = pd.read_feather(path, columns=columns)
+        tracing.count(rows_in=len(df))
+        return df
+
+    def read_chunks(self, csv_path, chunk_rows, columns=None):
+        """Yield a table chunk_rows rows at a time."""
+        path, fmt = self.source(csv_path)
+        if fmt == 'csv':
+            for chunk in pd.read_csv(path, usecols=columns, chunksize=chunk_rows, dtype=ID_DTYPES):
+                tracing.count(rows_in=len(chunk))
+                yield chunk
+        elif fmt == 'parquet':
+            pa = _pyarrow()
+            for batch in pa.parquet.ParquetFile(path).iter_batches(batch_size=chunk_rows, columns=columns):
+                tracing.count(rows_in=batch.num_rows)
+                yield batch.to_pandas()
+        else:
+            # Arrow IPC files are memory-mapped, so reading the whole table is cheap
+            df = self.read(csv_path, columns)
+            for start in range(0, len(df), chunk_rows):
+                yield df.iloc[start:start + chunk_rows]
+
+    def fingerprint(self, csv_path):
+        """sha256 of the stored table and its header sidecar, or None when the table does not exist."""
+        path = self.source(csv_path)[0]
+        if not os.path.exists(path):
+            return None
+        digest = hashlib.sha256()
+        for part in (path, columns_path(csv_path)):
+            if not os.path.exists(part):
+                continue
+            with open(part, 'rb') as f:
+                for block in iter(lambda: f.read(1 << 20), b''):
+                    digest.update(block)
+        return digest.hexdigest()
+
+    def write_headers(self, csv_path, columns):
+        """Save the display headers of a raw table as its JSON sidecar."""
+        with atomic_output(columns_path(csv_path), 'w', encoding='utf-8') as f:
+            json.dump(columns, f, indent=2)
+
+    def read_headers(self, csv_path):
+        """The display headers saved by write_headers, or None for a table without a sidecar."""
+        sidecar = columns_path(csv_path)
+        if not os.path.exists(sidecar):
+            return None
+        with open(sidecar, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+class MemoryStorage:
+    """Keeps tables in memory under their .csv paths so pipeline stages hand frames to each other.
+
+    checkpoint, an optional TableStorage, also persists every write and serves the tables this run
+    has not produced itself, e.g. cleaned files on disk when a run starts at the transform stage.
+    Memory tables live in one process, so stages using it run their jobs serially.
+    """
+
+    def __init__(self, checkpoint=None):
+        self.checkpoint = checkpoint
+        self.tables = {}
+        self.headers = {}
+
+    def _key(self, csv_path):
+        return os.path.normpath(os.path.abspath(csv_path))
+
+    def path(self, csv_path):
+        return self.checkpoint.path(csv_path) if self.checkpoint else csv_path
+
+    def exists(self, csv_path):
+        return self._key(csv_path) in self.tables or bool(self.checkpoint and self.checkpoint.exists(csv_path))
+
+    def list_tables(self, folder):
+        folder = self._key(folder)
+        names = {os.path.basename(key) for key in self.tables if os.path.dirname(key) == folder}
+        if self.checkpoint and os.path.isdir(folder):
+            names.update(self.checkpoint.list_tables(folder))
+        return sorted(names)
+
+    def write(self, df, csv_path, schema=None):
+        """Keep a table (and checkpoint it) and return its path."""
+        df = cast_schema(df, schema).copy(deep=False)
+        # Raw headers are kept by write_headers; attrs would be deep-copied by every later pandas call
+        df.attrs = {}
+        if df.columns.has_duplicates:
+            # Same names a CSV round trip would give the next stage
+            df.columns = mangle_duplicates(df.columns)
+        self.tables[self._key(csv_path)] = df
+        if self.checkpoint:
+            return self.checkpoint.write(df, csv_path)
+        tracing.count(rows_out=len(df))
+        return csv_path
+
+    def write_chunks(self, chunks, csv_path, schema=None):
+        frames = [cast_schema(df, schema) for df in chunks]
+        df = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame(columns=list(schema or []))
+        return self.write(df, csv_path), len(df)
+
+    def read(self, csv_path, columns=None):
+        """A table from memory, else from the checkpoint.
+
+        Memory reads return a shallow copy (lazy under pandas copy-on-write), so a stage changing
+        its frame does not change the table the next stage reads.
+        """
+        df = self.tables.get(self._key(csv_path))
+        if df is None:
+            if self.checkpoint is None:
+                raise FileNotFoundError(csv_path)
+            return self.checkpoint.read(csv_path, columns)
+        tracing.count(rows_in=len(df))
+        return df[columns].copy(deep=False) if columns is not None else df.copy(deep=False)
+
+    def read_chunks(self, csv_path, chunk_rows, columns=None):
+        df = self.read(csv_path, columns)
+        for start in range(0, len(df), chunk_rows):
+            yield df.iloc[start:start + chunk_rows]
+
+    def fingerprint(self, csv_path):
+        """Hash of a table; checkpointed tables use the file hash so disk and memory runs agree."""
+        if self.checkpoint:
+            return self.checkpoint.fingerprint(csv_path)
+        key = self._key(csv_path)
+        df = self.tables.get(key)
+        if df is None:
+            return None
+        digest = hashlib.sha256(repr((list(df.columns), self.headers.get(key))).encode('utf-8'))
+        digest.update(pd.util.hash_pandas_object(df, index=False).to_numpy().tobytes())
+        return digest.hexdigest()
+
+    def write_headers(self, csv_path, columns):
+        self.headers[self._key(csv_path)] = columns
+        if self.checkpoint:
+            self.checkpoint.write_headers(csv_path, columns)
+
+    def read_headers(self, csv_path):
+        columns = self.headers.get(self._key(csv_path))
+        if columns is None and self.checkpoint:
+            return self.checkpoint.read_headers(csv_path)
+        return columns
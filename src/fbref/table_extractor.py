@@ -0,0 +1,137 @@
+import re
+import pandas as pd
+from lxml import html as lxml_html
+
+_WHITESPACE = re.compile(r"\s+")
+
+def parse_page(page):
+    """Parse raw HTML into an lxml tree (already-parsed trees are returned as-is)."""
+    if isinstance(page, (str, bytes)):
+        return lxml_html.fromstring(page)
+    return page
+
+def find_table(root, table_id):
+    """Find table#table_id under an element, including tables hidden inside HTML comments."""
+    tables = root.xpath('.//table[@id=$table_id]', table_id=table_id)
+    if tables:
+        return tables[0]
+
+    # FBref ships most secondary tables commented out; only parse comments that mention the ID
+    marker = f'id="{table_id}"'
+    for comment in root.xpath('.//comment()[contains(., $marker)]', marker=marker):
+        fragment = lxml_html.fragment_fromstring(comment.text, create_parent='div')
+        tables = fragment.xpath('.//table[@id=$table_id]', table_id=table_id)
+        if tables:
+            return tables[0]
+    return None
+
+def find_id(page, element_id, start=0):
+    """Return the offset of an id="element_id" attribute in the raw page text, or -1."""
+    return page.find(f'id="{element_id}"', start)
+
+def locate_table_html(page, table_id, start=0):
+    """Return the raw <table>...</table> markup of table#table_id by scanning the page text.
+
+    Works the same whether the table is live or commented out, and never builds a DOM for
+    the rest of the page.
+    """
+    marker = f'id="{table_id}"'
+    position = page.find(marker, start)
+    while position != -1:
+        table_start = page.rfind('<table', 0, position)
+        # The id must sit inside the opening <table ...> tag itself
+        if table_start != -1 and page.find('>', table_start) > position:
+            table_end = page.find('</table>', position)
+            if table_end != -1:
+                return page[table_start:table_end + len('</table>')]
+        position = page.find(marker, position + len(marker))
+    return None
+
+def _cell_text(cell):
+    return _WHITESPACE.sub(' ', cell.text_content().strip())
+
+def _expand_row(tr):
+    """Return the (text, data-stat) pairs of a row with colspans expanded."""
+    cells = []
+    for cell in tr.xpath('./th|./td'):
+        colspan = int(cell.get('colspan') or 1)
+        cells.extend([(_cell_text(cell), cell.get('data-stat'))] * colspan)
+    return cells
+
+def _dedupe(names):
+    """Mangle repeated column names the way pandas.read_html does (Gls, Gls.1, ...)."""
+    seen = {}
+    deduped = []
+    for name in names:
+        count = seen.get(name, 0)
+        deduped.append(name if count == 0 else f"{name}.{count}")
+        seen[name] = count + 1
+    return deduped
+
+def _to_numeric(column):
+    """Convert a column to numbers when every non-empty cell parses, otherwise keep it as text."""
+    try:
+        return pd.to_numeric(column.str.replace(',', '', regex=False))
+    except (ValueError, TypeError, AttributeError):
+        return column
+
+def table_to_dataframe(table, columns='display', numeric=True, skip_header_rows=False):
+    """Build a DataFrame straight from a table's thead/tbody cells.
+
+    columns='display' reproduces the pandas.read_html headers (a two-level MultiIndex when the
+    table has an over-header row); columns='data-stat' keys columns by FBref's data-stat
+    attribute and keeps the display headers in df.attrs['headers'].
+    """
+    header_rows = [_expand_row(tr) for tr in table.xpath('./thead/tr')]
+    labels = [[text for text, _ in row] for row in header_rows]
+    data_stats = [stat for _, stat in header_rows[-1]] if header_rows else []
+
+    body_rows = []
+    for tr in table.xpath('./tbody/tr'):
+        # FBref repeats the header inside long tables as tr.thead / tr.over_header rows
+        if skip_header_rows and {'thead', 'over_header', 'spacer'} & set((tr.get('class') or '').split()):
+            continue
+        body_rows.append([text for text, _ in _expand_row(tr)])
+
+    width = max([len(row) for row in labels + body_rows] or [0])
+    body_rows = [row + [''] * (width - len(row)) for row in body_rows]
+    # Columns only body rows reach get read_html's "Unnamed: i" placeholders (and a col_i key)
+    labels = [row + [f"Unnamed: {i}" if len(labels) == 1 else f"Unnamed: {i}_level_{level}"
+                     for i in range(len(row), width)] for level, row in enumerate(labels)]
+    data_stats += [None] * (width - len(data_stats))
+    df = pd.DataFrame(body_rows, columns=range(width), dtype=object)
+    df = df.replace('', None)
+
+    if numeric:
+        df = df.apply(_to_numeric)
+
+    if columns == 'data-stat':
+        keys = [stat or f"col_{i}" for i, stat in enumerate(data_stats)]
+        df.columns = _dedupe(keys)
+        df.attrs['headers'] = {
+            key: (labels[0][i] if len(labels) > 1 else '', labels[-1][i]) for i, key in enumerate(df.columns)
+        }
+    elif len(labels) > 1:
+        # Empty over-header cells get read_html's "Unnamed: i_level_0" placeholders
+        level_0 = [text or f"Unnamed: {i}_level_0" for i, text in enumerate(labels[0])]
+        df.columns = pd.MultiIndex.from_arrays([level_0, labels[-1]])
+    elif labels:
+        df.columns = _dedupe(labels[0])
+    return df
+
+def extract_table(page, table_id, columns='display', numeric=True, skip_header_rows=False, start=0):
+    """Extract table#table_id from a page (HTML or parsed tree) as a DataFrame, or None if absent.
+
+    Raw HTML goes through the text locator so only the table fragment is parsed; `start`
+    limits the scan to text after that offset (e.g. the table's wrapper div).
+    """
+    if isinstance(page, bytes):
+        page = page.decode('utf-8')
+    if isinstance(page, str):
+        table_html = locate_table_html(page, table_id, start)
+        table = lxml_html.fragment_fromstring(table_html) if table_html else None
+    else:
+        table = find_table(page, table_id)
+    if table is None:
+        return None
+    return table_to_dataframe(table, columns=columns, numeric=numeric, skip_header_rows=skip_header_rows)
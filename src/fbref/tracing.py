@@ -0,0 +1,227 @@
+import os
+import sys
+import json
+import time
+import logging
+import pstats
+import cProfile
+import threading
+import tracemalloc
+from contextlib import contextmanager
+from config.fbref_config import TRACE_DIR
+
+try:
+    import resource  # Peak RSS; Unix only
+except ImportError:
+    resource = None
+
+# Open spans of the current thread, innermost last
+_local = threading.local()
+
+PROFILERS = ('cprofile', 'pyinstrument')
+
+# Span counters that add up from jobs to their stage
+COUNTERS = ('rows_in', 'rows_out', 'bytes_written', 'bytes_downloaded')
+
+def max_rss_kb():
+    """Peak resident set size of this process so far, or None where the platform does not report it."""
+    if resource is None:
+        return None
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss // 1024 if sys.platform == 'darwin' else rss  # macOS reports bytes, Linux kilobytes
+
+def children_cpu_seconds():
+    """CPU time of the finished child processes (e.g. a process pool that was shut down)."""
+    if resource is None:
+        return 0.0
+    usage = resource.getrusage(resource.RUSAGE_CHILDREN)
+    return usage.ru_utime + usage.ru_stime
+
+def count(**counters):
+    """Add rows_in / rows_out / bytes_written / bytes_downloaded to the innermost span of this thread.
+
+    Outside a span this does nothing, so storage and fetch code can always call it.
+    """
+    stack = getattr(_local, 'stack', None)
+    if not stack:
+        return
+    span_counters = stack[-1].counters
+    for name, value in counters.items():
+        span_counters[name] = span_counters.get(name, 0) + value
+
+class Span:
+    """Wall time, CPU time, peak RSS and I/O counters of one stage or table job.
+
+    Job spans measure the CPU of their own thread; stage spans (process_cpu=True) measure this
+    process plus the child processes that finished during the stage.
+    """
+
+    def __init__(self, name, cat='job', process_cpu=False, **attrs):
+        self.name = name
+        self.cat = cat
+        self.process_cpu = process_cpu
+        self.attrs = attrs
+        self.counters = {}
+        self.event = None
+
+    def _cpu(self):
+        if self.process_cpu:
+            return time.process_time() + children_cpu_seconds()
+        return time.thread_time()
+
+    def __enter__(self):
+        _local.stack = getattr(_local, 'stack', [])
+        _local.stack.append(self)
+        self.started_at = time.time()
+        self.start = time.perf_counter()
+        self.cpu_start = self._cpu()
+        return self
+
+    def __exit__(self, *exc_info):
+        _local.stack.remove(self)
+        self.event = {
+            'name': self.name,
+            'cat': self.cat,
+            'ts': self.started_at,
+            'wall_seconds': time.perf_counter() - self.start,
+            'cpu_seconds': self._cpu() - self.cpu_start,
+            'max_rss_kb': max_rss_kb(),
+            'pid': os.getpid(),
+            'tid': threading.get_ident(),
+            **self.counters,
+            **self.attrs
+        }
+        return False
+
+def span(name, cat='job', **attrs):
+    """Context manager timing one table job; its finished event is in span.event."""
+    return Span(name, cat, **attrs)
+
+class RunTrace:
+    """Collects the stage and job spans of a run and writes them as JSON lines and a Chrome trace.
+
+    Jobs that run in worker processes or threads return their span event in result['trace'];
+    add_results files them under the running stage and adds their counters to it. memory tracks
+    the peak of Python allocations per stage with tracemalloc, and profile ('cprofile' or
+    'pyinstrument') saves a profile of every stage's main thread next to the trace.
+    """
+
+    def __init__(self, trace_dir=TRACE_DIR, memory=False, profile=None):
+        if profile not in (None,) + PROFILERS:
+            raise ValueError(f"Unknown profiler {profile!r}, expected one of {', '.join(PROFILERS)}")
+        self.trace_dir = trace_dir  # None keeps the events in memory only
+        self.memory = memory
+        self.profile = profile
+        self.run_id = time.strftime('%Y%m%d-%H%M%S')
+        self.events = []
+        self.profiles = []
+        self.lock = threading.Lock()
+        self._stage_jobs = None
+
+    def _profiler(self):
+        if self.profile == 'pyinstrument':
+            try:
+                from pyinstrument import Profiler
+            except ImportError as e:
+                raise ImportError("--profile pyinstrument needs pyinstrument (pip install pyinstrument)") from e
+            return Profiler()
+        return cProfile.Profile()
+
+    def _save_profile(self, profiler, stage):
+        os.makedirs(self.trace_dir, exist_ok=True)
+        base = os.path.join(self.trace_dir, f"run-{self.run_id}-{stage}")
+        if self.profile == 'pyinstrument':
+            path = base + '.html'
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(profiler.output_html())
+        else:
+            path = base + '.prof'
+            profiler.dump_stats(path)
+            with open(base + '.txt', 'w', encoding='utf-8') as f:
+                pstats.Stats(path, stream=f).sort_stats('cumulative').print_stats(40)
+        self.profiles.append(path)
+
+    @contextmanager
+    def stage(self, name, **attrs):
+        """Span of a whole stage; job events added while it runs count towards its totals."""
+        self._stage_jobs = []
+        if self.memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+        elif self.memory:
+            tracemalloc.reset_peak()
+        profiler = self._profiler() if self.profile and self.trace_dir else None
+        if profiler and self.profile == 'pyinstrument':
+            profiler.start()
+        elif profiler:
+            profiler.enable()
+
+        stage_span = Span(name, 'stage', process_cpu=True, **attrs)
+        try:
+            with stage_span:
+                yield stage_span
+        finally:
+            if profiler:
+                if self.profile == 'pyinstrument':
+                    profiler.stop()
+                else:
+                    profiler.disable()
+                self._save_profile(profiler, name)
+            event = stage_span.event
+            jobs = self._stage_jobs
+            self._stage_jobs = None
+            for job in jobs:
+                for counter in COUNTERS:
+                    if counter in job:
+                        event[counter] = event.get(counter, 0) + job[counter]
+            event['jobs'] = len(jobs)
+            if self.memory:
+                event['py_peak_kb'] = tracemalloc.get_traced_memory()[1] // 1024
+            with self.lock:
+                self.events.append(event)
+            totals = ''.join(f", {counter} {event[counter]}" for counter in COUNTERS if counter in event)
+            logging.info(f"Stage {name} finished in {event['wall_seconds']:.2f}s "
+                         f"({event['cpu_seconds']:.2f}s CPU, {len(jobs)} jobs{totals})")
+
+    def add_results(self, results):
+        """File the span events that job results carry in result['trace']."""
+        for result in results or []:
+            event = result.get('trace') if isinstance(result, dict) else None
+            if not event:
+                continue
+            with self.lock:
+                self.events.append(event)
+                if self._stage_jobs is not None:
+                    self._stage_jobs.append(event)
+
+    def chrome_events(self):
+        """The events as Chrome trace-event 'X' (complete) events, loadable in chrome://tracing or Perfetto."""
+        trace_events = []
+        for event in self.events:
+            args = {key: value for key, value in event.items() if key not in ('name', 'cat', 'ts', 'pid', 'tid')}
+            # Jobs are labelled by what they worked on, e.g. "clean Serie_A / Defense"
+            label = ' / '.join(str(event[key]) for key in ('league', 'table', 'file') if event.get(key))
+            trace_events.append({
+                'name': f"{event['name']} {label}" if label else event['name'],
+                'cat': event['cat'],
+                'ph': 'X',
+                'ts': event['ts'] * 1e6,
+                'dur': event['wall_seconds'] * 1e6,
+                'pid': event['pid'],
+                'tid': event['tid'],
+                'args': args
+            })
+        return trace_events
+
+    def write(self):
+        """Write run-<id>.jsonl and run-<id>.trace.json into the trace folder and return their paths."""
+        if not self.trace_dir:
+            return []
+        os.makedirs(self.trace_dir, exist_ok=True)
+        base = os.path.join(self.trace_dir, f"run-{self.run_id}")
+        events = sorted(self.events, key=lambda event: event['ts'])
+        with open(base + '.jsonl', 'w', encoding='utf-8') as f:
+            for event in events:
+                f.write(json.dumps(event) + '\n')
+        with open(base + '.trace.json', 'w', encoding='utf-8') as f:
+            json.dump({'traceEvents': self.chrome_events(), 'displayTimeUnit': 'ms'}, f)
+        return [base + '.jsonl', base + '.trace.json'] + self.profiles
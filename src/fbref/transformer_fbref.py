@@ -1,21 +1,25 @@
 import os
-import pandas as pd
+from fbref.raw_tables import write_raw_table
+from fbref.storage import TableStorage
+from fbref.seasons import partition_dir
 
 class FBRefTransformer:
-    def __init__(self, data):
+    def __init__(self, data, storage=None, base_path=None, season=None):
         self.data = data
-        self.base_path = os.path.join(os.path.dirname(__file__), '..', '..', 'data', 'fbref_data')
+        self.base_path = base_path or os.path.join(os.path.dirname(__file__), '..', '..', 'data', 'fbref_data')
+        self.storage = storage or TableStorage()  # CSV unless FBREF_STORAGE_FORMAT says otherwise
+        self.season = season  # Saves under <base_path>/<league>/<season>/ when set
 
     def save_dataframes(self):
         for league, dataframes in self.data.items():
-            league_path = os.path.join(self.base_path, league)
+            league_path = partition_dir(self.base_path, league, self.season)
             os.makedirs(league_path, exist_ok=True)
             
             for table_name, df in dataframes.items():
                 file_name = f"{table_name}.csv"
                 file_path = os.path.join(league_path, file_name)
-                df.to_csv(file_path, index=False)
-                print(f"Saved {file_name} for {league} to {file_path}")
+                write_raw_table(df, file_path, self.storage)  # Positional keys plus the display headers
+                print(f"Saved {file_name} for {league} to {self.storage.path(file_path)}")
 
 # Example usage
 if __name__ == "__main__":
@@ -0,0 +1,174 @@
+import os
+import logging
+import argparse
+from config.fbref_config import PIPELINE_ROOT, PIPELINE_CHECKPOINT, STORAGE_FORMAT, TRACE_DIR
+from fbref import tracing
+from fbref.cleaning_specs import LEAGUES
+from fbref.cleaning_data import DataCleaner
+from fbref.cleaning_players_data import PlayerDataCleaner
+from fbref.cleaning_runner import CleaningRunner
+from fbref.regroup import RegroupData
+from fbref.final_data_transformation import FinalDataTransformation
+from fbref.manifest import StageManifest
+from fbref.seasons import league_urls, parse_seasons, partition_dir, player_stats_urls
+from fbref.storage import FORMATS, MemoryStorage, TableStorage
+from fbref.tracing import PROFILERS, RunTrace
+
+# Stages in the order a full run executes them
+STAGES = ['scrape', 'clean', 'regroup', 'transform', 'load']
+
+class Pipeline:
+    """Runs scrape -> clean -> regroup -> transform -> load, handing DataFrames from stage to stage.
+
+    Every stage reads and writes through one MemoryStorage, keyed by the paths the stages use under
+    root, so no table is serialized and parsed again between stages. A checkpoint TableStorage also
+    persists each table and supplies the inputs of a run that starts at a later stage; with a
+    StageManifest as well, clean, transform and load skip tables whose inputs did not change.
+    Every stage and table job is timed into a RunTrace.
+
+    With seasons, every stage runs once per season over <folder>/<league>/<season>/ partitions; the
+    leagues, teams and players tables are shared and built from every season, newest first.
+    """
+
+    def __init__(self, root=PIPELINE_ROOT, checkpoint=None, backend=None, manifest=None, trace=None, seasons=None):
+        self.storage = MemoryStorage(checkpoint)
+        self.backend = backend  # Database backend of the load stage, FBREF_DB_BACKEND when None
+        self.manifest = manifest
+        self.trace = trace or RunTrace(trace_dir=None)  # Kept in memory unless a trace folder is given
+        self.raw_folder = os.path.join(root, 'data', 'fbref_data')
+        self.players_folder = os.path.join(root, 'data', 'fbref_players_data')
+        self.cleaned_folder = os.path.join(root, 'cleaned_data')
+        self.first_tables_folder = os.path.join(root, 'first_tables')
+        self.final_folder = os.path.join(root, 'final_data')
+        self.seasons = seasons or [None]  # None is the unpartitioned <folder>/<league>/ layout
+        self.timings = {}
+
+    def _manifest(self, season):
+        return self.manifest.partition(season) if self.manifest is not None else None
+
+    def scrape(self, engine=None):
+        """Scrape the squad and player tables of every league into raw tables."""
+        # The HTTP stack is only needed when the run scrapes
+        from fbref.fetch_engine import FetchEngine
+        from fbref.http_cache import ResponseCache
+        from fbref.scraper_fbref import FBRefScraper
+        from fbref.transformer_fbref import FBRefTransformer
+        from fbref.fbref_players_scraper import FBRefPlayerScraper
+
+        engine = engine or FetchEngine(cache=ResponseCache())
+        for season in self.seasons:
+            all_data = FBRefScraper(engine=engine).scrape_all(league_urls(season))
+            FBRefTransformer(all_data, self.storage, base_path=self.raw_folder, season=season).save_dataframes()
+            FBRefPlayerScraper(save_path=self.players_folder, engine=engine, storage=self.storage,
+                               season=season).scrape_leagues(player_stats_urls(season))
+        tracing.count(bytes_downloaded=engine.bytes_downloaded)
+
+    def clean(self):
+        """Clean every raw squad and player table; memory tables keep the jobs in this process."""
+        results = []
+        for season in self.seasons:
+            cleaners = [DataCleaner(self.raw_folder, self.cleaned_folder, self.storage, season),
+                        PlayerDataCleaner(self.players_folder, self.cleaned_folder, self.storage, season)]
+            results += CleaningRunner(cleaners, max_workers=1, manifest=self._manifest(season)).run()
+        return results
+
+    def _league_paths(self, file_name):
+        """(league, cleaned table path) of every league and season, newest season first, skipping missing tables."""
+        paths = []
+        for season in sorted(self.seasons, key=lambda season: season or '', reverse=True):
+            for league in LEAGUES:
+                path = os.path.join(partition_dir(self.cleaned_folder, league, season), file_name.format(league=league))
+                if season is None or self.storage.exists(path):
+                    paths.append((league, path))
+        return paths
+
+    def regroup(self):
+        """Build the leagues, teams and players tables from the cleaned standard stats."""
+        regroup_data = RegroupData(self.first_tables_folder, self.storage)
+        regroup_data.create_league_table()
+        regroup_data.create_team_table(self._league_paths("{league}_Squad_Standard_Stats_cleaned.csv"))
+        regroup_data.create_player_table(self._league_paths("Standard_cleaned.csv"))
+
+    def transform(self):
+        """Transform the first tables, then every season's cleaned tables, into final_data."""
+        results = []
+        for i, season in enumerate(self.seasons):
+            input_dirs = {league: partition_dir(self.cleaned_folder, league, season) for league in LEAGUES}
+            input_dirs['First_Tables'] = self.first_tables_folder
+            transformer = FinalDataTransformation(input_dirs, self.final_folder,
+                                                  os.path.join(self.final_folder, 'First_Tables'), self.storage, season)
+            if i == 0:
+                # Players take the team of the newest season that lists them
+                league_files = [path for _, path in self._league_paths("Standard_cleaned.csv")]
+                transformer.transform_first_tables(manifest=self.manifest, league_files=league_files)
+            results += transformer.transform_and_save(max_workers=1, manifest=self._manifest(season))
+        return results
+
+    def load(self):
+        """Upsert the final tables into the database, the first tables once and then every season's stat tables."""
+        from database.db_insertion import DataInserter  # Database clients are only needed when the run loads
+        from database.load_runner import LoadRunner
+
+        results = []
+        backend = self.backend
+        for i, season in enumerate(self.seasons):
+            inserter = DataInserter(backend, self.storage, season)
+            backend = inserter.backend  # Every season loads through one connection
+            runner = LoadRunner(inserter, manifest=self._manifest(season))
+            results += runner.run(inserter.load_jobs(None if i == 0 else [], final_data_folder=self.final_folder,
+                                                     season=season))
+        return results
+
+    def run(self, stages=STAGES):
+        """Run the given stages in pipeline order, trace them, and return their wall-clock seconds."""
+        unknown = [stage for stage in stages if stage not in STAGES]
+        if unknown:
+            raise ValueError(f"Unknown stages {', '.join(unknown)}, expected some of {', '.join(STAGES)}")
+
+        for stage in STAGES:
+            if stage not in stages:
+                continue
+            with self.trace.stage(stage) as span:
+                # Jobs return their own span events, also from worker processes and threads
+                self.trace.add_results(getattr(self, stage)())
+            self.timings[stage] = span.event['wall_seconds']
+        for path in self.trace.write():
+            logging.info(f"Trace written to {path}")
+        return self.timings
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run the FBref pipeline with tables handed between stages in memory")
+    parser.add_argument('--stages', nargs='+', choices=STAGES, default=STAGES)
+    parser.add_argument('--root', default=PIPELINE_ROOT, help="Folder holding data/, cleaned_data/ and final_data/")
+    parser.add_argument('--checkpoint', action='store_true', default=PIPELINE_CHECKPOINT,
+                        help="Also write every stage's tables to disk, and read missing inputs from it")
+    parser.add_argument('--format', choices=list(FORMATS), default=STORAGE_FORMAT, help="Checkpoint file format")
+    parser.add_argument('--incremental', action='store_true',
+                        help="Skip tables whose inputs are unchanged since the last checkpointed run")
+    parser.add_argument('--force', action='store_true', help="With --incremental, redo every table and refresh the manifest")
+    parser.add_argument('--trace-dir', default=TRACE_DIR, help="Folder of the run trace (JSON lines + Chrome trace events)")
+    parser.add_argument('--profile', nargs='?', const='cprofile', choices=PROFILERS, default=None,
+                        help="Save a cProfile (default) or pyinstrument profile of every stage")
+    parser.add_argument('--memory', action='store_true', help="Record each stage's peak Python allocations with tracemalloc")
+    parser.add_argument('--seasons', nargs='+', default=None,
+                        help="Seasons to run over <folder>/<league>/<season>/ partitions, e.g. 2019-2020:2023-2024 2024-2025")
+    args = parser.parse_args(argv)
+    if args.incremental and not args.checkpoint:
+        parser.error("--incremental needs --checkpoint, skipped tables are read back from disk")
+    if 'scrape' not in args.stages and not args.checkpoint:
+        parser.error("--stages without scrape need --checkpoint, the earlier stages' tables are read from disk")
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    checkpoint = TableStorage(args.format) if args.checkpoint else None
+    manifest = None
+    if args.incremental:
+        manifest = StageManifest(os.path.join(args.root, 'data', 'pipeline_manifest.json'), force=args.force)
+    try:
+        seasons = parse_seasons(args.seasons) if args.seasons else None
+    except ValueError as e:
+        parser.error(str(e))
+    trace = RunTrace(args.trace_dir, memory=args.memory, profile=args.profile)
+    Pipeline(args.root, checkpoint, manifest=manifest, trace=trace, seasons=seasons).run(args.stages)
+
+if __name__ == "__main__":
+    main()